@@ -1,279 +1,300 @@
 #!/usr/bin/env python3
 """
 Navigation Analysis Script
-Extracts and analyzes all href links from module HTML files
+Checks links, module-to-module navigation and breadcrumbs on every page
+under paths/, and reports the findings as text or JSON.
+
+Each page is read and parsed once (site_corpus), which yields its hrefs,
+its nav.module-navigation links and buttons, and its breadcrumb together.
+The checks then run over those records:
+
+    broken-link       internal href that no served path, redirect or rewrite answers
+    no-navigation     module without a module-navigation section
+    no-nav-links      navigation section without any links
+    out-of-sequence   nav link to a module that is neither previous nor next
+    missing-prev      no link back to the previous page in the sequence
+    missing-next      no link or button forward to the next page
+    breadcrumb        breadcrumb trail missing the path or stage page
+    button-text       button text that does not fit the module's position
+
+Hrefs resolve through site_routes.RouteTable, as in check-links.py, so a
+link that production redirects or rewrites counts as its destination.
+Module order and the expected neighbours come from module_sequence.py.
+Findings are plain dicts ({'check', 'severity', 'file', 'message', ...}),
+so the text and JSON renderers are views of the same report. SEVERITY,
+finding() and the text helpers are shared with breadcrumb_check.py.
+
+Usage:
+    python3 analyze_navigation.py
+    python3 analyze_navigation.py --detail            # per-module navigation flow
+    python3 analyze_navigation.py --paths builder curious --format json
 """
 
-import re
-import os
+import argparse
+import json
+import sys
+from collections import Counter, defaultdict
 from pathlib import Path
-from collections import defaultdict
 
-def extract_hrefs(file_path):
-    """Extract all href links from an HTML file"""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    # Find all href attributes
-    href_pattern = r'href=["\']([^"\']+)["\']'
-    hrefs = re.findall(href_pattern, content)
-
-    return hrefs
-
-def extract_navigation_section(file_path):
-    """Extract the navigation section from an HTML file"""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    # Find module navigation section
-    nav_pattern = r'<nav class="module-navigation">(.*?)</nav>'
-    match = re.search(nav_pattern, content, re.DOTALL)
+from module_sequence import PATHS_DIR, ModuleSequence
+from site_corpus import load_corpus
+from site_routes import RouteTable, SitePaths, is_external_url, site_path
+
+SEVERITY = {
+    'broken-link': 'error',
+    'no-navigation': 'error',
+    'no-nav-links': 'warning',
+    'out-of-sequence': 'warning',
+    'missing-prev': 'warning',
+    'missing-next': 'warning',
+    'breadcrumb': 'warning',
+    'button-text': 'info',
+    # breadcrumb_check.py
+    'broken': 'error',
+    'not-ancestor': 'warning',
+    'out-of-order': 'warning',
+    'missing-parent': 'warning',
+    'skipped': 'info',
+}
+
+
+def page_key(path):
+    """Compare site paths the way they are served: '/dir', '/dir/' and '/dir/index.html' are one page"""
+    if path.endswith('/index.html'):
+        return path[:-len('index.html')]
+    if not path.endswith('/') and '.' not in path.rsplit('/', 1)[-1]:
+        return path + '/'
+    return path
+
+
+def is_internal(href):
+    return not (is_external_url(href) or href.startswith(('mailto:', 'tel:', 'javascript:', '#')))
+
+
+def resolved_key(routes, page, href):
+    """page_key() of the page an href on page ends up serving, or None"""
+    target, _ = routes.resolve(page, href)
+    if target is None or is_external_url(target):
+        return None
+    return page_key(target)
 
-    if match:
-        nav_content = match.group(1)
-        # Extract links and buttons
-        link_pattern = r'<a[^>]*href=["\']([^"\']+)["\'][^>]*>(.*?)</a>'
-        button_pattern = r'<button[^>]*>(.*?)</button>'
 
-        links = re.findall(link_pattern, nav_content, re.DOTALL)
-        buttons = re.findall(button_pattern, nav_content, re.DOTALL)
+def link_type(href):
+    if not is_internal(href):
+        return 'external'
+    return 'absolute' if href.startswith('/') else 'relative'
 
-        return {
-            'raw': nav_content.strip(),
-            'links': links,
-            'buttons': buttons
-        }
 
+def button_problem(text, module):
+    """Why a nav button's text does not fit the module's position, or None"""
+    if not module['last_in_stage']:
+        if 'Continue' not in text:
+            return "Middle module should have 'Continue' button"
+    elif module['last_stage']:
+        if 'Finish' not in text and 'Complete' not in text and '🎉' not in text:
+            return "Last module of final stage should have completion message"
+    elif 'Finish' not in text and 'Complete Stage' not in text:
+        return "Last module should indicate stage completion"
     return None
 
-def extract_breadcrumb(file_path):
-    """Extract breadcrumb navigation"""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    breadcrumb_pattern = r'<div class="breadcrumb">(.*?)</div>'
-    match = re.search(breadcrumb_pattern, content, re.DOTALL)
-
-    if match:
-        breadcrumb_content = match.group(1)
-        link_pattern = r'<a[^>]*href=["\']([^"\']+)["\'][^>]*>(.*?)</a>'
-        links = re.findall(link_pattern, breadcrumb_content)
-        return links
 
-    return []
-
-def check_file_exists(base_path, href):
-    """Check if an internal href points to an existing file"""
-    if href.startswith('http://') or href.startswith('https://') or href.startswith('mailto:') or href.startswith('#'):
-        return None  # External link or anchor
-
-    # Clean the href
-    href_clean = href.split('#')[0].split('?')[0]
-
-    if not href_clean:
-        return None
-
-    # Handle absolute paths from root
-    if href_clean.startswith('/'):
-        full_path = Path('/Users/dalia/projects/bitcoin-sovereign-academy') / href_clean.lstrip('/')
-    else:
-        # Relative path
-        full_path = (Path(base_path).parent / href_clean).resolve()
-
-    return full_path.exists()
-
-def main():
-    base_dir = Path('/Users/dalia/projects/bitcoin-sovereign-academy')
-
-    # Find all HTML files
-    html_files = []
-    for pattern in ['paths/builder/**/*.html', 'paths/curious/**/*.html']:
-        html_files.extend(sorted(base_dir.glob(pattern)))
-
-    results = {
-        'navigation_patterns': [],
-        'broken_links': [],
-        'missing_navigation': [],
-        'inconsistencies': [],
-        'all_hrefs': defaultdict(list)
-    }
-
-    print("=" * 80)
-    print("NAVIGATION ANALYSIS REPORT")
-    print("=" * 80)
-    print()
-
-    # Analyze each file
-    for html_file in html_files:
-        rel_path = html_file.relative_to(base_dir)
-
-        # Extract all hrefs
-        all_hrefs = extract_hrefs(html_file)
-        results['all_hrefs'][str(rel_path)] = all_hrefs
-
-        # Extract navigation section
-        nav_section = extract_navigation_section(html_file)
-
-        # Extract breadcrumb
-        breadcrumb = extract_breadcrumb(html_file)
-
-        # Store navigation pattern
-        results['navigation_patterns'].append({
-            'file': str(rel_path),
-            'navigation': nav_section,
-            'breadcrumb': breadcrumb
-        })
-
-        # Check for broken internal links
-        for href in all_hrefs:
-            exists = check_file_exists(html_file, href)
-            if exists is False:  # Only if we determined it's an internal link and doesn't exist
-                results['broken_links'].append({
-                    'file': str(rel_path),
-                    'href': href
-                })
-
-    # Analyze module files specifically (exclude index.html files)
-    module_files = [p for p in results['navigation_patterns'] if 'module-' in p['file']]
-
-    print("\n1. BROKEN INTERNAL LINKS")
-    print("-" * 80)
-    if results['broken_links']:
-        for broken in results['broken_links']:
-            print(f"  File: {broken['file']}")
-            print(f"  Broken link: {broken['href']}")
-            print()
+def finding(check, rel_path, message, **details):
+    return {'check': check, 'severity': SEVERITY[check], 'file': rel_path, 'message': message, **details}
+
+
+def render_findings(findings):
+    """Text lines for findings grouped by check, in SEVERITY order"""
+    by_check = defaultdict(list)
+    for item in findings:
+        by_check[item['check']].append(item)
+    lines = []
+    for check in SEVERITY:
+        items = by_check.get(check)
+        if items:
+            lines += ["", f"  {check} ({SEVERITY[check]}): {len(items)}"]
+            lines += [f"    {item['file']}: {item['message']}" for item in items]
+    return lines
+
+
+def render_summary(findings, totals):
+    """SUMMARY section: one line per (label, value) in totals, then counts by severity"""
+    counts = Counter(item['severity'] for item in findings)
+    return (["", "SUMMARY", "-" * 80]
+            + [f"  {label}: {value}" for label, value in totals]
+            + [f"  Errors: {counts['error']}, warnings: {counts['warning']}, notes: {counts['info']}",
+               "", "=" * 80])
+
+
+def exit_status(findings):
+    return 1 if any(item['severity'] == 'error' for item in findings) else 0
+
+
+def check_module(page, module, record, modules, routes):
+    """
+    Navigation flow of one module: ({'file', 'path', 'stage', 'position',
+    'links', 'buttons', 'breadcrumb'}, [findings])
+    """
+    rel_path = page.lstrip('/')
+    flow = {'file': rel_path, 'path': module['path'], 'stage': module['stage'],
+            'position': f"{module['index'] + 1}/{module['count']}",
+            'links': [], 'buttons': [], 'breadcrumb': [text for _, text in record['breadcrumb']]}
+    findings = []
+
+    trail = {resolved_key(routes, page, href) for href, _ in record['breadcrumb']}
+    missing = [crumb for crumb in module['breadcrumb'] if crumb not in trail]
+    if missing:
+        findings.append(finding('breadcrumb', rel_path, f"Breadcrumb missing {', '.join(missing)}",
+                                expected=missing))
+
+    nav = record['nav']
+    if nav is None:
+        findings.append(finding('no-navigation', rel_path, 'No navigation section'))
+        return flow, findings
+
+    roles = set()
+    for href, text in nav['links']:
+        kind = link_type(href)
+        key = resolved_key(routes, page, href) if kind != 'external' else None
+        role = 'prev' if key == module['prev'] else 'next' if key == module['next'] else None
+        flow['links'].append({'href': href, 'text': text, 'type': kind, 'role': role,
+                              'module': key in modules})
+        if role:
+            roles.add(role)
+        elif key in modules:
+            findings.append(finding('out-of-sequence', rel_path, f"Links out of sequence to {key}",
+                                    href=href, expected=[module['prev'], module['next']]))
+
+    if not nav['links']:
+        findings.append(finding('no-nav-links', rel_path, 'Navigation section has no links'))
+    elif module['prev'] and 'prev' not in roles:
+        findings.append(finding('missing-prev', rel_path, f"Missing link back to {module['prev']}",
+                                expected=[module['prev']]))
+    if module['next'] and 'next' not in roles and not nav['buttons']:
+        findings.append(finding('missing-next', rel_path, f"Missing link forward to {module['next']}",
+                                expected=[module['next']]))
+
+    for text in nav['buttons']:
+        flow['buttons'].append(text)
+        problem = button_problem(text, module)
+        if problem:
+            findings.append(finding('button-text', rel_path, problem, button=text))
+    return flow, findings
+
+
+def audit_navigation(root_dir, paths=None):
+    """
+    Navigation report for the pages of the given learning paths (all by
+    default): {'pages', 'modules', 'flow', 'findings', 'link_types',
+    'button_texts'}
+    """
+    root_dir = Path(root_dir)
+    sequence = ModuleSequence(root_dir)
+    site = SitePaths(root_dir)
+    routes = RouteTable(site)
+    paths = list(sequence.paths) if paths is None else paths
+    unknown = [name for name in paths if name not in sequence.paths]
+    if unknown:
+        raise ValueError(f"Unknown learning path: {', '.join(unknown)}")
+    prefixes = tuple(f'/{PATHS_DIR}/{name}/' for name in paths)
+    pages = sorted(path for path in site.files if path.startswith(prefixes) and path.endswith('.html'))
+    corpus = load_corpus(root_dir, [root_dir / page.lstrip('/') for page in pages])
+
+    report = {'pages': len(corpus), 'modules': 0, 'flow': [], 'findings': [],
+              'link_types': defaultdict(Counter), 'button_texts': Counter()}
+
+    for rel_path, record in corpus.items():
+        page = site_path(rel_path)
+        for href in dict.fromkeys(record['links']):
+            if is_internal(href):
+                target, exists = routes.resolve(page, href)
+                if target is not None and not exists:
+                    report['findings'].append(finding('broken-link', rel_path, f"Broken link: {href}",
+                                                      href=href))
+
+    for name in paths:
+        for page in sequence.path_modules(name):
+            record = corpus.get(page.lstrip('/'))
+            if record is None:
+                continue
+            flow, findings = check_module(page, sequence.modules[page], record, sequence.modules, routes)
+            report['modules'] += 1
+            report['flow'].append(flow)
+            report['findings'].extend(findings)
+            for link in flow['links']:
+                if link['module']:
+                    report['link_types'][name][link['type']] += 1
+            report['button_texts'].update(flow['buttons'])
+
+    report['link_types'] = {name: dict(counts) for name, counts in report['link_types'].items()}
+    report['button_texts'] = dict(report['button_texts'].most_common())
+    return report
+
+
+def render_json(report):
+    return json.dumps(report, indent=2, ensure_ascii=False)
+
+
+def render_text(report, detail=False):
+    lines = ["=" * 80, "NAVIGATION ANALYSIS REPORT", "=" * 80]
+
+    if detail:
+        lines += ["", "MODULE NAVIGATION FLOW", "-" * 80]
+        current = None
+        for flow in report['flow']:
+            if (flow['path'], flow['stage']) != current:
+                current = (flow['path'], flow['stage'])
+                lines += ["", f"  {flow['path'].upper()} STAGE-{flow['stage']}"]
+            lines.append(f"    {Path(flow['file']).name} ({flow['position']})")
+            for link in flow['links']:
+                role = f" ({link['role']})" if link['role'] else ''
+                lines.append(f"      Link [{link['type'].upper()}]: '{link['text']}' -> {link['href']}{role}")
+            for text in flow['buttons']:
+                lines.append(f"      Button: '{text}'")
+            if flow['breadcrumb']:
+                lines.append(f"      Breadcrumb: {' › '.join(flow['breadcrumb'])}")
+
+    lines += ["", "FINDINGS", "-" * 80]
+    if not report['findings']:
+        lines.append("  No navigation issues found!")
+    lines += render_findings(report['findings'])
+
+    lines += ["", "LINK TYPES FOR MODULE-TO-MODULE NAVIGATION", "-" * 80]
+    for name, counts in report['link_types'].items():
+        mixed = ' (mixed)' if len(counts) > 1 else ''
+        lines.append(f"  {name}: {', '.join(f'{kind} {n}' for kind, n in counts.items())}{mixed}")
+
+    lines += ["", "BUTTON TEXT VARIATIONS", "-" * 80]
+    lines += [f"  - '{text}' ({count})" for text, count in report['button_texts'].items()]
+
+    lines += render_summary(report['findings'], [('Pages analyzed', report['pages']),
+                                                 ('Modules checked', report['modules'])])
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Check navigation links, module flow and breadcrumbs')
+    parser.add_argument('--paths', nargs='+', help='Learning paths to check (default: all under paths/)')
+    parser.add_argument('--format', choices=('text', 'json'), default='text', help='Report format')
+    parser.add_argument('--detail', action='store_true', help='List every module\'s navigation (text format)')
+    parser.add_argument('--output', help='Write the report to this file instead of stdout')
+    args = parser.parse_args(argv)
+
+    root_dir = Path(__file__).parent
+    try:
+        report = audit_navigation(root_dir, args.paths)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+    output = render_json(report) if args.format == 'json' else render_text(report, args.detail)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output + '\n')
+        print(f"✅ Navigation report written to {args.output} ({len(report['findings'])} findings)")
     else:
-        print("  No broken internal links found!")
-
-    print("\n2. NAVIGATION PATTERNS")
-    print("-" * 80)
-
-    # Analyze navigation patterns for modules
-    for pattern in module_files[:5]:  # Show first 5 as sample
-        print(f"\n  File: {pattern['file']}")
-        if pattern['navigation']:
-            nav = pattern['navigation']
-            print(f"  Navigation links:")
-            for link_href, link_text in nav['links']:
-                clean_text = re.sub(r'<[^>]+>', '', link_text).strip()
-                clean_text = ' '.join(clean_text.split())
-                print(f"    - {clean_text}: {link_href}")
-            for button_text in nav['buttons']:
-                clean_text = re.sub(r'<[^>]+>', '', button_text).strip()
-                clean_text = ' '.join(clean_text.split())
-                print(f"    - [BUTTON] {clean_text}")
-        else:
-            print("  No module-navigation section found!")
-
-        if pattern['breadcrumb']:
-            print(f"  Breadcrumb:")
-            for bc_href, bc_text in pattern['breadcrumb']:
-                print(f"    - {bc_text}: {bc_href}")
-
-    print("\n\n3. MISSING NAVIGATION ANALYSIS")
-    print("-" * 80)
-
-    # Check for missing next/previous in modules
-    missing_count = 0
-    for pattern in module_files:
-        file_path = pattern['file']
-        nav = pattern['navigation']
-
-        # Determine expected previous/next
-        parts = file_path.split('/')
-        if 'module-1.html' in file_path:
-            # Module 1 should have link back to stage and next to module-2
-            expected = "Link to stage index and next module"
-        elif 'module-2.html' in file_path:
-            # Module 2 should have previous to module-1 and next to module-3
-            expected = "Previous to module-1 and next to module-3"
-        elif 'module-3.html' in file_path:
-            # Module 3 should have previous to module-2
-            expected = "Previous to module-2"
-        else:
-            expected = None
-
-        if nav is None:
-            print(f"\n  {file_path}")
-            print(f"    MISSING: No navigation section found!")
-            missing_count += 1
-        elif expected and len(nav['links']) == 0:
-            print(f"\n  {file_path}")
-            print(f"    WARNING: Navigation section exists but has no links")
-            print(f"    Expected: {expected}")
-            missing_count += 1
-
-    if missing_count == 0:
-        print("  All modules have navigation sections with links!")
-
-    print("\n\n4. INCONSISTENCY ANALYSIS")
-    print("-" * 80)
-
-    # Check for inconsistent patterns
-    inconsistencies = []
-
-    # Group by stage
-    stages = defaultdict(list)
-    for pattern in module_files:
-        file_path = pattern['file']
-        # Extract stage info
-        if 'builder/stage-1' in file_path:
-            key = 'builder-stage-1'
-        elif 'builder/stage-2' in file_path:
-            key = 'builder-stage-2'
-        elif 'builder/stage-3' in file_path:
-            key = 'builder-stage-3'
-        elif 'builder/stage-4' in file_path:
-            key = 'builder-stage-4'
-        elif 'curious/stage-1' in file_path:
-            key = 'curious-stage-1'
-        elif 'curious/stage-2' in file_path:
-            key = 'curious-stage-2'
-        elif 'curious/stage-3' in file_path:
-            key = 'curious-stage-3'
-        elif 'curious/stage-4' in file_path:
-            key = 'curious-stage-4'
-        else:
-            key = 'other'
-        stages[key].append(pattern)
-
-    # Check link types (relative vs absolute)
-    print("\n  Link Type Analysis (Relative vs Absolute):")
-    for stage_key, patterns in sorted(stages.items()):
-        print(f"\n    {stage_key}:")
-        for pattern in patterns:
-            file_path = pattern['file']
-            nav = pattern['navigation']
-            if nav and nav['links']:
-                for link_href, link_text in nav['links']:
-                    link_type = "absolute" if link_href.startswith('/') else "relative"
-                    clean_text = re.sub(r'<[^>]+>', '', link_text).strip()
-                    clean_text = ' '.join(clean_text.split())[:40]
-                    print(f"      {Path(file_path).name}: {link_type} - {link_href}")
-
-    # Check button text variations
-    print("\n\n  Button Text Variations:")
-    button_texts = set()
-    for pattern in module_files:
-        nav = pattern['navigation']
-        if nav and nav['buttons']:
-            for button_text in nav['buttons']:
-                clean_text = re.sub(r'<[^>]+>', '', button_text).strip()
-                clean_text = ' '.join(clean_text.split())
-                button_texts.add(clean_text)
-
-    for text in sorted(button_texts):
-        print(f"    - '{text}'")
-
-    print("\n\n5. SUMMARY")
-    print("-" * 80)
-    print(f"  Total HTML files analyzed: {len(html_files)}")
-    print(f"  Total module files: {len(module_files)}")
-    print(f"  Broken internal links: {len(results['broken_links'])}")
-    print(f"  Files with missing navigation: {missing_count}")
-
-    print("\n" + "=" * 80)
+        print(output)
+    return exit_status(report['findings'])
+
 
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
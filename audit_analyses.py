@@ -0,0 +1,438 @@
+#!/usr/bin/env python3
+"""
+Content Audit Analyses for Bitcoin Sovereign Academy
+The checks behind analyze-content-audit.py, as a registry of named
+analyses that can be run on their own.
+
+Each analysis declares the record fields it reads (besides 'path' and
+'file') and any other files its result depends on. Records are streamed
+from the audit file one line at a time; each line is parsed whole and
+then cut down to those fields, so an analysis only sees, and its cache
+digest only covers, what it declared. A result is cached in .cache/
+under a digest of exactly that input: the projected records, the
+declared files, and the source of this module and of the helpers every
+analysis shares (audit_records.py, module_sequence.py). Rerunning an
+analysis whose input has not changed only renders the cached result.
+
+    from audit_analyses import ANALYSES, run_analyses
+    for analysis, result in run_analyses(records_file, ['readability']):
+        analysis.render(result)
+"""
+
+import hashlib
+import json
+from itertools import islice
+from pathlib import Path
+
+from audit_records import module_info, module_name, read_records
+from concept_order import CONCEPT_DOC, ConceptGraph, introduction_text
+from glossary_index import GLOSSARY_DATA, JargonIndex, load_glossary, module_text as glossary_module_text
+from near_duplicates import MIN_PARAGRAPH_WORDS, NearDuplicateIndex
+from site_corpus import CACHE_DIR
+from term_matcher import TermMatcher
+
+# The readability analysis needs NumPy; without it, it reports that instead
+try:
+    from readability import readability_report
+except ImportError:
+    readability_report = None
+
+ROOT = Path(__file__).parent
+RESULT_CACHE = 'analysis-{name}.json'
+
+# Fields every analysis gets
+BASE_FIELDS = ('path', 'file')
+
+# Helpers every analysis depends on besides this module: record reading,
+# module_info()/module_name(), and the course order and natural_key() that
+# decide how modules are grouped and ordered
+SHARED_INPUTS = ('audit_records.py', 'module_sequence.py')
+
+ANALYSES = {}   # name -> Analysis, in report order
+
+
+class Analysis:
+    """A registered analysis: compute(corpus) -> JSON-able result, render(result) prints it"""
+
+    def __init__(self, name, title, fields, compute, render, inputs=()):
+        self.name = name
+        self.title = title
+        self.fields = BASE_FIELDS + tuple(field for field in fields if field not in BASE_FIELDS)
+        self.compute = compute
+        self.render_body = render
+        self.inputs = (Path(__file__).name,) + SHARED_INPUTS + tuple(inputs)
+
+    def cache_path(self):
+        return ROOT / CACHE_DIR / RESULT_CACHE.format(name=self.name)
+
+    def render(self, result):
+        print("\n" + "=" * 80)
+        print(self.title)
+        print("=" * 80)
+        self.render_body(result)
+
+
+def register(name, title, fields, render, inputs=()):
+    """Decorator adding a compute function to ANALYSES"""
+    def decorator(compute):
+        ANALYSES[name] = Analysis(name, title, fields, compute, render, inputs)
+        return compute
+    return decorator
+
+
+class Corpus:
+    """Audit records streamed from disk, each parsed in full and then cut down to the requested fields"""
+
+    def __init__(self, records_file, fields):
+        self.records_file = records_file
+        self.fields = fields
+        self._path_names = None
+
+    def modules(self, path_name=None):
+        """Lazily yield modules, optionally for one learning path"""
+        for record in read_records(self.records_file):
+            if path_name is None or record['path'] == path_name:
+                yield {field: record[field] for field in self.fields if field in record}
+
+    @property
+    def path_names(self):
+        if self._path_names is None:
+            self._path_names = list(dict.fromkeys(module['path'] for module in self.modules()))
+        return self._path_names
+
+
+def input_digests(records_file, analyses):
+    """{name: sha256 hex} of each analysis's projected records and input files, in one read"""
+    hashes = {analysis.name: hashlib.sha256() for analysis in analyses}
+    for record in read_records(records_file):
+        for analysis in analyses:
+            projected = {field: record.get(field) for field in analysis.fields}
+            hashes[analysis.name].update(json.dumps(projected, sort_keys=True).encode('utf-8') + b'\n')
+    for analysis in analyses:
+        for name in analysis.inputs:
+            hashes[analysis.name].update(name.encode('utf-8') + b'\0')
+            try:
+                hashes[analysis.name].update((ROOT / name).read_bytes())
+            except OSError:
+                pass
+    return {name: h.hexdigest() for name, h in hashes.items()}
+
+
+def run_analyses(records_file, names=None, use_cache=True):
+    """
+    Yield (analysis, result) for the named analyses (all by default), in
+    registry order, from the cache where the input digest still matches
+    """
+    analyses = [analysis for name, analysis in ANALYSES.items() if names is None or name in names]
+    digests = input_digests(records_file, analyses) if use_cache else {}
+    for analysis in analyses:
+        cache_path = analysis.cache_path()
+        if use_cache:
+            try:
+                with open(cache_path, 'r', encoding='utf-8') as f:
+                    cached = json.load(f)
+                if cached.get('digest') == digests[analysis.name]:
+                    yield analysis, cached['result']
+                    continue
+            except (OSError, ValueError):
+                pass
+
+        # Round-trip through JSON so fresh and cached results render alike
+        result = json.loads(json.dumps(analysis.compute(Corpus(records_file, analysis.fields))))
+        if use_cache:
+            cache_path.parent.mkdir(exist_ok=True)
+            tmp_path = cache_path.with_name(cache_path.name + '.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'digest': digests[analysis.name], 'result': result}, f, ensure_ascii=False)
+            tmp_path.replace(cache_path)
+        yield analysis, result
+
+
+# ===============================================
+# 1. TERM FREQUENCY ANALYSIS (Redundancy Check)
+# ===============================================
+# Terms counted per path
+key_terms = {
+    '21 million': r'21\s*million|21M',
+    'halving': r'halving|halvening',
+    'private key': r'private\s*key',
+    'public key': r'public\s*key',
+    'seed phrase': r'seed\s*phrase|recovery\s*phrase|backup\s*phrase',
+    'UTXO': r'UTXO|unspent\s*transaction\s*output',
+    'blockchain': r'blockchain|block\s*chain',
+    'Lightning Network': r'Lightning\s*Network|Layer\s*2',
+    'inflation': r'\binflation\b',
+    'decentralization': r'decentrali[sz]ation',
+    'Bitcoin': r'\bBitcoin\b',  # Uppercase
+    'bitcoin': r'\bbitcoin\b',  # Lowercase
+    'wallet': r'\bwallet\b',
+}
+
+# Every term is found in one scan per module
+term_matcher = TermMatcher(key_terms)
+
+
+def render_terms(result):
+    print("\nKey Term Frequencies by Path:")
+    print("-" * 80)
+    for term in key_terms.keys():
+        print(f"\n{term}:")
+        for path in ['curious', 'builder', 'sovereign', 'principled', 'pragmatist']:
+            if path in result:
+                count = result[path][term]
+                print(f"  {path:15s}: {count:4d} mentions")
+
+
+@register('terms', "1. TERM FREQUENCY ANALYSIS - Identifying Redundancies",
+          fields=('paragraphs', 'h2', 'h3'), render=render_terms, inputs=('term_matcher.py',))
+def term_frequencies(corpus):
+    term_counts = {path: {term: 0 for term in key_terms} for path in corpus.path_names}
+    for module in corpus.modules():
+        pieces = module.get('paragraphs', []) + module.get('h2', []) + module.get('h3', [])
+        for term, count in term_matcher.counts(' '.join(pieces)).items():
+            term_counts[module['path']][term] += count
+    return term_counts
+
+
+# ===============================================
+# 2. "WHAT IS BITCOIN?" REDUNDANCY
+# ===============================================
+def render_intros(result):
+    print(f"\nFound {len(result)} modules introducing Bitcoin:")
+    for mod in result:
+        print(f"\n- {mod['path']} / {mod['file']}")
+        print(f"  Title: {mod['title']}")
+        print(f"  Key sections: {', '.join(mod['headings'][:3])}")
+
+
+@register('intros', "2. 'WHAT IS BITCOIN?' - Cross-Path Redundancy Check",
+          fields=('title', 'h1', 'h2'), render=render_intros)
+def bitcoin_intros(corpus):
+    bitcoin_intro_modules = []
+    for module in corpus.modules():
+        title = module.get('title', '').lower()
+        h1 = ' '.join(module.get('h1', [])).lower()
+        h2 = ' '.join(module.get('h2', [])).lower()
+
+        if any(phrase in (title + h1 + h2) for phrase in ['what is bitcoin', 'enter bitcoin', 'bitcoin basics']):
+            bitcoin_intro_modules.append({
+                'path': module['path'],
+                'file': Path(module['file']).name,
+                'title': module.get('title', 'N/A'),
+                'headings': module.get('h2', [])[:5]
+            })
+    return bitcoin_intro_modules
+
+
+# ===============================================
+# 3. PREREQUISITE FLOW ANALYSIS
+# ===============================================
+def render_prerequisites(result):
+    for entry in result:
+        print(f"\n{entry['path'].upper()} Path - Concept Introduction Order:")
+        print("-" * 60)
+        for idx, file_name, introduced_here in entry['introduced']:
+            print(f"  Module {idx + 1} ({file_name}): {', '.join(introduced_here)}")
+        for problem in entry['problems']:
+            where = (f"not until {problem['prerequisite_at']}"
+                     if problem['prerequisite_at'] is not None else 'never introduced')
+            print(f"  ⚠️  {problem['concept']} ({problem['at']}) before "
+                  f"{problem['prerequisite']}: {where}")
+
+
+@register('prerequisites', "3. PREREQUISITE FLOW ANALYSIS - Key Concept Introduction Order",
+          fields=('h1', 'h2', 'h3', 'paragraphs'), render=render_prerequisites,
+          inputs=(CONCEPT_DOC, 'concept_order.py', 'term_matcher.py'))
+def prerequisite_flow(corpus):
+    """
+    Canonical prerequisites (CANONICAL_CONCEPT_ORDER.md) checked against
+    the module where each concept is first introduced in each path
+    """
+    concept_graph = ConceptGraph.from_file(ROOT)
+    report = []
+    for path_name in corpus.path_names:
+        names, texts = [], []
+        for module in corpus.modules(path_name):
+            if module_info(module['file'])[3] == 'en':
+                names.append(module_name(module['file']))
+                headings = module.get('h1', []) + module.get('h2', []) + module.get('h3', [])
+                texts.append(introduction_text(headings, module.get('paragraphs', [])))
+        first = concept_graph.introductions(texts)
+
+        introduced = []
+        for idx, file_name in enumerate(names):
+            introduced_here = [concept for concept in concept_graph.order if first.get(concept) == idx]
+            if introduced_here:
+                introduced.append([idx, file_name, introduced_here])
+        problems = [{**problem, 'at': names[problem['at']],
+                     'prerequisite_at': (names[problem['prerequisite_at']]
+                                         if problem['prerequisite_at'] is not None else None)}
+                    for problem in concept_graph.violations(first)]
+        report.append({'path': path_name, 'introduced': introduced, 'problems': problems})
+    return report
+
+
+# ===============================================
+# 4. JARGON WITHOUT DEFINITION
+# ===============================================
+def render_jargon(result):
+    print("\nGlossary terms first used before the path defines them...")
+    print("-" * 80)
+    for entry in result:
+        print(f"\n{entry['path'].upper()} Path: {entry['used']} glossary terms used, "
+              f"{len(entry['flagged'])} before a definition")
+        for term, first_use, first_definition in entry['flagged'][:10]:
+            defined = f"defined in {first_definition}" if first_definition else 'never defined'
+            print(f"  {term}: first used in {first_use}, {defined}")
+
+
+@register('jargon', "4. POTENTIAL JARGON ISSUES - Terms Used Without Definition",
+          fields=('paragraphs', 'lists'), render=render_jargon,
+          inputs=(GLOSSARY_DATA, 'glossary_index.py', 'term_matcher.py'))
+def jargon_usage(corpus):
+    """First use vs. first definition of every glossary.html term, per path"""
+    jargon = JargonIndex(entry['term'] for entry in load_glossary(ROOT))
+    for module in corpus.modules():
+        if module_info(module['file'])[3] == 'en':
+            jargon.add(module['path'], module_name(module['file']), glossary_module_text(module))
+
+    return [{'path': path_name,
+             'used': len(jargon.usage(path_name)),
+             'flagged': [[term, info['first_use'], info['first_definition']]
+                         for term, info in jargon.used_before_definition(path_name).items()]}
+            for path_name in corpus.path_names]
+
+
+# ===============================================
+# 5. SENTENCE LENGTH ANALYSIS (Readability)
+# ===============================================
+def render_readability(result):
+    if result is None:
+        print("\n(Install numpy for the readability analysis)")
+        return
+    print("\nAverage sentence length by path (ideal: 15-20 words):")
+    print("-" * 80)
+    for path_name, metrics in result['paths']:
+        print(f"{path_name:15s}: {metrics['avg_sentence']:.1f} words/sentence | "
+              f"{metrics['long_pct']:.1f}% are 35+ words ({metrics['long_count']}/{metrics['sentences']})")
+
+    print("\nFlesch-Kincaid grade and reading ease by stage:")
+    print("-" * 80)
+    for path_name, stage, metrics in result['stages']:
+        label = f"stage {stage}" if stage is not None else 'other'
+        print(f"{path_name:12s} {label:8s}: grade {metrics['fk_grade']:4.1f} | "
+              f"ease {metrics['flesch']:5.1f} | {metrics['syllables_per_word']:.2f} syllables/word")
+
+
+# The readability engine is part of the input only where it can run
+@register('readability', "5. READABILITY - Sentence Length Analysis",
+          fields=('paragraphs',), render=render_readability,
+          inputs=('readability.py',) if readability_report else ())
+def readability_metrics(corpus):
+    """Sentence lengths per path and grade levels per stage, English modules only"""
+    if readability_report is None:
+        return None
+    report = readability_report(corpus.modules())
+    return {'paths': [[path_name, metrics] for path_name, metrics in report['paths'].items()],
+            'stages': [[path_name, stage, metrics]
+                       for (path_name, stage), metrics in report['stages'].items()]}
+
+
+# ===============================================
+# 6. HEADING STRUCTURE ANALYSIS
+# ===============================================
+def render_structure(result):
+    for path_name, structures in result:
+        print(f"\n{path_name.upper()} Path - Module Structures:")
+        print("-" * 60)
+
+        for file_name, h1_count, h2_count, h3_count in structures:
+            print(f"{file_name:30s}: H1={h1_count}, H2={h2_count}, H3={h3_count}")
+
+            # Check for issues
+            if h1_count > 1:
+                print("  ⚠️  WARNING: Multiple H1 tags (should be 1)")
+            if h2_count > 8:
+                print(f"  ⚠️  WARNING: Many H2 sections ({h2_count}) - might be too dense")
+
+
+@register('structure', "6. MODULE STRUCTURE - Heading Hierarchy Check",
+          fields=('h1', 'h2', 'h3'), render=render_structure)
+def heading_structure(corpus):
+    result = []
+    for path_name in ['curious', 'builder']:
+        if path_name not in corpus.path_names:
+            continue
+        result.append([path_name, [
+            [Path(module['file']).name, len(module.get('h1', [])),
+             len(module.get('h2', [])), len(module.get('h3', []))]
+            for module in islice(corpus.modules(path_name), 5)  # First 5 modules
+        ]])
+    return result
+
+
+# ===============================================
+# 7. CROSS-PATH CONTENT COMPARISON
+# ===============================================
+def get_module_text_sample(module, words=100):
+    """Get first N words of module content"""
+    paragraphs = module.get('paragraphs', [])
+    all_text = ' '.join(paragraphs)
+    words_list = all_text.split()[:words]
+    return ' '.join(words_list)
+
+
+def render_redundancy(result):
+    # Compare "What is Money" modules across paths
+    print("\nComparing 'What is Money?' / Stage 1 Module 1 across paths:")
+    print("-" * 80)
+    for path, info in result['first_modules'].items():
+        print(f"\n{path}:")
+        print(f"  File: {info['file']}")
+        print(f"  Title: {info['title']}")
+        print(f"  Sections: {info['h2_count']}")
+        print(f"  Sample: {info['text_sample'][:150]}...")
+
+    # Near-duplicate paragraphs anywhere in the audited paths (MinHash + LSH)
+    print("\nNear-duplicate paragraphs shared across paths:")
+    print("-" * 80)
+    print(f"{result['cross_path_count']} clusters span more than one path")
+    for cluster in result['clusters']:
+        print(f"\n  {cluster['size']} paragraphs in {', '.join(cluster['paths'])} "
+              f"(similarity {cluster['min']:.2f}-{cluster['max']:.2f})")
+        sample = cluster['sample']
+        print(f"  \"{sample[:120]}{'...' if len(sample) > 120 else ''}\"")
+
+
+@register('redundancy', "7. CROSS-PATH REDUNDANCY - Similar Content Detection",
+          fields=('title', 'h2', 'paragraphs'), render=render_redundancy, inputs=('near_duplicates.py',))
+def cross_path_redundancy(corpus):
+    stage1_mod1 = {}
+    for path_name in ['curious', 'builder', 'principled']:
+        # Get first module
+        first_mod = next(corpus.modules(path_name), None)
+        if first_mod:
+            stage1_mod1[path_name] = {
+                'file': Path(first_mod['file']).name,
+                'title': first_mod.get('title', ''),
+                'h2_count': len(first_mod.get('h2', [])),
+                'text_sample': get_module_text_sample(first_mod, 50)
+            }
+
+    duplicates = NearDuplicateIndex()
+    for module in corpus.modules():
+        for n, paragraph in enumerate(module.get('paragraphs', [])):
+            if len(paragraph.split()) >= MIN_PARAGRAPH_WORDS:
+                duplicates.add((module['path'], Path(module['file']).name, n), paragraph)
+
+    cross_path = [cluster for cluster in duplicates.clusters()
+                  if len({label[0] for label, _ in cluster['items']}) > 1]
+    return {
+        'first_modules': stage1_mod1,
+        'cross_path_count': len(cross_path),
+        'clusters': [{'size': len(cluster['items']),
+                      'paths': sorted({label[0] for label, _ in cluster['items']}),
+                      'min': cluster['min'], 'max': cluster['max'],
+                      'sample': cluster['items'][0][1]}
+                     for cluster in cross_path[:10]],
+    }
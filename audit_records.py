@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Content Audit Record Stream
+Line-delimited JSON (one module per line, optionally gzip-compressed) shared
+by content-audit-extractor.py, which appends records as it goes, and
+analyze-content-audit.py, which reads them lazily.
+
+The extractor writes to '<file>.partial' and only renames it into place
+once every path has been scanned, so a crashed run leaves the partial file
+behind and the next run resumes after the last complete record.
+"""
+
+import gzip
+import json
+import os
+import re
+from pathlib import Path
+
+from module_sequence import ModuleSequence
+from site_corpus import load_corpus
+
+AUDIT_FILE = 'content-audit-data.jsonl'
+AUDIT_FILE_GZ = AUDIT_FILE + '.gz'
+
+# Learning paths covered by the audit, in report order (under paths/)
+LEARNING_PATHS = ('curious', 'builder', 'sovereign', 'principled', 'pragmatist', 'hurried')
+
+STAGE_PATTERN = re.compile(r'stage-(\d+)$')
+
+# Paragraphs and list items this short (buttons, labels) are left out of records
+MIN_PARAGRAPH_CHARS = 20
+MIN_LIST_ITEM_CHARS = 10
+
+
+def module_info(rel_path):
+    """
+    (path, stage, module, lang) for 'paths/<path>/stage-N/[es/]name.html'.
+    Absolute file paths work too; everything before 'paths/' is ignored.
+    """
+    parts = Path(rel_path).parts
+    if 'paths' in parts:
+        parts = parts[parts.index('paths'):]
+    stage = None
+    for part in parts:
+        match = STAGE_PATTERN.match(part)
+        if match:
+            stage = int(match.group(1))
+    lang = 'es' if 'es' in parts[2:-1] else 'en'
+    return parts[1], stage, Path(parts[-1]).stem, lang
+
+
+def module_name(rel_path):
+    """A module's file within its learning path ('stage-1/module-2.html')"""
+    parts = Path(rel_path).parts
+    if 'paths' in parts:
+        parts = parts[parts.index('paths') + 2:]
+    return '/'.join(parts)
+
+
+def find_module_files(path_dir, sequence=None):
+    """
+    Module and deep-dive pages of one learning path (paths/<name>) in
+    course order: English in ModuleSequence order, then each translation
+    in a sequence of its own. Index pages are skipped.
+    """
+    path_dir = Path(path_dir)
+    sequence = sequence or ModuleSequence(path_dir.parent.parent)
+    files = [html_file for html_file in path_dir.rglob('*.html')
+             if 'module' in html_file.name or 'deep-dive' in html_file.name]
+    return sorted(files, key=sequence.course_key)
+
+
+def course_modules(root_dir, path, lang=None, sequence=None):
+    """
+    (rel_path, record) for one learning path's modules in course order,
+    only those in lang ('en', 'es') if given. load_corpus() keys its
+    records by file name, so they are walked in find_module_files() order.
+    """
+    root_dir = Path(root_dir)
+    files = find_module_files(root_dir / 'paths' / path, sequence)
+    if lang:
+        files = [html_file for html_file in files if module_info(html_file)[3] == lang]
+    corpus = load_corpus(root_dir, files)
+    for html_file in files:
+        rel_path = html_file.relative_to(root_dir).as_posix()
+        if rel_path in corpus:
+            yield rel_path, corpus[rel_path]
+
+
+def is_compressed(file_path):
+    return str(file_path).endswith('.gz')
+
+
+def open_records(file_path, mode, compressed=None):
+    """Open a record file as text, through gzip when it ends in .gz"""
+    if compressed is None:
+        compressed = is_compressed(file_path)
+    if compressed:
+        return gzip.open(file_path, mode + 't', encoding='utf-8')
+    return open(file_path, mode, encoding='utf-8')
+
+
+def read_records(file_path, compressed=None):
+    """
+    Yield records one at a time. A torn final line or truncated gzip member
+    (an interrupted write) ends the stream instead of raising.
+    """
+    with open_records(file_path, 'r', compressed) as f:
+        try:
+            for line in f:
+                if not line.endswith('\n'):
+                    return
+                yield json.loads(line)
+        except (EOFError, gzip.BadGzipFile):
+            return
+
+
+def find_records(root_dir):
+    """The most recently written audit file under root_dir, or None"""
+    candidates = [Path(root_dir) / name for name in (AUDIT_FILE, AUDIT_FILE_GZ)]
+    existing = [path for path in candidates if path.exists()]
+    return max(existing, key=lambda path: path.stat().st_mtime) if existing else None
+
+
+class RecordWriter:
+    """
+    Appends records to '<file_path>.partial', flushing after each one.
+
+    If a partial file from an interrupted run exists, its complete records
+    are kept and their 'file' values are available in .done so the caller
+    can skip them. finish() moves the partial file into place.
+    """
+
+    def __init__(self, file_path):
+        self.path = Path(file_path)
+        self.partial = self.path.with_name(self.path.name + '.partial')
+        self.compressed = is_compressed(self.path)
+        self.done = set()
+        self.resumed = 0
+        if self.partial.exists():
+            self._recover()
+        self.file = open_records(self.partial, 'a', self.compressed)
+
+    def _recover(self):
+        """Rewrite the partial file with only its complete records"""
+        tmp_path = self.partial.with_name(self.partial.name + '.tmp')
+        with open_records(tmp_path, 'w', self.compressed) as out:
+            for record in read_records(self.partial, self.compressed):
+                out.write(json.dumps(record, ensure_ascii=False) + '\n')
+                self.done.add(record['file'])
+        os.replace(tmp_path, self.partial)
+        self.resumed = len(self.done)
+
+    def write(self, record):
+        self.file.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self.file.flush()
+
+    def finish(self):
+        self.file.close()
+        os.replace(self.partial, self.path)
+
+    def close(self):
+        """Close without publishing, leaving the partial file to resume from"""
+        if not self.file.closed:
+            self.file.close()
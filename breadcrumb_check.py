@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Breadcrumb Hierarchy Checker for Bitcoin Sovereign Academy
+Compares every page's breadcrumb trail with where the page actually sits
+in the URL hierarchy (paths/<path>/stage-N/module-M.html,
+deep-dives/<topic>/..., institutional/...).
+
+The site's directories go into a trie, built from the same single walk
+as the link checks (site_routes.SitePaths). Each node knows whether its
+directory serves an index page. One descent from the root to a page
+gives its ancestor pages in order. The breadcrumb's links are resolved
+through site_routes.RouteTable (redirects and rewrites included, as in
+check-links.py) to served files and matched against those ancestors by
+depth:
+
+    broken         crumb link that no served path, redirect or rewrite answers
+    not-ancestor   crumb pointing outside the page's own hierarchy
+    out-of-order   crumb at or above one it follows in the trail
+    missing-parent trail without the page's nearest ancestor index
+    skipped        ancestor index pages the trail passes over (info)
+
+Pages without a breadcrumb are counted but not checked. Severities and the
+report layout are shared with analyze_navigation.py.
+
+Usage:
+    python3 breadcrumb_check.py
+    python3 breadcrumb_check.py --prefix paths/ --format json
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from analyze_navigation import exit_status, finding, render_findings, render_summary
+from site_corpus import load_corpus
+from site_routes import RouteTable, SitePaths, is_external_url, site_path
+
+INDEX_PAGE = 'index.html'
+
+
+class PathTrie:
+    """
+    Directory hierarchy of the served site. Each node is
+    {'children': {segment: node}, 'page': index file or None}.
+    """
+
+    def __init__(self, files=()):
+        self.root = {'children': {}, 'page': None}
+        for path in files:
+            self.add(path)
+
+    def add(self, path):
+        """Register a served file ('/a/b/index.html' marks '/a/b/' as having a page)"""
+        *dirs, name = path.strip('/').split('/')
+        node = self.root
+        for segment in dirs:
+            node = node['children'].setdefault(segment, {'children': {}, 'page': None})
+        if name == INDEX_PAGE:
+            node['page'] = path
+
+    def ancestors(self, path):
+        """
+        Index pages above a served file, root first. A directory's own
+        index page is not its own ancestor.
+        """
+        *dirs, name = path.strip('/').split('/')
+        if name == INDEX_PAGE and dirs:
+            dirs.pop()
+        found = []
+        node = self.root
+        if node['page'] and node['page'] != path:
+            found.append(node['page'])
+        for segment in dirs:
+            node = node['children'].get(segment)
+            if node is None:
+                break
+            if node['page'] and node['page'] != path:
+                found.append(node['page'])
+        return found
+
+
+def check_breadcrumb(page, crumbs, trie, routes):
+    """Findings for one page's breadcrumb ([[href, text]]) against its ancestors"""
+    rel_path = page.lstrip('/')
+    ancestors = trie.ancestors(page)
+    depth = {ancestor: i for i, ancestor in enumerate(ancestors)}
+    findings = []
+
+    matched = set()
+    last = -1
+    for href, text in crumbs:
+        if is_external_url(href):
+            findings.append(finding('not-ancestor', rel_path, f"'{text}' leaves the site: {href}", href=href))
+            continue
+        target, exists = routes.resolve(page, href)
+        if target is None:
+            continue
+        if is_external_url(target):
+            findings.append(finding('not-ancestor', rel_path,
+                                    f"'{text}' -> {href} redirects off-site to {target}", href=href))
+            continue
+        served = routes.site.served_file(target) if exists else None
+        if served is None:
+            findings.append(finding('broken', rel_path, f"'{text}' -> {href} is not served", href=href))
+        elif served == page:
+            continue   # the current page closing the trail
+        elif served not in depth:
+            findings.append(finding('not-ancestor', rel_path, f"'{text}' -> {served} is not above this page",
+                                    href=href))
+        elif depth[served] <= last:
+            where = 'repeats an earlier crumb' if depth[served] == last else 'comes after a deeper crumb'
+            findings.append(finding('out-of-order', rel_path, f"'{text}' -> {served} {where}", href=href))
+        else:
+            last = depth[served]
+            matched.add(served)
+
+    if ancestors and ancestors[-1] not in matched:
+        findings.append(finding('missing-parent', rel_path, f"Trail does not reach {ancestors[-1]}",
+                                expected=ancestors[-1]))
+    skipped = [ancestor for ancestor in ancestors[:-1] if ancestor not in matched]
+    if skipped:
+        findings.append(finding('skipped', rel_path, f"Trail skips {', '.join(skipped)}", expected=skipped))
+    return findings
+
+
+def audit_breadcrumbs(root_dir, prefix=''):
+    """{'pages', 'checked', 'findings'} for the HTML pages under prefix"""
+    root_dir = Path(root_dir)
+    site = SitePaths(root_dir)
+    routes = RouteTable(site)
+    trie = PathTrie(site.files)
+    start = '/' + prefix.lstrip('/')
+    pages = sorted(path for path in site.files if path.startswith(start) and path.endswith('.html'))
+    corpus = load_corpus(root_dir, [root_dir / page.lstrip('/') for page in pages])
+
+    report = {'pages': len(corpus), 'checked': 0, 'findings': []}
+    for rel_path, record in corpus.items():
+        if record['breadcrumb']:
+            report['checked'] += 1
+            report['findings'] += check_breadcrumb(site_path(rel_path), record['breadcrumb'], trie, routes)
+    return report
+
+
+def render_text(report):
+    lines = ["=" * 80, "BREADCRUMB HIERARCHY REPORT", "=" * 80, "", "FINDINGS", "-" * 80]
+    if not report['findings']:
+        lines.append("  No breadcrumb issues found!")
+    lines += render_findings(report['findings'])
+    lines += render_summary(report['findings'], [('Pages analyzed', report['pages']),
+                                                 ('Pages with a breadcrumb', report['checked'])])
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check breadcrumb trails against the URL hierarchy')
+    parser.add_argument('--prefix', default='', help='Only check pages under this directory (e.g. paths/)')
+    parser.add_argument('--format', choices=('text', 'json'), default='text', help='Report format')
+    args = parser.parse_args()
+
+    report = audit_breadcrumbs(Path(__file__).parent, args.prefix)
+    if args.format == 'json':
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+    else:
+        print(render_text(report))
+    return exit_status(report['findings'])
+
+
+if __name__ == '__main__':
+    sys.exit(main())
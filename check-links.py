@@ -2,12 +2,27 @@
 """
 Link Checker for Bitcoin Sovereign Academy
 Tests all internal links in HTML files
+
+Usage:
+    python3 check-links.py [--jobs N] [--no-cache]
+    python3 check-links.py --external [--ttl-hours H]
+    python3 check-links.py --graph [--graph-json FILE] [--graphml FILE]
+    python3 check-links.py --sitemap [--update-lastmod]
+    python3 check-links.py --budget [KB]
 """
 
+import argparse
 import os
-import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from urllib.parse import urljoin, urlparse
+from urllib.parse import unquote, urldefrag
+
+from external_links import ExternalLinkChecker, default_cache_path
+from site_assets import DEFAULT_BUDGET_KB, AssetGraph, AssetSizer, kb
+from site_corpus import load_corpus
+from site_graph import LinkGraph
+from site_routes import RouteTable, SitePaths, site_path
+from site_sitemap import reconcile_sitemap, update_lastmod
 
 # ANSI color codes
 RED = '\033[0;31m'
@@ -16,118 +31,331 @@ YELLOW = '\033[1;33m'
 BLUE = '\033[0;34m'
 NC = '\033[0m'  # No Color
 
-def find_html_files(root_dir):
-    """Find all HTML files in the project"""
-    html_files = []
-    for path in Path(root_dir).rglob('*.html'):
-        # Skip node_modules, .git, etc.
-        if any(skip in str(path) for skip in ['node_modules', '.git', 'dist', 'build']):
-            continue
-        html_files.append(path)
-    return html_files
-
-def extract_links(file_path):
-    """Extract all href and src links from an HTML file"""
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-    except Exception as e:
-        print(f"{YELLOW}⚠ Could not read {file_path}: {e}{NC}")
-        return []
-
-    # Extract href attributes
-    href_pattern = r'href=["\']([^"\']+)["\']'
-    hrefs = re.findall(href_pattern, content)
-
-    # Extract src attributes
-    src_pattern = r'src=["\']([^"\']+)["\']'
-    srcs = re.findall(src_pattern, content)
-
-    return hrefs + srcs
+def extract_links(record):
+    """All href and src links from a page record"""
+    return record['links'] + record['srcs']
 
 def is_external_link(link):
     """Check if a link is external"""
     return link.startswith(('http://', 'https://', 'mailto:', 'tel:', 'javascript:'))
 
-def resolve_path(file_path, link, root_dir):
-    """Resolve a relative link to an absolute file path"""
-    # Remove anchor
-    link_without_anchor = link.split('#')[0]
-
-    if not link_without_anchor:
-        return None  # Just an anchor
-
-    # Handle absolute paths from root
-    if link_without_anchor.startswith('/'):
-        return root_dir / link_without_anchor.lstrip('/')
-
-    # Handle relative paths
-    file_dir = file_path.parent
-    return (file_dir / link_without_anchor).resolve()
-
-def check_links(root_dir):
-    """Check all links in HTML files"""
-    root_path = Path(root_dir)
-    html_files = find_html_files(root_path)
-
-    print(f"{BLUE}🔍 Bitcoin Sovereign Academy - Link Testing{NC}")
-    print("=" * 50)
-    print(f"\nFound {len(html_files)} HTML files\n")
-    print("Testing links...\n")
+def fragment_exists(page_ids, target_file, fragment):
+    """
+    Check a #fragment against the target page's id index. Returns None when
+    there is nothing to verify (no fragment, '#top', a hash route, or a
+    target that is not an indexed HTML page).
+    """
+    fragment = unquote(fragment)
+    if not fragment or fragment == 'top' or fragment.startswith(('!', '/')):
+        return None
+    ids = page_ids.get(target_file)
+    if ids is None:
+        return None
+    return fragment in ids
 
+def check_shard(routes, page_ids, shard):
+    """
+    Check the links of a shard of pages.
+    Returns (links tested, fragments tested, broken links, page-to-page edges).
+    """
     broken_links = []
+    edges = []
     total_links = 0
-    files_checked = 0
+    total_fragments = 0
 
-    for html_file in sorted(html_files):
-        links = extract_links(html_file)
-        files_checked += 1
+    for rel_path, links in shard:
+        page_path = site_path(rel_path)
 
         for link in links:
-            # Skip external links
-            if is_external_link(link):
+            # Skip external and empty links
+            if not link or is_external_link(link):
                 continue
 
-            # Skip empty links and pure anchors
-            if not link or link.startswith('#'):
-                continue
+            fragment = link.partition('#')[2]
+
+            if link.startswith('#'):
+                # Same-page anchor
+                target = target_file = page_path
+            else:
+                total_links += 1
+
+                # Resolve through redirects, the in-memory path set and rewrites
+                target, exists = routes.resolve(page_path, link)
 
-            total_links += 1
+                if target is None:
+                    continue  # Only a query string
 
-            # Resolve the link
-            target = resolve_path(html_file, link, root_path)
+                if not exists:
+                    broken_links.append({
+                        'file': rel_path,
+                        'link': link,
+                        'resolved': target,
+                        'kind': 'page'
+                    })
+                    continue
 
-            if target is None:
-                continue  # Just an anchor
+                target_file = routes.site.served_file(target)
+                if target_file in page_ids:
+                    edges.append((page_path, target_file))
 
-            # Check if target exists
-            if not target.exists():
+            found = fragment_exists(page_ids, target_file, fragment)
+            if found is None:
+                continue
+            total_fragments += 1
+            if not found:
                 broken_links.append({
-                    'file': html_file.relative_to(root_path),
+                    'file': rel_path,
                     'link': link,
-                    'resolved': target
+                    'resolved': f"{target_file}#{unquote(fragment)}",
+                    'kind': 'anchor'
                 })
 
+    return total_links, total_fragments, broken_links, edges
+
+def init_worker(routes, page_ids):
+    """Give each pool worker the route table and id index once, not per shard"""
+    global WORKER_ROUTES, WORKER_PAGE_IDS
+    WORKER_ROUTES = routes
+    WORKER_PAGE_IDS = page_ids
+
+def check_worker_shard(shard):
+    return check_shard(WORKER_ROUTES, WORKER_PAGE_IDS, shard)
+
+def make_shards(items, count):
+    """Split items into at most count contiguous, order-preserving shards"""
+    size = max(1, -(-len(items) // count))
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+def check_external_links(root_path, corpus, ttl_hours, use_cache=True):
+    """Probe every external http(s) link once; returns the number that failed"""
+    pages_by_url = {}
+    for rel_path, record in corpus.items():
+        for link in extract_links(record):
+            if link.startswith(('http://', 'https://')):
+                url = urldefrag(link)[0]
+                pages_by_url.setdefault(url, [])
+                if rel_path not in pages_by_url[url]:
+                    pages_by_url[url].append(rel_path)
+
+    print(f"\nChecking {len(pages_by_url)} external URLs...\n")
+    cache_path = default_cache_path(root_path) if use_cache else None
+    checker = ExternalLinkChecker(cache_path=cache_path, ttl=ttl_hours * 3600)
+    results = checker.check_urls(sorted(pages_by_url))
+    failed = [result for result in results.values() if not result['ok']]
+
+    print(f"External URLs: {len(results)} "
+          f"({checker.stats['cached']} cached, {checker.stats['probed']} probed)")
+    print()
+    if failed:
+        print(f"{RED}✗ Found {len(failed)} broken external link(s):{NC}\n")
+        for result in failed:
+            print(f"{RED}✗ EXTERNAL{NC}")
+            print(f"  URL: {result['url']}")
+            print(f"  Status: {result['status'] or result['error']}")
+            print(f"  Used in: {', '.join(pages_by_url[result['url']])}")
+            print()
+    else:
+        print(f"{GREEN}✓ All {len(results)} external links are working!{NC}")
+    return len(failed)
+
+def report_sitemap(root_path, routes, graph, update=False):
+    """Reconcile sitemap.xml with the route table and link graph; returns problem count"""
+    sitemap_path = root_path / 'sitemap.xml'
+    depth = graph.click_depths()
+    reachable = [path for n, path in enumerate(graph.nodes) if depth[n] >= 0]
+    result = reconcile_sitemap(sitemap_path, routes, reachable)
+
+    print(f"\n{BLUE}🗺  sitemap.xml{NC}")
+    print(f"Entries: {result['entries']}")
+    if result['missing']:
+        print(f"\n{RED}✗ {len(result['missing'])} <loc> entries do not resolve:{NC}")
+        for loc, target in result['missing']:
+            print(f"  {loc}  (expected {target})")
+    for key, label in (('foreign', 'entries on another host'),
+                       ('duplicates', 'entries serving an already listed page')):
+        if result[key]:
+            print(f"\n{YELLOW}{len(result[key])} {label}:{NC}")
+            for loc in result[key]:
+                print(f"  {loc}")
+    print(f"\n{YELLOW}Reachable pages missing from the sitemap: {len(result['unlisted'])}{NC}")
+    for path in result['unlisted']:
+        print(f"  {path}")
+
+    if update:
+        updated = update_lastmod(sitemap_path, routes)
+        print(f"\nUpdated <lastmod> for {len(updated)} changed page(s)")
+        for loc in updated:
+            print(f"  {loc}")
+
+    return len(result['missing'])
+
+def report_budget(root_path, routes, corpus, budget_kb):
+    """Total each page's transfer weight; returns the number of pages over budget"""
+    sizer = AssetSizer(root_path)
+    assets = AssetGraph(routes, sizer)
+    weights = [assets.page_weight(site_path(rel_path), record) for rel_path, record in corpus.items()]
+    sizer.save()
+    weights.sort(key=lambda w: (-w['critical_gzip'], w['page']))
+    budget = budget_kb * 1024
+    over = [w for w in weights if w['critical_gzip'] > budget]
+
+    print(f"\n{BLUE}⚖  Transfer weight (critical = HTML + CSS + JS){NC}")
+    print(f"Budget: {budget_kb:g} KB gzip-estimated critical bytes per page\n")
+    print(f"  {'critical gz':>12} {'critical raw':>13} {'total gz':>10}  page")
+    for w in weights[:15]:
+        print(f"  {kb(w['critical_gzip']):>12} {kb(w['critical_raw']):>13} {kb(w['total_gzip']):>10}  {w['page']}")
+
+    shared = {}
+    for w in weights:
+        for asset, _, _ in w['critical']:
+            shared[asset] = shared.get(asset, 0) + 1
+    print("\n  Most widely loaded critical assets:")
+    for asset, count in sorted(shared.items(), key=lambda item: (-item[1], item[0]))[:10]:
+        print(f"    {count:4d} pages  {kb(sizer.size(asset)[1]):>9} gz  {asset}")
+
+    if over:
+        print(f"\n{RED}✗ {len(over)} page(s) over the {budget_kb:g} KB budget:{NC}")
+        for w in over:
+            heaviest = sorted(w['critical'], key=lambda a: -a[2])[:3]
+            print(f"  {w['page']}: {kb(w['critical_gzip'])} "
+                  f"(largest: {', '.join(f'{a} {kb(gz)}' for a, _, gz in heaviest)})")
+    else:
+        print(f"\n{GREEN}✓ All {len(weights)} pages are within the {budget_kb:g} KB budget{NC}")
+    return len(over)
+
+def report_graph(graph, graph_json=None, graphml=None):
+    """Print reachability findings and write the requested exports"""
+    report = graph.analyze()
+
+    print(f"\n{BLUE}🕸  Link graph{NC}")
+    print(f"Pages: {len(graph)}  Links: {graph.edge_count()}")
+    print(f"Reachable from {', '.join(report['roots'])}: {report['reachable']} "
+          f"(max click depth {report['max_depth']})")
+
+    depth_counts = {}
+    for depth in report['depth']:
+        if depth >= 0:
+            depth_counts[depth] = depth_counts.get(depth, 0) + 1
+    for depth in sorted(depth_counts):
+        print(f"  depth {depth}: {depth_counts[depth]} pages")
+
+    print(f"\n{YELLOW}Orphan pages (unreachable): {len(report['orphans'])}{NC}")
+    for path in report['orphans']:
+        print(f"  {path}")
+    print(f"\n{YELLOW}Dead-end modules (no outgoing page links): {len(report['dead_end_modules'])}{NC}")
+    for path in report['dead_end_modules']:
+        print(f"  {path}")
+    print(f"\nPages with no inbound links: {len(report['no_inbound'])}")
+
+    if graph_json:
+        graph.write_json(graph_json, report)
+        print(f"Graph JSON written to {graph_json}")
+    if graphml:
+        graph.write_graphml(graphml, report)
+        print(f"GraphML written to {graphml}")
+
+def check_links(root_dir, jobs=1, use_cache=True, external=False, ttl_hours=168,
+                graph=False, graph_json=None, graphml=None, sitemap=False,
+                update_lastmod=False, budget_kb=None):
+    """Check all links in HTML files, sharding pages across jobs processes"""
+    root_path = Path(root_dir)
+    corpus = load_corpus(root_path, use_cache=use_cache, jobs=jobs)
+    routes = RouteTable(SitePaths(root_path))
+    # id/name values per page, collected in the same parse pass as the links
+    page_ids = {site_path(rel_path): frozenset(record['ids']) for rel_path, record in corpus.items()}
+
+    print(f"{BLUE}🔍 Bitcoin Sovereign Academy - Link Testing{NC}")
+    print("=" * 50)
+    print(f"\nFound {len(corpus)} HTML files\n")
+    print("Testing links...\n")
+
+    items = [(rel_path, extract_links(record)) for rel_path, record in corpus.items()]
+    files_checked = len(items)
+
+    if jobs > 1 and len(items) > 1:
+        # Several shards per worker keeps the pool busy when page sizes vary;
+        # map() returns shards in submission order, so the merge is deterministic
+        shards = make_shards(items, jobs * 4)
+        with ProcessPoolExecutor(max_workers=jobs, initializer=init_worker,
+                                 initargs=(routes, page_ids)) as pool:
+            results = list(pool.map(check_worker_shard, shards))
+    else:
+        results = [check_shard(routes, page_ids, items)]
+
+    total_links = sum(result[0] for result in results)
+    total_fragments = sum(result[1] for result in results)
+    broken_links = [item for result in results for item in result[2]]
+
     # Print results
     print("=" * 50)
     print(f"\nFiles checked: {files_checked}")
     print(f"Internal links tested: {total_links}")
+    print(f"Fragments tested: {total_fragments}")
     print()
 
     if broken_links:
         print(f"{RED}✗ Found {len(broken_links)} broken link(s):{NC}\n")
         for item in broken_links:
-            print(f"{RED}✗ BROKEN{NC}")
+            if item['kind'] == 'anchor':
+                print(f"{RED}✗ MISSING ANCHOR{NC}")
+            else:
+                print(f"{RED}✗ BROKEN{NC}")
             print(f"  File: {item['file']}")
             print(f"  Link: {item['link']}")
             print(f"  Expected: {item['resolved']}")
             print()
-        return 1
     else:
-        print(f"{GREEN}✓ All {total_links} internal links are working!{NC}")
-        return 0
+        print(f"{GREEN}✓ All {total_links} internal links and {total_fragments} fragments are working!{NC}")
+
+    sitemap_problems = 0
+    if graph or graph_json or graphml or sitemap or update_lastmod:
+        edges = [edge for result in results for edge in result[3]]
+        link_graph = LinkGraph(page_ids, edges)
+        if graph or graph_json or graphml:
+            report_graph(link_graph, graph_json, graphml)
+        if sitemap or update_lastmod:
+            sitemap_problems = report_sitemap(root_path, routes, link_graph, update_lastmod)
+
+    pages_over_budget = 0
+    if budget_kb is not None:
+        pages_over_budget = report_budget(root_path, routes, corpus, budget_kb)
+
+    external_failures = 0
+    if external:
+        external_failures = check_external_links(root_path, corpus, ttl_hours, use_cache)
+
+    return 1 if broken_links or external_failures or sitemap_problems or pages_over_budget else 0
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Test all internal links in the site HTML files')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help='worker processes for parsing and checking (0 = one per CPU)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='ignore the on-disk page and external-result caches')
+    parser.add_argument('--external', action='store_true',
+                        help='also probe external http(s) links')
+    parser.add_argument('--ttl-hours', type=float, default=168,
+                        help='reuse cached external results younger than this (default: one week)')
+    parser.add_argument('--graph', action='store_true',
+                        help='report orphan pages, dead-end modules and click depth')
+    parser.add_argument('--graph-json', metavar='FILE', help='write the link graph as JSON')
+    parser.add_argument('--graphml', metavar='FILE', help='write the link graph as GraphML')
+    parser.add_argument('--sitemap', action='store_true',
+                        help='check sitemap.xml entries and list reachable pages it omits')
+    parser.add_argument('--update-lastmod', action='store_true',
+                        help='refresh <lastmod> in sitemap.xml for pages whose content changed')
+    parser.add_argument('--budget', metavar='KB', type=float, nargs='?', const=DEFAULT_BUDGET_KB,
+                        help=f'fail pages whose gzip-estimated HTML+CSS+JS exceeds KB '
+                             f'(default {DEFAULT_BUDGET_KB})')
+    return parser.parse_args()
 
 if __name__ == '__main__':
+    args = parse_args()
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
     root_directory = Path(__file__).parent
-    exit_code = check_links(root_directory)
+    exit_code = check_links(root_directory, jobs=jobs, use_cache=not args.no_cache,
+                            external=args.external, ttl_hours=args.ttl_hours,
+                            graph=args.graph, graph_json=args.graph_json, graphml=args.graphml,
+                            sitemap=args.sitemap, update_lastmod=args.update_lastmod,
+                            budget_kb=args.budget)
     exit(exit_code)
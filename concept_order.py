@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Concept Prerequisite Checker for Bitcoin Sovereign Academy
+Turns CANONICAL_CONCEPT_ORDER.md into a dependency graph and checks every
+learning path against it: no concept may be introduced before the concepts
+it builds on.
+
+Each numbered concept in the document contributes its **Terms:** (the
+words that count as introducing it) and its **Prerequisites:** bullets.
+A bullet becomes an edge to every other concept whose terms it mentions,
+or to whole tiers ("all Tiers 1-3"). The graph is topologically sorted
+once; prerequisites a path never introduces are looked through to the
+concepts they in turn build on.
+
+Per path, each English module's introduction text (headings and first
+paragraphs) is scanned once for all concept terms, in course order
+(module_sequence.py), giving the module where every concept first
+appears. Checking a concept is then a comparison of that index with its
+prerequisites' indexes, with no rescans of the text.
+
+Usage:
+    python3 concept_order.py
+    python3 concept_order.py --paths curious builder
+    python3 concept_order.py --graph          # print the parsed graph
+"""
+
+import argparse
+import heapq
+import re
+import sys
+from pathlib import Path
+
+from audit_records import LEARNING_PATHS, course_modules, module_name
+from module_sequence import ModuleSequence
+from term_matcher import TermMatcher
+
+CONCEPT_DOC = 'CANONICAL_CONCEPT_ORDER.md'
+
+# Headings and this many leading paragraphs count as a module's introduction
+INTRO_PARAGRAPHS = 10
+
+TIER_HEADING = re.compile(r'^## Tier (\d+)\b')
+CONCEPT_HEADING = re.compile(r'^### (\d+)\.\s+(.+?)(?:\s+\([^)]*\))?\s*$')
+FIELD = re.compile(r'^\*\*([^*]+):\*\*\s*(.*)$')
+TIER_REFERENCE = re.compile(r'\bTiers?\s+(\d+)(?:\s*-\s*(\d+))?', re.IGNORECASE)
+
+
+def parse_concepts(text):
+    """
+    [{'number', 'name', 'tier', 'terms', 'prerequisites'}] for the numbered
+    concepts of the canonical order document, in document order
+    """
+    concepts = []
+    tier = current = field = None
+    for line in text.splitlines():
+        if line.startswith('## '):
+            match = TIER_HEADING.match(line)
+            tier = int(match.group(1)) if match else None
+            current = field = None
+            continue
+        match = CONCEPT_HEADING.match(line)
+        if match and tier is not None:
+            current = {'number': int(match.group(1)), 'name': match.group(2), 'tier': tier,
+                       'terms': [], 'prerequisites': []}
+            concepts.append(current)
+            field = None
+            continue
+        if current is None:
+            continue
+        match = FIELD.match(line)
+        if match:
+            field, value = match.groups()
+            if field == 'Terms':
+                current['terms'] = [term.strip() for term in value.split(',') if term.strip()]
+        elif field == 'Prerequisites' and line.startswith('- '):
+            bullet = re.sub(r'[*⚠️]|CRITICAL:', '', line[2:]).strip()
+            current['prerequisites'].append(bullet)
+        elif line.startswith('#') or line == '---':
+            field = None
+    return concepts
+
+
+def terms_pattern(terms):
+    """Regex for any of a concept's terms, each matched as a word prefix"""
+    return '|'.join(r'\b' + re.escape(term) + r'\w*' for term in terms)
+
+
+class ConceptGraph:
+    """
+    Prerequisite DAG over the canonical concepts.
+
+    requires[c] lists the direct prerequisites of concept c and order is a
+    topological order of all concepts.
+    """
+
+    def __init__(self, concepts):
+        self.concepts = {concept['name']: concept for concept in concepts}
+        self.names = list(self.concepts)
+        self.matcher = TermMatcher({name: terms_pattern(concept['terms'] or [name])
+                                    for name, concept in self.concepts.items()})
+
+        self.requires = {}
+        self.unresolved = []   # (concept, bullet) matching no other concept
+        for name, concept in self.concepts.items():
+            required = []
+            for bullet in concept['prerequisites']:
+                found = self.mentioned(bullet, exclude=name)
+                for tier_range in TIER_REFERENCE.finditer(bullet):
+                    low = int(tier_range.group(1))
+                    high = int(tier_range.group(2) or low)
+                    found += [other for other, c in self.concepts.items()
+                              if low <= c['tier'] <= high and other != name]
+                if not found:
+                    self.unresolved.append((name, bullet))
+                required += found
+            self.requires[name] = list(dict.fromkeys(required))
+
+        self.order = self.topological_order()
+        self.rank = {name: i for i, name in enumerate(self.order)}
+
+    @classmethod
+    def from_file(cls, root_dir):
+        with open(Path(root_dir) / CONCEPT_DOC, 'r', encoding='utf-8') as f:
+            return cls(parse_concepts(f.read()))
+
+    def mentioned(self, text, exclude=None):
+        """Concepts whose terms occur in text, in document order"""
+        hits = self.matcher.scan(text)
+        return [name for name in self.names if hits[name] and name != exclude]
+
+    def topological_order(self):
+        """Kahn's algorithm, ties broken by document order; ValueError on a cycle"""
+        waiting = {name: len(set(required)) for name, required in self.requires.items()}
+        dependents = {name: [] for name in self.names}
+        for name, required in self.requires.items():
+            for prerequisite in set(required):
+                dependents[prerequisite].append(name)
+        position = {name: i for i, name in enumerate(self.names)}
+        ready = [position[name] for name in self.names if not waiting[name]]
+        order = []
+        while ready:
+            name = self.names[heapq.heappop(ready)]
+            order.append(name)
+            for dependent in dependents[name]:
+                waiting[dependent] -= 1
+                if not waiting[dependent]:
+                    heapq.heappush(ready, position[dependent])
+        if len(order) < len(self.names):
+            cycle = [name for name in self.names if name not in order]
+            raise ValueError(f"Prerequisite cycle among: {', '.join(cycle)}")
+        return order
+
+    def introductions(self, texts):
+        """{concept: index of the first text mentioning it} over texts in reading order"""
+        first = {}
+        for index, text in enumerate(texts):
+            for name in self.mentioned(text):
+                first.setdefault(name, index)
+        return first
+
+    def violations(self, first):
+        """
+        Concepts introduced before one of their prerequisites, given
+        introductions(): [{'concept', 'at', 'prerequisite', 'prerequisite_at'}],
+        prerequisite_at None when the path never introduces it. A missing
+        prerequisite is reported and its own prerequisites checked in its place.
+        """
+        # Introduced concepts standing in for each concept, in topological order
+        stand_ins = {}
+        for name in self.order:
+            if name in first:
+                stand_ins[name] = {name}
+            else:
+                stand_ins[name] = set().union(*(stand_ins[p] for p in self.requires[name]))
+
+        found = []
+        for name in self.order:
+            at = first.get(name)
+            if at is None:
+                continue
+            late = set()
+            for prerequisite in self.requires[name]:
+                if prerequisite not in first:
+                    found.append({'concept': name, 'at': at, 'prerequisite': prerequisite,
+                                  'prerequisite_at': None})
+                late |= {other for other in stand_ins[prerequisite] if first[other] > at}
+            for other in sorted(late, key=self.rank.get):
+                found.append({'concept': name, 'at': at, 'prerequisite': other,
+                              'prerequisite_at': first[other]})
+        return found
+
+
+def introduction_text(headings, paragraphs):
+    return ' '.join(headings + paragraphs[:INTRO_PARAGRAPHS])
+
+
+def path_introductions(root_dir, path, sequence=None):
+    """
+    (module names, introduction texts) for a path's English modules in
+    course order, ready for ConceptGraph.introductions()
+    """
+    names, texts = [], []
+    for rel_path, record in course_modules(root_dir, path, 'en', sequence):
+        names.append(module_name(rel_path))
+        headings = [text for tag in ('h1', 'h2', 'h3') for text in record['headings'][tag]]
+        texts.append(introduction_text(headings, record['paragraphs']))
+    return names, texts
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check learning paths against the canonical concept order')
+    parser.add_argument('--paths', nargs='+', default=LEARNING_PATHS, help='Learning paths to check')
+    parser.add_argument('--graph', action='store_true', help='Print the parsed prerequisite graph')
+    args = parser.parse_args()
+
+    root_dir = Path(__file__).parent
+    try:
+        graph = ConceptGraph.from_file(root_dir)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+
+    print(f"🧭 {len(graph.order)} concepts, {sum(map(len, graph.requires.values()))} prerequisite edges "
+          f"from {CONCEPT_DOC}")
+    if args.graph:
+        for name in graph.order:
+            print(f"  {name}: {', '.join(graph.requires[name]) or '-'}")
+    for name, bullet in graph.unresolved:
+        print(f"  ⚠️  {name}: prerequisite \"{bullet}\" names no known concept")
+
+    sequence = ModuleSequence(root_dir)
+    for path in args.paths:
+        names, texts = path_introductions(root_dir, path, sequence)
+        first = graph.introductions(texts)
+        problems = graph.violations(first)
+        print(f"\n{path.upper()}: {len(first)}/{len(graph.order)} concepts introduced, "
+              f"{len(problems)} ordering problem(s)")
+        for problem in problems:
+            where = (f"not until {names[problem['prerequisite_at']]}"
+                     if problem['prerequisite_at'] is not None else 'never introduced')
+            print(f"  {problem['concept']} ({names[problem['at']]}) needs "
+                  f"{problem['prerequisite']}: {where}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
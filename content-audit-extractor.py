@@ -2,76 +2,76 @@
 """
 Content Audit Extractor
 Extracts text content from HTML module files for analysis
+
+Writes one JSON record per module to content-audit-data.jsonl (or
+content-audit-data.jsonl.gz with --gzip) next to this script. The file is
+generated, not committed; analyze-content-audit.py reads it. An
+interrupted run resumes where it stopped the next time it is started.
 """
 
-import os
-import re
 from pathlib import Path
-from bs4 import BeautifulSoup
-import json
-
-def extract_text_content(html_file):
-    """Extract meaningful text content from HTML file"""
-    try:
-        with open(html_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        soup = BeautifulSoup(content, 'html.parser')
-
-        # Remove script and style elements
-        for script in soup(["script", "style"]):
-            script.decompose()
-
-        # Extract key elements
-        data = {
-            'file': str(html_file),
-            'title': soup.find('title').get_text() if soup.find('title') else '',
-            'h1': [h.get_text(strip=True) for h in soup.find_all('h1')],
-            'h2': [h.get_text(strip=True) for h in soup.find_all('h2')],
-            'h3': [h.get_text(strip=True) for h in soup.find_all('h3')],
-            'paragraphs': [p.get_text(strip=True) for p in soup.find_all('p') if len(p.get_text(strip=True)) > 20],
-            'lists': [li.get_text(strip=True) for li in soup.find_all('li') if len(li.get_text(strip=True)) > 10],
-        }
+import sys
 
-        return data
-    except Exception as e:
-        return {'file': str(html_file), 'error': str(e)}
+from audit_records import (AUDIT_FILE, AUDIT_FILE_GZ, LEARNING_PATHS, MIN_LIST_ITEM_CHARS, MIN_PARAGRAPH_CHARS,
+                           RecordWriter, find_module_files)
+from site_corpus import load_corpus
 
-def scan_path_modules(base_path):
-    """Scan all modules in a learning path"""
-    path = Path(base_path)
-    modules = []
+def extract_text_content(html_file, record):
+    """Extract meaningful text content from a parsed page record"""
+    headings = record['headings']
+    return {
+        'file': str(html_file),
+        'title': record['title'],
+        'h1': headings['h1'],
+        'h2': headings['h2'],
+        'h3': headings['h3'],
+        'paragraphs': [p for p in record['paragraphs'] if len(p) > MIN_PARAGRAPH_CHARS],
+        'lists': [li for li in record['lists'] if len(li) > MIN_LIST_ITEM_CHARS],
+    }
 
-    for html_file in sorted(path.rglob('*.html')):
-        # Skip index files for now, focus on modules
-        if 'module' in html_file.name or 'deep-dive' in html_file.name:
-            modules.append(extract_text_content(html_file))
+def scan_path_modules(base_path, skip=()):
+    """
+    Yield content records for every module in a learning path, a batch
+    of pages at a time. Files in skip were already extracted.
+    """
+    module_files = [html_file for html_file in find_module_files(base_path)
+                    if str(html_file) not in skip]
 
-    return modules
+    for start in range(0, len(module_files), BATCH_SIZE):
+        batch = module_files[start:start + BATCH_SIZE]
+        corpus = load_corpus(ROOT, batch)
+        # Records go out in course order, not load_corpus()'s file-name order
+        for html_file in batch:
+            record = corpus.get(html_file.relative_to(ROOT).as_posix())
+            if record is not None:
+                yield extract_text_content(html_file, record)
 
 # Main paths to audit
-base = Path('/Users/dalia/projects/bitcoin-sovereign-academy/paths')
-paths = {
-    'curious': base / 'curious',
-    'builder': base / 'builder',
-    'sovereign': base / 'sovereign',
-    'principled': base / 'principled',
-    'pragmatist': base / 'pragmatist',
-    'hurried': base / 'hurried',
-}
+ROOT = Path(__file__).parent
+BATCH_SIZE = 32
+paths = {name: ROOT / 'paths' / name for name in LEARNING_PATHS}
 
-results = {}
-for name, path in paths.items():
-    if path.exists():
-        print(f"Scanning {name} path...")
-        results[name] = scan_path_modules(path)
+# One JSON record per module, streamed to disk as it is extracted
+output = ROOT / (AUDIT_FILE_GZ if '--gzip' in sys.argv else AUDIT_FILE)
+writer = RecordWriter(output)
+if writer.resumed:
+    print(f"Resuming interrupted extraction ({writer.resumed} modules already saved)")
 
-# Save results
-with open('content-audit-data.json', 'w', encoding='utf-8') as f:
-    json.dump(results, f, indent=2, ensure_ascii=False)
+counts = {}
+try:
+    for name, path in paths.items():
+        if path.exists():
+            print(f"Scanning {name} path...")
+            counts[name] = sum(1 for f in writer.done if Path(f).is_relative_to(path))
+            for module in scan_path_modules(path, writer.done):
+                writer.write({'path': name, **module})
+                counts[name] += 1
+    writer.finish()
+finally:
+    writer.close()
 
-print(f"\nExtracted content from all paths. Saved to content-audit-data.json")
+print(f"\nExtracted content from all paths. Saved to {output}")
 
 # Quick stats
-for path_name, modules in results.items():
-    print(f"{path_name}: {len(modules)} modules")
+for path_name, count in counts.items():
+    print(f"{path_name}: {count} modules")
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Curriculum Full-Text Store for Bitcoin Sovereign Academy
+Loads every learning-path module's title, headings, paragraphs and list
+items into .cache/content-search.sqlite3: a modules table with path, stage,
+module and language columns, and an FTS5 index over the text blocks. Only
+modules whose files changed since the last run are re-indexed.
+
+Usage:
+    python3 content_store.py                           # update the store
+    python3 content_store.py UTXO --path curious       # search
+    python3 content_store.py UTXO --path curious --first
+    python3 content_store.py '"private key" NOT seed' --kind h2
+"""
+
+import argparse
+import os
+import sqlite3
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+from audit_records import LEARNING_PATHS, find_module_files, module_info
+from module_sequence import ModuleSequence
+from site_corpus import CACHE_DIR, HEADING_TAGS, load_corpus
+
+STORE_FILE = 'content-search.sqlite3'
+# Bump whenever the schema or block extraction changes
+STORE_VERSION = 1
+
+# Block rowids are module_id * BLOCK_STRIDE + position, so a module's blocks
+# are one rowid range that can be deleted without scanning the index
+BLOCK_STRIDE = 1 << 20
+
+BLOCK_KINDS = ('title',) + HEADING_TAGS + ('p', 'li')
+
+
+def page_blocks(record):
+    """(kind, text) per text block of a page record, in reading order per kind"""
+    blocks = [('title', record['title'])] if record['title'] else []
+    for tag in HEADING_TAGS:
+        blocks.extend((tag, text) for text in record['headings'][tag])
+    blocks.extend(('p', text) for text in record['paragraphs'])
+    blocks.extend(('li', text) for text in record['lists'])
+    return blocks
+
+
+class ContentStore:
+    """SQLite + FTS5 index of learning-path module text"""
+
+    def __init__(self, root_dir):
+        self.root = Path(root_dir)
+        cache_dir = self.root / CACHE_DIR
+        cache_dir.mkdir(exist_ok=True)
+        self.conn = sqlite3.connect(cache_dir / STORE_FILE)
+        if self.conn.execute('PRAGMA user_version').fetchone()[0] != STORE_VERSION:
+            self.conn.execute('DROP TABLE IF EXISTS modules')
+            self.conn.execute('DROP TABLE IF EXISTS blocks')
+            self.conn.execute(f'PRAGMA user_version = {STORE_VERSION}')
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS modules ('
+            ' id INTEGER PRIMARY KEY, file TEXT UNIQUE, path TEXT, stage INTEGER,'
+            ' module TEXT, lang TEXT, seq INTEGER, title TEXT,'
+            ' size INTEGER, mtime_ns INTEGER)'
+        )
+        self.conn.execute('CREATE INDEX IF NOT EXISTS modules_path ON modules (path, seq)')
+        self.conn.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS blocks USING fts5("
+            " text, kind UNINDEXED, module_id UNINDEXED, position UNINDEXED,"
+            " tokenize = 'unicode61 remove_diacritics 2')"
+        )
+
+    def update(self, paths=LEARNING_PATHS):
+        """
+        Re-index modules whose size or mtime changed, add new ones and drop
+        deleted ones. Returns {'indexed': n, 'unchanged': n, 'removed': n}.
+        """
+        known = {row[0]: row[1:] for row in self.conn.execute(
+            'SELECT file, id, size, mtime_ns FROM modules')}
+        current = {}   # rel path -> (stat, seq)
+        sequence = ModuleSequence(self.root)
+        for name in paths:
+            files = find_module_files(self.root / 'paths' / name, sequence)
+            # Course order, numbered separately for each language
+            next_seq = Counter()
+            for html_file in files:
+                rel_path = html_file.relative_to(self.root).as_posix()
+                try:
+                    stat = os.stat(html_file)
+                except OSError:
+                    continue
+                lang = module_info(rel_path)[3]
+                current[rel_path] = (stat, next_seq[lang])
+                next_seq[lang] += 1
+
+        changed = [rel_path for rel_path, (stat, _) in current.items()
+                   if rel_path not in known
+                   or known[rel_path][1:] != (stat.st_size, stat.st_mtime_ns)]
+        removed = [rel_path for rel_path in known if rel_path not in current]
+
+        corpus = load_corpus(self.root, [self.root / rel_path for rel_path in changed]) if changed else {}
+        with self.conn:
+            for rel_path in removed:
+                self._delete(known[rel_path][0])
+            # Sequence numbers shift when files are added or removed
+            self.conn.executemany('UPDATE modules SET seq = ? WHERE file = ?',
+                                  [(seq, rel_path) for rel_path, (_, seq) in current.items()
+                                   if rel_path in known])
+            for rel_path, record in corpus.items():
+                stat, seq = current[rel_path]
+                if rel_path in known:
+                    self._delete(known[rel_path][0])
+                self._insert(rel_path, seq, stat, record)
+
+        return {'indexed': len(corpus), 'unchanged': len(current) - len(changed),
+                'removed': len(removed)}
+
+    def _delete(self, module_id):
+        self.conn.execute('DELETE FROM blocks WHERE rowid >= ? AND rowid < ?',
+                          (module_id * BLOCK_STRIDE, (module_id + 1) * BLOCK_STRIDE))
+        self.conn.execute('DELETE FROM modules WHERE id = ?', (module_id,))
+
+    def _insert(self, rel_path, seq, stat, record):
+        path, stage, module, lang = module_info(rel_path)
+        cursor = self.conn.execute(
+            'INSERT INTO modules (file, path, stage, module, lang, seq, title, size, mtime_ns)'
+            ' VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            (rel_path, path, stage, module, lang, seq, record['title'], stat.st_size, stat.st_mtime_ns))
+        module_id = cursor.lastrowid
+        self.conn.executemany(
+            'INSERT INTO blocks (rowid, text, kind, module_id, position) VALUES (?, ?, ?, ?, ?)',
+            [(module_id * BLOCK_STRIDE + position, text, kind, module_id, position)
+             for position, (kind, text) in enumerate(page_blocks(record))])
+
+    def search(self, query, path=None, kind=None, lang=None, first=False, limit=20):
+        """
+        FTS5 query over module text, in curriculum order (path, then
+        language with English first, then module sequence, then position in
+        the page). first keeps only the earliest hit per path. Returns dict
+        rows with a highlighted snippet.
+        """
+        sql = ('SELECT m.file, m.path, m.stage, m.module, m.lang, b.kind,'
+               " snippet(blocks, 0, '[', ']', '…', 12) AS snippet"
+               ' FROM blocks AS b JOIN modules AS m ON m.id = b.module_id'
+               ' WHERE blocks MATCH ?')
+        params = [query]
+        for column, value in (('m.path', path), ('b.kind', kind), ('m.lang', lang)):
+            if value:
+                sql += f' AND {column} = ?'
+                params.append(value)
+        sql += " ORDER BY m.path, m.lang != 'en', m.lang, m.seq, b.position"
+        if not first:
+            sql += ' LIMIT ?'
+            params.append(limit)
+        columns = ('file', 'path', 'stage', 'module', 'lang', 'kind', 'snippet')
+        rows = [dict(zip(columns, row)) for row in self.conn.execute(sql, params)]
+        if first:
+            earliest = {}
+            for row in rows:
+                earliest.setdefault(row['path'], row)
+            rows = list(earliest.values())[:limit]
+        return rows
+
+    def close(self):
+        self.conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Update and search the curriculum full-text store')
+    parser.add_argument('query', nargs='?', help='FTS5 query, e.g. UTXO or "private key"')
+    parser.add_argument('--path', help='Only this learning path')
+    parser.add_argument('--kind', choices=BLOCK_KINDS, help='Only this kind of text block')
+    parser.add_argument('--lang', help="Only this language ('en' or 'es')")
+    parser.add_argument('--first', action='store_true', help='Earliest hit per path only')
+    parser.add_argument('--limit', type=int, default=20)
+    args = parser.parse_args()
+
+    store = ContentStore(Path(__file__).parent)
+    try:
+        stats = store.update()
+        if stats['indexed'] or stats['removed']:
+            print(f"📚 Indexed {stats['indexed']} modules, removed {stats['removed']}, "
+                  f"{stats['unchanged']} unchanged")
+        if not args.query:
+            if not (stats['indexed'] or stats['removed']):
+                print(f"📚 Store up to date ({stats['unchanged']} modules)")
+            return 0
+
+        start = time.perf_counter()
+        try:
+            rows = store.search(args.query, path=args.path, kind=args.kind, lang=args.lang,
+                                first=args.first, limit=args.limit)
+        except sqlite3.OperationalError as e:
+            print(f"❌ Invalid query: {e}")
+            return 2
+        elapsed = (time.perf_counter() - start) * 1000
+    finally:
+        store.close()
+
+    for row in rows:
+        stage = f"stage {row['stage']}" if row['stage'] is not None else '-'
+        print(f"{row['path']:11s} {stage:8s} {row['module']:16s} {row['kind']:5s} {row['snippet']}")
+        print(f"{'':11s} {row['file']}")
+    print(f"\n{len(rows)} result(s) in {elapsed:.1f} ms")
+    return 0 if rows else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+External Link Checker for Bitcoin Sovereign Academy
+Probes http(s) links with asyncio: pooled keep-alive connections per host,
+bounded per-host concurrency, HEAD with a GET fallback, and retry with
+exponential backoff. Results are cached in .cache/external-links.sqlite3
+with a TTL, so repeated runs only re-probe expired URLs; transport errors
+are never cached.
+
+Usage:
+    python3 external_links.py URL [URL ...]
+    python3 check-links.py --external
+"""
+
+import argparse
+import asyncio
+import http.client
+import sqlite3
+import ssl
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import quote, urldefrag, urljoin, urlsplit
+
+from site_corpus import CACHE_DIR
+
+CACHE_FILE = 'external-links.sqlite3'
+USER_AGENT = 'BitcoinSovereignAcademy-LinkChecker/1.0'
+
+# Status codes worth retrying; anything else is a final answer
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_REDIRECTS = 5
+# GET bodies larger than this are abandoned (and the connection not reused)
+MAX_BODY = 1024 * 1024
+# Characters left as-is when percent-encoding a request target; '%' keeps
+# existing escapes intact
+TARGET_SAFE = "/%?=&:@!$'()*+,;~-._"
+
+
+class ResultCache:
+    """SQLite store of probe results; entries older than ttl seconds are stale"""
+
+    def __init__(self, cache_path, ttl):
+        Path(cache_path).parent.mkdir(exist_ok=True)
+        self.ttl = ttl
+        self.conn = sqlite3.connect(cache_path)
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS results ('
+            ' url TEXT PRIMARY KEY, ok INTEGER, status INTEGER,'
+            ' final_url TEXT, error TEXT, checked_at REAL)'
+        )
+
+    def fresh(self, urls, now=None):
+        """Cached results for urls that have not expired, as {url: result}"""
+        cutoff = (now or time.time()) - self.ttl
+        fresh = {}
+        for url in urls:
+            row = self.conn.execute(
+                'SELECT ok, status, final_url, error, checked_at FROM results'
+                ' WHERE url = ? AND checked_at >= ?', (url, cutoff)).fetchone()
+            if row:
+                fresh[url] = {
+                    'url': url, 'ok': bool(row[0]), 'status': row[1],
+                    'final_url': row[2], 'error': row[3], 'checked_at': row[4],
+                    'cached': True,
+                }
+        return fresh
+
+    def store(self, results):
+        self.conn.executemany(
+            'INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?)',
+            [(r['url'], int(r['ok']), r['status'], r['final_url'], r['error'], r['checked_at'])
+             for r in results])
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+
+class HostPool:
+    """
+    Keep-alive connections to one scheme://host:port.
+
+    The semaphore bounds in-flight requests to the host; idle connections are
+    handed back for reuse unless the server asked to close them.
+    """
+
+    def __init__(self, scheme, host, port, size, timeout):
+        self.scheme = scheme
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.semaphore = asyncio.Semaphore(size)
+        self.idle = []
+
+    def acquire(self):
+        if self.idle:
+            return self.idle.pop()
+        if self.scheme == 'https':
+            return http.client.HTTPSConnection(self.host, self.port, timeout=self.timeout,
+                                               context=ssl.create_default_context())
+        return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+
+    def release(self, conn, reusable):
+        if reusable:
+            self.idle.append(conn)
+        else:
+            conn.close()
+
+    def close(self):
+        for conn in self.idle:
+            conn.close()
+        self.idle = []
+
+
+def request_target(parts):
+    """Percent-encoded path and query of a split URL, ready for the request line"""
+    target = quote(parts.path or '/', safe=TARGET_SAFE)
+    if parts.query:
+        target += '?' + quote(parts.query, safe=TARGET_SAFE)
+    return target
+
+
+def send_request(conn, method, target):
+    """
+    Blocking request on a pooled connection (runs in a worker thread).
+    Returns (status, location, retry_after, reusable).
+    """
+    conn.request(method, target, headers={'User-Agent': USER_AGENT, 'Accept': '*/*'})
+    response = conn.getresponse()
+    # Drain the body so the connection can carry the next request
+    response.read(MAX_BODY)
+    reusable = response.isclosed() and not response.will_close
+    if not response.isclosed():
+        response.close()
+    return (response.status, response.getheader('Location'),
+            response.getheader('Retry-After'), reusable)
+
+
+class ExternalLinkChecker:
+    """Concurrent HEAD/GET prober with per-host pools, retries and a TTL cache"""
+
+    def __init__(self, cache_path=None, ttl=7 * 24 * 3600, per_host=4,
+                 max_connections=32, timeout=10.0, retries=2, backoff=0.5):
+        self.cache_path = cache_path
+        self.ttl = ttl
+        self.per_host = per_host
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.stats = {'cached': 0, 'probed': 0, 'requests': 0, 'retries': 0}
+
+    def check_urls(self, urls):
+        """Check urls (fragments ignored). Returns {url: result} in input order."""
+        urls = list(dict.fromkeys(urldefrag(url)[0] for url in urls))
+        cache = ResultCache(self.cache_path, self.ttl) if self.cache_path else None
+        try:
+            results = cache.fresh(urls) if cache else {}
+            stale = [url for url in urls if url not in results]
+            self.stats['cached'] += len(results)
+            self.stats['probed'] += len(stale)
+            if stale:
+                probed = asyncio.run(self._check_all(stale))
+                if cache:
+                    # Transport errors (DNS, refused, timeout) are re-probed next run
+                    cache.store([r for r in probed if r['status'] is not None])
+                results.update((r['url'], r) for r in probed)
+        finally:
+            if cache:
+                cache.close()
+        return {url: results[url] for url in urls}
+
+    async def _check_all(self, urls):
+        self._pools = {}
+        self._executor = ThreadPoolExecutor(max_workers=self.max_connections)
+        try:
+            return await asyncio.gather(*(self._check_url(url) for url in urls))
+        finally:
+            for pool in self._pools.values():
+                pool.close()
+            self._executor.shutdown(wait=True)
+
+    def _pool_for(self, parts):
+        scheme = parts.scheme
+        port = parts.port or (443 if scheme == 'https' else 80)
+        # Internationalised host names go on the wire in their ASCII (IDNA) form
+        host = parts.hostname.encode('idna').decode('ascii')
+        key = (scheme, host, port)
+        if key not in self._pools:
+            self._pools[key] = HostPool(scheme, host, port, self.per_host, self.timeout)
+        return self._pools[key]
+
+    async def _check_url(self, url):
+        result = {'url': url, 'ok': False, 'status': None, 'final_url': url,
+                  'error': None, 'checked_at': time.time(), 'cached': False}
+        current = url
+        for _ in range(MAX_REDIRECTS + 1):
+            status, location, error = await self._probe(current)
+            result.update(status=status, final_url=current, error=error)
+            if status in (301, 302, 303, 307, 308) and location:
+                current = urljoin(current, location)
+                continue
+            result['ok'] = status is not None and 200 <= status < 400
+            return result
+        result['error'] = 'too many redirects'
+        return result
+
+    async def _probe(self, url):
+        """HEAD, falling back to GET when the server rejects or mishandles HEAD"""
+        status, location, error = await self._request('HEAD', url)
+        if status is None or status >= 400:
+            status, location, error = await self._request('GET', url)
+        return status, location, error
+
+    async def _request(self, method, url):
+        """One logical request with retries. Returns (status, location, error)."""
+        parts = urlsplit(url)
+        if parts.scheme not in ('http', 'https') or not parts.hostname:
+            return None, None, f'unsupported URL: {url}'
+        try:
+            target = request_target(parts)
+            pool = self._pool_for(parts)
+        except ValueError as e:   # bad port, or a host IDNA cannot encode (UnicodeError)
+            return None, None, f'{type(e).__name__}: {e}'
+        loop = asyncio.get_running_loop()
+        status = location = error = retry_after = None
+
+        for attempt in range(self.retries + 1):
+            if attempt:
+                self.stats['retries'] += 1
+                await asyncio.sleep(self._delay(attempt, retry_after))
+            async with pool.semaphore:
+                conn = pool.acquire()
+                self.stats['requests'] += 1
+                try:
+                    status, location, retry_after, reusable = await loop.run_in_executor(
+                        self._executor, send_request, conn, method, target)
+                    error = None
+                except (OSError, http.client.HTTPException, UnicodeError, ValueError) as e:
+                    status, location, retry_after, reusable = None, None, None, False
+                    error = f'{type(e).__name__}: {e}'
+                pool.release(conn, reusable)
+            if status not in RETRY_STATUSES and error is None:
+                break
+        return status, location, error
+
+    def _delay(self, attempt, retry_after):
+        """Exponential backoff, honouring a numeric Retry-After up to 30s"""
+        delay = self.backoff * (2 ** (attempt - 1))
+        if retry_after and retry_after.isdigit():
+            delay = max(delay, min(int(retry_after), 30))
+        return delay
+
+
+def default_cache_path(root_dir):
+    return Path(root_dir) / CACHE_DIR / CACHE_FILE
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check external URLs')
+    parser.add_argument('urls', nargs='+')
+    parser.add_argument('--ttl-hours', type=float, default=168)
+    parser.add_argument('--no-cache', action='store_true')
+    args = parser.parse_args()
+
+    cache_path = None if args.no_cache else default_cache_path(Path(__file__).parent)
+    checker = ExternalLinkChecker(cache_path=cache_path, ttl=args.ttl_hours * 3600)
+    results = checker.check_urls(args.urls)
+    for result in results.values():
+        mark = '✓' if result['ok'] else '✗'
+        detail = result['status'] or result['error']
+        print(f"{mark} {result['url']} ({detail}{', cached' if result['cached'] else ''})")
+    return 0 if all(r['ok'] for r in results.values()) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
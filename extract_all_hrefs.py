@@ -4,20 +4,10 @@ Extract all href links from all module HTML files
 Creates a comprehensive listing for reference
 """
 
-import re
 from pathlib import Path
 import json
 
-def extract_all_hrefs(file_path):
-    """Extract all href links from an HTML file"""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    # Find all href attributes with surrounding context
-    href_pattern = r'<a[^>]*href=["\']([^"\']+)["\'][^>]*>([^<]*)</a>'
-    hrefs = re.findall(href_pattern, content)
-
-    return hrefs
+from site_corpus import load_corpus
 
 def categorize_href(href):
     """Categorize href by type"""
@@ -33,26 +23,27 @@ def categorize_href(href):
         return 'relative'
 
 def main():
-    base_dir = Path('/Users/dalia/projects/bitcoin-sovereign-academy')
+    base_dir = Path(__file__).parent
 
     # Find all module HTML files
     module_files = []
     for pattern in ['paths/builder/stage-*/module-*.html', 'paths/curious/stage-*/module-*.html']:
         module_files.extend(sorted(base_dir.glob(pattern)))
 
+    corpus = load_corpus(base_dir, module_files)
+
     print("=" * 100)
     print("COMPLETE HREF EXTRACTION - ALL MODULE FILES")
     print("=" * 100)
 
     all_data = {}
 
-    for module_file in module_files:
-        rel_path = str(module_file.relative_to(base_dir))
+    for rel_path, record in corpus.items():
         print(f"\n{'='*100}")
         print(f"File: {rel_path}")
         print('='*100)
 
-        hrefs = extract_all_hrefs(module_file)
+        hrefs = record['anchors']
 
         if not hrefs:
             print("  No links found!")
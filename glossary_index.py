@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Glossary Jargon Index for Bitcoin Sovereign Academy
+Finds, for every glossary term and learning path, the module where the term
+is first used and the module where it is first defined, and flags terms a
+learner meets before the path explains them.
+
+The term list is the one glossary.html renders (js/glossary-data.js). Each
+module is scanned once for all terms and once for definition markers
+(' is ', ' means ', ...); a use counts as a definition when a marker falls
+inside the window around it. Modules are fed in course order (English
+pages in module_sequence.py order), so one pass answers first use vs.
+first definition for every term.
+
+Usage:
+    python3 glossary_index.py                  # every path
+    python3 glossary_index.py --paths curious pragmatist
+"""
+
+import argparse
+import json
+import re
+import sys
+from bisect import bisect_left
+from pathlib import Path
+
+from audit_records import LEARNING_PATHS, course_modules, module_name
+from module_sequence import ModuleSequence
+from term_matcher import TermMatcher
+
+# The data file glossary.html loads its terms from
+GLOSSARY_DATA = 'js/glossary-data.js'
+
+# A use is a definition when one of these starts within the window around it
+DEFINITION_MARKERS = re.compile(r' is | means | refers to|called|definition', re.IGNORECASE)
+WINDOW_BEFORE = 100
+WINDOW_AFTER = 200
+
+# Flagged terms listed per path before the rest are summarised
+MAX_LISTED = 15
+
+
+def load_glossary(root_dir):
+    """The glossary's term entries, as dicts with 'term', 'simple', 'level', ..."""
+    with open(Path(root_dir) / GLOSSARY_DATA, 'r', encoding='utf-8') as f:
+        source = f.read()
+    return json.loads(source[source.index('['):source.rindex(']') + 1])
+
+
+def term_pattern(term):
+    """Whole-word match for a glossary term, plurals included"""
+    return r'\b' + re.escape(term) + r'(?:e?s)?\b'
+
+
+class JargonIndex:
+    """
+    First use and first definition of glossary terms per learning path.
+
+    add() each path's modules in reading order, then usage() reports where
+    every term was met and explained.
+    """
+
+    def __init__(self, terms):
+        self.terms = list(dict.fromkeys(terms))
+        self.matcher = TermMatcher({term: term_pattern(term) for term in self.terms})
+        self.modules = {}   # path -> [module name]
+        self.entries = {}   # path -> {term: entry}
+
+    def add(self, path, name, text):
+        """Index one module; modules of a path must arrive in order"""
+        names = self.modules.setdefault(path, [])
+        entries = self.entries.setdefault(path, {})
+        module = len(names)
+        names.append(name)
+
+        markers = [m.start() for m in DEFINITION_MARKERS.finditer(text)]
+        for term, starts in self.matcher.scan(text).items():
+            if not starts:
+                continue
+            entry = entries.get(term)
+            if entry is None:
+                entry = entries[term] = {'first_use': (module, starts[0]), 'defined': None,
+                                         'uses': 0, 'uses_before_definition': 0}
+            for start in starts:
+                entry['uses'] += 1
+                if entry['defined'] is not None:
+                    continue
+                i = bisect_left(markers, start - WINDOW_BEFORE)
+                if i < len(markers) and markers[i] <= start + len(term) + WINDOW_AFTER:
+                    entry['defined'] = (module, start)
+                else:
+                    entry['uses_before_definition'] += 1
+
+    def usage(self, path):
+        """
+        {term: {'first_use', 'first_definition', 'uses', 'uses_before_definition'}}
+        for the terms used in a path, in order of first use. Positions are
+        module names; first_definition is None when the path never defines it.
+        """
+        names = self.modules.get(path, [])
+        entries = sorted(self.entries.get(path, {}).items(), key=lambda item: item[1]['first_use'])
+        return {term: {
+            'first_use': names[entry['first_use'][0]],
+            'first_definition': names[entry['defined'][0]] if entry['defined'] else None,
+            'uses': entry['uses'],
+            'uses_before_definition': entry['uses_before_definition'],
+        } for term, entry in entries}
+
+    def used_before_definition(self, path):
+        """
+        The usage() entries first used in an earlier module than the one
+        that defines them, or never defined in the path at all
+        """
+        entries = self.entries.get(path, {})
+        return {term: info for term, info in self.usage(path).items()
+                if entries[term]['defined'] is None
+                or entries[term]['defined'][0] > entries[term]['first_use'][0]}
+
+
+def module_text(module):
+    return ' '.join(module.get('paragraphs', []) + module.get('lists', []))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Glossary terms used before they are defined, per path')
+    parser.add_argument('--paths', nargs='+', default=LEARNING_PATHS, help='Learning paths to check')
+    args = parser.parse_args()
+
+    root_dir = Path(__file__).parent
+    terms = [entry['term'] for entry in load_glossary(root_dir)]
+    index = JargonIndex(terms)
+    sequence = ModuleSequence(root_dir)
+    for name in args.paths:
+        # The glossary and its definition markers are English
+        for rel_path, record in course_modules(root_dir, name, 'en', sequence):
+            index.add(name, module_name(rel_path), module_text(record))
+
+    print(f"📖 {len(index.terms)} glossary terms checked across {len(args.paths)} path(s)")
+    for name in args.paths:
+        usage = index.usage(name)
+        flagged = index.used_before_definition(name)
+        print(f"\n{name.upper()}: {len(usage)} terms used, {len(flagged)} used before a definition")
+        for term, info in list(flagged.items())[:MAX_LISTED]:
+            defined = info['first_definition'] or 'never defined'
+            print(f"  {term:24s} first used in {info['first_use']}, defined: {defined} "
+                  f"({info['uses_before_definition']}/{info['uses']} uses before)")
+        if len(flagged) > MAX_LISTED:
+            print(f"  … and {len(flagged) - MAX_LISTED} more")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,109 @@
+/**
+ * Site search over the static index built by site_search.py.
+ *
+ * Only /search-index/manifest.json and the shard for each query word's
+ * first two characters are fetched; shards are content-hashed, so the
+ * service worker can keep them cached indefinitely.
+ *
+ *   BSASearch.search('private key').then(function (results) { ... });
+ *   // results: [{ url, title, score }], best first
+ */
+(function () {
+  var BASE = '/search-index/';
+  var manifestPromise = null;
+  var docsPromise = null;
+  var shardPromises = {};
+
+  function getJSON(url) {
+    return fetch(url).then(function (response) {
+      if (!response.ok) throw new Error('Search index unavailable: ' + url);
+      return response.json();
+    });
+  }
+
+  function manifest() {
+    if (!manifestPromise) {
+      manifestPromise = getJSON(BASE + 'manifest.json').catch(function (err) {
+        manifestPromise = null;
+        throw err;
+      });
+    }
+    return manifestPromise;
+  }
+
+  function docs(index) {
+    if (!docsPromise) docsPromise = getJSON(BASE + index.docs);
+    return docsPromise;
+  }
+
+  function shard(index, prefix) {
+    var name = index.shards[prefix];
+    if (!name) return Promise.resolve({});
+    if (!shardPromises[name]) shardPromises[name] = getJSON(BASE + name);
+    return shardPromises[name];
+  }
+
+  // Mirrors tokenize() in site_search.py
+  function tokenize(query, index) {
+    return query.toLowerCase()
+      .normalize('NFKD')
+      .replace(/[\u0300-\u036f]/g, '')
+      .split(/[^a-z0-9]+/)
+      .filter(function (token) {
+        return token.length >= index.prefix && index.stop.indexOf(token) === -1;
+      });
+  }
+
+  // {docId: weight} for every term starting with token (prefix search)
+  function lookup(postings, token) {
+    var scores = {};
+    Object.keys(postings).forEach(function (term) {
+      if (term.indexOf(token) !== 0) return;
+      var list = postings[term];
+      var doc = 0;
+      var exact = term === token ? 2 : 1;
+      for (var i = 0; i < list.length; i += 2) {
+        doc += list[i];
+        scores[doc] = (scores[doc] || 0) + list[i + 1] * exact;
+      }
+    });
+    return scores;
+  }
+
+  function search(query, limit) {
+    limit = limit || 20;
+    return manifest().then(function (index) {
+      var tokens = tokenize(query, index);
+      if (!tokens.length) return [];
+      var prefixes = tokens.map(function (token) { return token.slice(0, index.prefix); });
+      return Promise.all(prefixes.map(function (prefix) { return shard(index, prefix); }))
+        .then(function (shards) {
+          // Every query word must match (AND); scores add up across words
+          var total = null;
+          tokens.forEach(function (token, i) {
+            var scores = lookup(shards[i], token);
+            if (total === null) {
+              total = scores;
+              return;
+            }
+            var merged = {};
+            Object.keys(total).forEach(function (doc) {
+              if (scores[doc]) merged[doc] = total[doc] + scores[doc];
+            });
+            total = merged;
+          });
+          var ranked = Object.keys(total)
+            .sort(function (a, b) { return total[b] - total[a] || a - b; })
+            .slice(0, limit);
+          if (!ranked.length) return [];
+          return docs(index).then(function (table) {
+            return ranked.map(function (doc) {
+              return { url: table[doc][0], title: table[doc][1], score: total[doc] };
+            });
+          });
+        });
+    });
+  }
+
+  window.BSASearch = { search: search };
+})();
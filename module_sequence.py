@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Module Sequence Model for Bitcoin Sovereign Academy
+The reading order of every learning path, discovered from paths/ in one
+directory walk instead of hand-maintained lists.
+
+A path is a directory under paths/; its stages are the stage-N
+directories inside it and its modules the module-*.html files directly
+in each stage, both in natural order ('module-2' < 'module-2-5' <
+'module-10'). Supplementary pages next to the modules (deep dives, the
+es/ translations, extra guides) are not part of the sequence.
+
+Every module's neighbours are worked out once, so prev/next/breadcrumb
+expectations are dictionary lookups by site path:
+
+    sequence = ModuleSequence(root_dir)
+    module = sequence.modules['/paths/curious/stage-2/module-1.html']
+    module['prev'], module['next'], module['breadcrumb']
+
+course_key() sorts any page of a path into that order, with each
+translation (stage-N/es/) kept in a sequence of its own after English.
+
+Run directly to print the discovered sequences.
+"""
+
+import os
+import re
+import sys
+from pathlib import Path
+
+PATHS_DIR = 'paths'
+STAGE_PATTERN = re.compile(r'^stage-(\d+)$')
+MODULE_PATTERN = re.compile(r'^module-.*\.html$')
+INDEX_PAGE = 'index.html'
+# Directories holding translations of a stage's modules
+TRANSLATION_DIRS = ('es',)
+
+
+def natural_key(text):
+    """Sort key that orders 'module-2' before 'module-10'"""
+    return [int(part) if part.isdigit() else part for part in re.split(r'(\d+)', text)]
+
+
+class ModuleSequence:
+    """
+    Learning paths, stages and modules under paths/.
+
+    paths maps each path name to {'page', 'stages'}, every stage being
+    {'number', 'page', 'modules'}; pages are site paths, or None where a
+    path or stage has no index.html. modules maps each module's site path
+    to its position and expected neighbours.
+    """
+
+    def __init__(self, root_dir):
+        self.root = Path(root_dir)
+        self.paths = {}
+        self.modules = {}
+        self._walk()
+        for name in self.paths:
+            self._link(name)
+
+    def _walk(self):
+        base = self.root / PATHS_DIR
+        found = {}   # path name -> {'index': bool, 'stages': {dir: (has index, [modules])}}
+        for dirpath, dirnames, filenames in os.walk(base):
+            parts = Path(dirpath).relative_to(base).parts
+            if len(parts) == 1:
+                found[parts[0]] = {'index': INDEX_PAGE in filenames, 'stages': {}}
+                dirnames[:] = [d for d in dirnames if STAGE_PATTERN.match(d)]
+            elif len(parts) == 2:
+                modules = [name for name in filenames if MODULE_PATTERN.match(name)]
+                found[parts[0]]['stages'][parts[1]] = (INDEX_PAGE in filenames, modules)
+                dirnames[:] = []   # translations and deep dives are not in the sequence
+
+        for name in sorted(found, key=natural_key):
+            info = found[name]
+            prefix = f'/{PATHS_DIR}/{name}/'
+            stages = []
+            for stage_dir in sorted(info['stages'], key=natural_key):
+                has_index, modules = info['stages'][stage_dir]
+                stages.append({
+                    'number': int(STAGE_PATTERN.match(stage_dir).group(1)),
+                    'page': f'{prefix}{stage_dir}/' if has_index else None,
+                    'modules': [f'{prefix}{stage_dir}/{module}'
+                                for module in sorted(modules, key=lambda m: natural_key(Path(m).stem))],
+                })
+            if stages:
+                self.paths[name] = {'page': prefix if info['index'] else None, 'stages': stages}
+
+    def _link(self, name):
+        path = self.paths[name]
+        stages = [stage for stage in path['stages'] if stage['modules']]
+        number = 0
+        for s, stage in enumerate(stages):
+            modules = stage['modules']
+            for i, module in enumerate(modules):
+                number += 1
+                if i > 0:
+                    prev = modules[i - 1]
+                elif stage['page']:
+                    prev = stage['page']
+                elif s > 0:
+                    prev = stages[s - 1]['modules'][-1]
+                else:
+                    prev = path['page']
+
+                if i < len(modules) - 1:
+                    next_page = modules[i + 1]
+                elif s < len(stages) - 1:
+                    following = stages[s + 1]
+                    next_page = following['page'] or following['modules'][0]
+                else:
+                    next_page = None   # end of the path
+
+                self.modules[module] = {
+                    'path': name,
+                    'stage': stage['number'],
+                    'index': i,
+                    'count': len(modules),
+                    'number': number,
+                    'first_in_stage': i == 0,
+                    'last_in_stage': i == len(modules) - 1,
+                    'last_stage': s == len(stages) - 1,
+                    'prev': prev,
+                    'next': next_page,
+                    'breadcrumb': [page for page in (path['page'], stage['page']) if page],
+                }
+
+    def course_key(self, file_path):
+        """
+        Sort key for a page under paths/ (site path, relative or absolute
+        file path): English pages first, then each translation, every
+        language in module sequence order. Pages outside the sequence come
+        after the modules of their stage, in natural order.
+        """
+        parts = Path(file_path).parts
+        if PATHS_DIR in parts:
+            parts = parts[parts.index(PATHS_DIR):]
+        lang = next((part for part in parts[2:-1] if part in TRANSLATION_DIRS), 'en')
+        original = '/' + '/'.join([part for part in parts[:-1] if part != lang] + [parts[-1]])
+        module = self.modules.get(original)
+        if module:
+            return (lang != 'en', lang, module['stage'], 0, module['index'], [])
+        stages = [int(match.group(1)) for match in map(STAGE_PATTERN.match, parts) if match]
+        return (lang != 'en', lang, stages[-1] if stages else 0, 1, 0, natural_key('/'.join(parts)))
+
+    def path_modules(self, name):
+        """Site paths of a path's modules in reading order"""
+        return [module for stage in self.paths[name]['stages'] for module in stage['modules']]
+
+
+def main():
+    sequence = ModuleSequence(Path(__file__).parent)
+    for name, path in sequence.paths.items():
+        count = sum(len(stage['modules']) for stage in path['stages'])
+        print(f"\n{name} ({count} modules){'' if path['page'] else ' - no index page'}")
+        for stage in path['stages']:
+            modules = ', '.join(Path(module).name for module in stage['modules']) or '(no modules)'
+            print(f"  stage {stage['number']}{'' if stage['page'] else ' (no index)'}: {modules}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Near-Duplicate Content Detection for Bitcoin Sovereign Academy
+Finds paragraphs and whole pages that say nearly the same thing across the
+learning paths, deep dives and interactive demos, so redundant material
+(the many "What is Bitcoin?" introductions) can be consolidated.
+
+Texts are reduced to word shingles, each shingle set to a MinHash
+signature, and signatures are bucketed by LSH bands. Only texts that share
+a bucket are compared, so the work grows with the number of texts rather
+than the number of pairs. Candidate pairs are confirmed with the exact
+Jaccard similarity of their shingle sets and merged into clusters.
+
+Usage:
+    python3 near_duplicates.py                  # whole pages
+    python3 near_duplicates.py --paragraphs     # individual paragraphs
+    python3 near_duplicates.py --threshold 0.7 --dirs paths deep-dives
+"""
+
+import argparse
+import hashlib
+import random
+import re
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+from site_corpus import find_html_files, load_corpus
+
+# Site sections compared by default
+CONTENT_DIRS = ('paths', 'deep-dives', 'interactive-demos')
+
+SHINGLE_WORDS = 4
+NUM_HASHES = 64
+DEFAULT_THRESHOLD = 0.6
+
+# Paragraphs shorter than this are UI text rather than content
+MIN_PARAGRAPH_WORDS = 12
+
+# Cluster members printed before the rest are summarised
+MAX_LISTED = 8
+
+WORD_PATTERN = re.compile(r'\w+')
+
+# Fixed seed: signatures are comparable between runs
+_rng = random.Random(0x5EED)
+HASH_MASKS = [_rng.getrandbits(64) for _ in range(NUM_HASHES)]
+
+
+def shingles(text, size=SHINGLE_WORDS):
+    """Set of 64-bit hashes of the text's overlapping size-word windows"""
+    words = WORD_PATTERN.findall(text.lower())
+    windows = {' '.join(words[i:i + size]) for i in range(max(1, len(words) - size + 1))}
+    return {int.from_bytes(hashlib.blake2b(window.encode('utf-8'), digest_size=8).digest(), 'little')
+            for window in windows if window}
+
+
+def minhash(shingle_set):
+    """MinHash signature: the minimum of each XOR-masked shingle hash"""
+    return [min(x ^ mask for x in shingle_set) for mask in HASH_MASKS]
+
+
+def jaccard(a, b):
+    return len(a & b) / len(a | b) if a and b else 0.0
+
+
+def band_layout(threshold):
+    """
+    (bands, rows) splitting the signature so that pairs near the threshold
+    still become candidates: the most rows per band whose LSH similarity
+    cut-off, (1 / bands) ** (1 / rows), stays below 90% of the threshold.
+    With 64 hashes and the 0.6 default this is 16 bands of 4 rows, which
+    catches pairs at Jaccard 0.7 ~98% of the time.
+    """
+    layout = (NUM_HASHES, 1)
+    for rows in (1, 2, 4, 8, 16):
+        bands = NUM_HASHES // rows
+        if (1 / bands) ** (1 / rows) <= 0.9 * threshold:
+            layout = (bands, rows)
+    return layout
+
+
+class NearDuplicateIndex:
+    """
+    MinHash/LSH index over labelled texts.
+
+    add() texts, then clusters() returns groups of texts whose pairwise
+    shingle similarity links them at or above the threshold.
+    """
+
+    def __init__(self, threshold=DEFAULT_THRESHOLD):
+        self.threshold = threshold
+        self.bands, self.rows = band_layout(threshold)
+        self.labels = []
+        self.texts = []
+        self.shingle_sets = []
+        self.buckets = defaultdict(list)
+
+    def add(self, label, text):
+        shingle_set = shingles(text)
+        if not shingle_set:
+            return
+        item = len(self.labels)
+        self.labels.append(label)
+        self.texts.append(text)
+        self.shingle_sets.append(shingle_set)
+        signature = minhash(shingle_set)
+        rows = self.rows
+        for band in range(self.bands):
+            key = (band, *signature[band * rows:(band + 1) * rows])
+            self.buckets[key].append(item)
+
+    def candidate_pairs(self):
+        """Item pairs sharing at least one LSH bucket"""
+        pairs = set()
+        for items in self.buckets.values():
+            if len(items) > 1:
+                for i, a in enumerate(items):
+                    for b in items[i + 1:]:
+                        pairs.add((a, b))
+        return pairs
+
+    def similar_pairs(self):
+        """[(a, b, jaccard)] for candidate pairs at or above the threshold"""
+        similar = []
+        for a, b in sorted(self.candidate_pairs()):
+            score = jaccard(self.shingle_sets[a], self.shingle_sets[b])
+            if score >= self.threshold:
+                similar.append((a, b, score))
+        return similar
+
+    def clusters(self):
+        """
+        Connected groups of similar items, largest first. Each cluster is
+        {'items': [(label, text)], 'max': best pair score, 'min': weakest link}.
+        """
+        parent = list(range(len(self.labels)))
+
+        def find(x):
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        scores = defaultdict(list)
+        pairs = self.similar_pairs()
+        for a, b, _ in pairs:
+            parent[find(a)] = find(b)
+        for a, b, score in pairs:
+            scores[find(a)].append(score)
+
+        groups = defaultdict(list)
+        for item in range(len(self.labels)):
+            groups[find(item)].append(item)
+
+        clusters = [{'items': [(self.labels[i], self.texts[i]) for i in members],
+                     'max': max(scores[root]), 'min': min(scores[root])}
+                    for root, members in groups.items() if len(members) > 1]
+        clusters.sort(key=lambda c: (-len(c['items']), -c['max'], c['items'][0][0]))
+        return clusters
+
+
+def page_text(record):
+    return ' '.join(record['headings']['h2'] + record['paragraphs'] + record['lists'])
+
+
+def build_index(corpus, paragraphs=False, threshold=DEFAULT_THRESHOLD):
+    """Index whole pages, or every paragraph labelled 'page#n', from a corpus dict"""
+    index = NearDuplicateIndex(threshold)
+    for rel_path, record in corpus.items():
+        if paragraphs:
+            for n, text in enumerate(record['paragraphs']):
+                if len(text.split()) >= MIN_PARAGRAPH_WORDS:
+                    index.add(f'{rel_path}#{n}', text)
+        else:
+            index.add(rel_path, page_text(record))
+    return index
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Find near-duplicate pages or paragraphs')
+    parser.add_argument('--paragraphs', action='store_true', help='Compare paragraphs instead of whole pages')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f'Minimum shingle Jaccard similarity (default {DEFAULT_THRESHOLD})')
+    parser.add_argument('--dirs', nargs='+', default=CONTENT_DIRS, help='Top-level directories to compare')
+    parser.add_argument('--cross-page', action='store_true',
+                        help='With --paragraphs, only report clusters spanning several pages')
+    parser.add_argument('--limit', type=int, default=25, help='Clusters to print')
+    args = parser.parse_args()
+
+    root_dir = Path(__file__).parent
+    files = [f for f in find_html_files(root_dir) if f.relative_to(root_dir).parts[0] in args.dirs]
+    index = build_index(load_corpus(root_dir, files), args.paragraphs, args.threshold)
+    clusters = index.clusters()
+    if args.paragraphs and args.cross_page:
+        clusters = [c for c in clusters if len({label.split('#')[0] for label, _ in c['items']}) > 1]
+
+    unit = 'paragraphs' if args.paragraphs else 'pages'
+    print(f"🔍 Compared {len(index.labels)} {unit} from {len(files)} pages "
+          f"({len(index.candidate_pairs())} candidate pairs)")
+    print(f"   {len(clusters)} near-duplicate cluster(s) at Jaccard ≥ {args.threshold}\n")
+    for n, cluster in enumerate(clusters[:args.limit], 1):
+        print(f"Cluster {n}: {len(cluster['items'])} {unit}, similarity {cluster['min']:.2f}-{cluster['max']:.2f}")
+        for label, text in cluster['items'][:MAX_LISTED]:
+            print(f"  - {label}")
+            if args.paragraphs:
+                print(f"      {text[:100]}{'…' if len(text) > 100 else ''}")
+        if len(cluster['items']) > MAX_LISTED:
+            print(f"  … and {len(cluster['items']) - MAX_LISTED} more")
+        print()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Readability Metrics for Bitcoin Sovereign Academy
+Sentence-length distributions, Flesch reading ease, Flesch-Kincaid grade,
+long-sentence ratio and syllable estimates for every module, stage and
+learning path, computed in one call with NumPy. The formulas are the
+English ones, so only English modules are scored; es/ translations are
+left out.
+
+Each module's paragraphs are tokenized once. From there on the whole
+corpus is a handful of flat arrays (one entry per token, word or
+sentence), and every metric is a bincount or reduction over them.
+
+Usage:
+    python3 readability.py                 # per path and stage
+    python3 readability.py --modules       # plus every module
+"""
+
+import argparse
+import re
+import sys
+import unicodedata
+from pathlib import Path
+
+import numpy as np
+
+from audit_records import LEARNING_PATHS, MIN_PARAGRAPH_CHARS, course_modules, module_info
+from module_sequence import ModuleSequence
+
+# Sentence model: paragraphs joined by spaces, split at runs of . ! ?,
+# words are whitespace-separated
+TOKEN_PATTERN = re.compile(r'[^\s.!?]+|[.!?]+')
+MIN_SENTENCE_WORDS = 4
+LONG_SENTENCE_WORDS = 36
+
+VOWELS = np.zeros(256, dtype=bool)
+VOWELS[list(b'aeiouy')] = True
+SEPARATOR = ord('\n')
+
+
+def syllable_counts(words):
+    """
+    Estimated syllables per word, as an array: vowel groups, minus a
+    silent final 'e' (but not '-le'), at least one. Runs over the
+    bytes of all words at once.
+    """
+    if not words:
+        return np.zeros(0, dtype=np.int64)
+    text = unicodedata.normalize('NFKD', '\n'.join(words).lower()).encode('ascii', 'ignore')
+    chars = np.frombuffer(text, dtype=np.uint8)
+    word_id = np.cumsum(chars == SEPARATOR)
+    vowel = VOWELS[chars]
+    previous = np.concatenate(([False], vowel[:-1]))
+    group_start = vowel & ~previous
+    counts = np.bincount(word_id[group_start], minlength=len(words))
+
+    # A lone final 'e' after a consonant other than 'l' is usually silent
+    next_char = np.concatenate((chars[1:], [SEPARATOR]))
+    before = np.concatenate(([SEPARATOR], chars[:-1]))
+    silent = (chars == ord('e')) & (next_char == SEPARATOR) & group_start & (before != ord('l'))
+    counts -= np.bincount(word_id[silent], minlength=len(words))
+    return np.maximum(counts, 1)
+
+
+def tokenize(paragraphs):
+    """(words, sentence number per word) for one module"""
+    words, sentence_of = [], []
+    sentence = 0
+    for token in TOKEN_PATTERN.findall(' '.join(paragraphs)):
+        if token[0] in '.!?':
+            sentence += 1
+        else:
+            words.append(token)
+            sentence_of.append(sentence)
+    return words, sentence_of
+
+
+def summarize(lengths, syllables):
+    """Metrics for one group from its sentence lengths and total syllables"""
+    sentences = len(lengths)
+    if not sentences:
+        return None
+    words = int(lengths.sum())
+    words_per_sentence = words / sentences
+    syllables_per_word = syllables / words
+    return {
+        'sentences': sentences,
+        'words': words,
+        'avg_sentence': words_per_sentence,
+        'median_sentence': float(np.median(lengths)),
+        'p90_sentence': float(np.percentile(lengths, 90)),
+        'long_count': int((lengths >= LONG_SENTENCE_WORDS).sum()),
+        'long_pct': float((lengths >= LONG_SENTENCE_WORDS).mean() * 100),
+        'syllables_per_word': syllables_per_word,
+        'flesch': 206.835 - 1.015 * words_per_sentence - 84.6 * syllables_per_word,
+        'fk_grade': 0.39 * words_per_sentence + 11.8 * syllables_per_word - 15.59,
+    }
+
+
+def group_metrics(group, groups, lengths, syllables):
+    """summarize() for every group, given the group index of each sentence"""
+    totals = np.bincount(group, weights=syllables, minlength=groups)
+    order = np.argsort(group, kind='stable')
+    bounds = np.cumsum(np.bincount(group, minlength=groups))[:-1]
+    return [summarize(part, totals[g]) for g, part in enumerate(np.split(lengths[order], bounds))]
+
+
+def readability_report(modules):
+    """
+    Readability for a corpus in one call. modules is an iterable of dicts
+    with 'file', 'path' and 'paragraphs' (the audit record shape). Returns
+    {'modules': {file: metrics}, 'stages': {(path, stage): metrics},
+    'paths': {path: metrics}}; groups without a usable sentence are left out.
+    Translations (es/) are skipped: the Flesch formulas and the syllable
+    estimate only hold for English.
+    """
+    files, stage_keys = [], []
+    words, sentence_ids, sentence_counts = [], [], []
+    offset = 0
+    for module in modules:
+        if module_info(module['file'])[3] != 'en':
+            continue
+        module_words, sentence_of = tokenize(module.get('paragraphs', []))
+        count = sentence_of[-1] + 1 if sentence_of else 0
+        words.extend(module_words)
+        sentence_ids.extend(offset + s for s in sentence_of)
+        sentence_counts.append(count)
+        offset += count
+        files.append(module['file'])
+        stage_keys.append((module['path'], module_info(module['file'])[1]))
+
+    # Per sentence: word count, syllables and owning module
+    sentence_ids = np.asarray(sentence_ids, dtype=np.int64)
+    lengths = np.bincount(sentence_ids, minlength=offset)
+    syllables = np.bincount(sentence_ids, weights=syllable_counts(words), minlength=offset)
+    module_of = np.repeat(np.arange(len(files)), sentence_counts)
+
+    keep = lengths >= MIN_SENTENCE_WORDS
+    lengths, syllables, module_of = lengths[keep], syllables[keep], module_of[keep]
+
+    report = {}
+    for name, keys in (('modules', files), ('stages', stage_keys),
+                       ('paths', [path for path, _ in stage_keys])):
+        position = {}
+        for key in keys:
+            position.setdefault(key, len(position))
+        labels = list(position)
+        index = np.asarray([position[key] for key in keys], dtype=np.int64)
+        metrics = group_metrics(index[module_of], len(labels), lengths, syllables) if labels else []
+        report[name] = {label: m for label, m in zip(labels, metrics) if m}
+    return report
+
+
+def format_metrics(m):
+    return (f"{m['avg_sentence']:5.1f} words/sentence (median {m['median_sentence']:.0f}, "
+            f"p90 {m['p90_sentence']:.0f}) | {m['long_pct']:4.1f}% 35+ words | "
+            f"{m['syllables_per_word']:.2f} syl/word | Flesch {m['flesch']:5.1f} | "
+            f"FK grade {m['fk_grade']:4.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Readability per learning path, stage and module')
+    parser.add_argument('--modules', action='store_true', help='Also list every module')
+    args = parser.parse_args()
+
+    root_dir = Path(__file__).parent
+    sequence = ModuleSequence(root_dir)
+    modules = []
+    for name in LEARNING_PATHS:
+        for rel_path, record in course_modules(root_dir, name, 'en', sequence):
+            # Same paragraphs as the audit records, so both report the same scores
+            paragraphs = [p for p in record['paragraphs'] if len(p) > MIN_PARAGRAPH_CHARS]
+            modules.append({'file': rel_path, 'path': name, 'paragraphs': paragraphs})
+
+    report = readability_report(modules)
+    for path, metrics in report['paths'].items():
+        print(f"\n{path.upper()}: {format_metrics(metrics)}")
+        for (stage_path, stage), stage_metrics in report['stages'].items():
+            if stage_path == path:
+                label = f"stage {stage}" if stage is not None else 'other'
+                print(f"  {label:9s} {format_metrics(stage_metrics)}")
+        if args.modules:
+            for module in modules:
+                metrics = report['modules'].get(module['file'])
+                if module['path'] == path and metrics:
+                    print(f"    {Path(module['file']).name:28s} {format_metrics(metrics)}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Codemod Engine — Bitcoin Sovereign Academy
+Runs registered HTML rewrites over the site as one transaction per file.
+
+A transform is a function (rel_path, content) -> (new_content, hits)
+registered with @register, together with a regex saying which files
+(root-relative, '/'-separated) it applies to. The engine walks the tree
+once and reads each file once. It applies every selected transform that
+matches the file, in the order they were selected, in memory. If any of
+them fails, the file is left untouched; otherwise it is written once,
+through a temp file renamed over the original, so a crash never leaves a
+half-written page. Files are spread over a process pool.
+
+With dry_run nothing is written and each changed file yields a unified
+diff instead. Every run reports, per transform, the number of files it
+changed and the number of hits (replacements, insertions) it made.
+
+The transforms themselves live in html_codemods.py, which is also the
+command-line entry point.
+"""
+
+import argparse
+import difflib
+import os
+import re
+import sys
+import tempfile
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+SKIP_DIRS = {'node_modules', '.git', 'dist', 'build', '.cache'}
+
+Transform = namedtuple('Transform', 'name title files apply')
+
+# Registered transforms, in registration order
+TRANSFORMS = {}
+
+
+def register(name, title, files):
+    """Register a transform for the files whose root-relative path matches the files regex"""
+    pattern = re.compile(files)
+
+    def decorator(func):
+        TRANSFORMS[name] = Transform(name, title, pattern, func)
+        return func
+    return decorator
+
+
+def select_files(root, transforms):
+    """{rel_path: [transform]} for every file under root that a transform applies to, from one walk"""
+    selected = {}
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS)
+        rel_dir = os.path.relpath(dirpath, root)
+        prefix = '' if rel_dir == '.' else rel_dir.replace(os.sep, '/') + '/'
+        for name in sorted(filenames):
+            rel_path = prefix + name
+            matching = [t for t in transforms if t.files.search(rel_path)]
+            if matching:
+                selected[rel_path] = matching
+    return selected
+
+
+def atomic_write(path, content):
+    """Replace path with content via a temp file in the same directory and a rename"""
+    path = Path(path)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8', newline='') as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp, path.stat().st_mode & 0o7777)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def rewrite_file(task):
+    """
+    Apply transforms to one file; worker entry point. Returns
+    {'file', 'hits': {name: n}, 'changed', 'diff', 'error'}.
+    """
+    root, rel_path, transforms, dry_run = task
+    result = {'file': rel_path, 'hits': {}, 'changed': False, 'diff': None, 'error': None}
+    path = Path(root) / rel_path
+    try:
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            original = f.read()
+        content = original
+        for transform in transforms:
+            content, hits = transform.apply(rel_path, content)
+            if hits:
+                result['hits'][transform.name] = hits
+        if content == original:
+            return result
+        result['changed'] = True
+        if dry_run:
+            result['diff'] = ''.join(difflib.unified_diff(
+                original.splitlines(keepends=True), content.splitlines(keepends=True),
+                fromfile=f'a/{rel_path}', tofile=f'b/{rel_path}'))
+        else:
+            atomic_write(path, content)
+    except Exception as e:
+        result['error'] = f"{type(e).__name__}: {e}"
+        result['changed'] = False
+        result['hits'] = {}
+    return result
+
+
+def run_codemod(names=None, root=ROOT, dry_run=False, jobs=None):
+    """
+    Run the named transforms (all by default) over the tree. Yields each
+    file's rewrite_file() result in path order.
+    """
+    transforms = [TRANSFORMS[name] for name in (names or TRANSFORMS)]
+    tasks = [(str(root), rel_path, matching, dry_run)
+             for rel_path, matching in select_files(root, transforms).items()]
+    jobs = jobs or os.cpu_count() or 1
+    if jobs > 1 and len(tasks) > 1:
+        chunksize = max(1, len(tasks) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            yield from pool.map(rewrite_file, tasks, chunksize=chunksize)
+    else:
+        yield from map(rewrite_file, tasks)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Apply registered HTML rewrites across the site')
+    parser.add_argument('--only', help=f"Comma-separated transforms to apply, in order ({','.join(TRANSFORMS)})")
+    parser.add_argument('--list', action='store_true', help='List the transforms and the files they apply to')
+    parser.add_argument('--dry-run', action='store_true', help='Print unified diffs instead of writing')
+    parser.add_argument('--jobs', type=int, default=None, help='Worker processes (default: CPU count)')
+    parser.add_argument('--root', default=str(ROOT), help='Site root to rewrite (default: this checkout)')
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, transform in TRANSFORMS.items():
+            print(f"{name:20s} {transform.title}")
+            print(f"{'':20s} files: {transform.files.pattern}")
+        return 0
+
+    names = None
+    if args.only:
+        names = list(dict.fromkeys(name.strip() for name in args.only.split(',') if name.strip()))
+        unknown = [name for name in names if name not in TRANSFORMS]
+        if unknown:
+            parser.error(f"unknown transform: {', '.join(unknown)} (choose from {', '.join(TRANSFORMS)})")
+    selected = names or list(TRANSFORMS)
+
+    print(f"🚀 {'[DRY RUN] ' if args.dry_run else ''}Applying: {', '.join(selected)}\n")
+    totals = {name: {'files': 0, 'hits': 0} for name in selected}
+    processed = changed = 0
+    errors = []
+    for result in run_codemod(names, root=Path(args.root), dry_run=args.dry_run, jobs=args.jobs):
+        processed += 1
+        if result['error']:
+            errors.append(result)
+            print(f"  ❌ {result['file']}: {result['error']}")
+            continue
+        for name, hits in result['hits'].items():
+            totals[name]['files'] += 1
+            totals[name]['hits'] += hits
+        if result['changed']:
+            changed += 1
+            if args.dry_run:
+                sys.stdout.write(result['diff'])
+            else:
+                print(f"  ✓ {result['file']}")
+
+    print('\n' + '=' * 60)
+    print(f"📊 {'Would change' if args.dry_run else 'Changed'} {changed} of {processed} files")
+    print('=' * 60)
+    for name, total in totals.items():
+        print(f"  {name:20s} {total['files']:5d} files  {total['hits']:6d} hits")
+    if errors:
+        print(f"\n❌ {len(errors)} file(s) left untouched after errors")
+    return 1 if errors else 0
@@ -0,0 +1,585 @@
+#!/usr/bin/env python3
+"""
+HTML Codemods — Bitcoin Sovereign Academy
+The site-wide HTML rewrites, registered with the codemod engine
+(codemod.py). Each one is idempotent and reports its hits:
+
+    subdomain-modules   module pages: module-gate.js -> subdomain access scripts
+    subdomain-demos     demo pages: old lock scripts -> demo-lock-subdomain.js
+    demos-css           demo pages: link /css/interactive-demos.css
+    monetization        content pages: analytics, email capture and tip CTA
+    emojis              static emojis -> data-icon spans, plus the icon library
+    labs                over-assigned explore-mempool lab cards -> topical labs
+
+Usage:
+    python3 scripts/html_codemods.py --list
+    python3 scripts/html_codemods.py --only demos-css,monetization --dry-run
+    python3 scripts/html_codemods.py --only emojis --jobs 8
+"""
+
+import re
+import sys
+from bisect import bisect_left, bisect_right
+
+from codemod import main, register
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Subdomain-based access control
+# ─────────────────────────────────────────────────────────────────────────────
+OLD_MODULE_GATE = re.compile(r'<script\s+src="/js/module-gate\.js"[^>]*>\s*</script>\s*')
+MODULE_SCRIPTS = '''    <script src="/js/subdomain-access-control.js"></script>
+    <script src="/js/module-gate-subdomain.js"></script>
+'''
+
+OLD_DEMO_LOCKS = [
+    re.compile(r'<script[^>]*demo-lock[^>]*>\s*</script>\s*'),
+    re.compile(r'<script[^>]*preview=[^>]*>\s*</script>\s*'),
+]
+DEMO_SCRIPTS = '''
+    <script src="/js/demo-lock-subdomain.js"></script>
+    <script src="/js/subdomain-access-control.js"></script>'''
+
+
+@register('subdomain-modules', 'Module pages use subdomain-based access control',
+          files=r'^paths/(?:.*/)?module-[^/]*\.html$')
+def subdomain_modules(rel_path, content):
+    content, hits = OLD_MODULE_GATE.subn('', content)
+    if 'subdomain-access-control.js' not in content:
+        head_close = content.find('</head>')
+        if head_close != -1:
+            content = content[:head_close] + MODULE_SCRIPTS + content[head_close:]
+            hits += 1
+    return content, hits
+
+
+@register('subdomain-demos', 'Demo pages use subdomain-based locking',
+          files=r'^interactive-demos/[^/]+/index\.html$')
+def subdomain_demos(rel_path, content):
+    hits = 0
+    for pattern in OLD_DEMO_LOCKS:
+        content, n = pattern.subn('', content)
+        hits += n
+    if 'demo-lock-subdomain.js' not in content:
+        body_match = re.search(r'<body[^>]*>', content)
+        if body_match:
+            insert_pos = body_match.end()
+            content = content[:insert_pos] + DEMO_SCRIPTS + content[insert_pos:]
+            hits += 1
+    return content, hits
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Global interactive-demos stylesheet
+# ─────────────────────────────────────────────────────────────────────────────
+CSS_LINK = '<link rel="stylesheet" href="/css/interactive-demos.css">'
+STYLESHEET_LINK = re.compile(r'<link[^>]*rel=["\']stylesheet["\'][^>]*>')
+
+
+@register('demos-css', 'Demo pages link the global interactive-demos.css',
+          files=r'^interactive-demos/(?!index\.html$).+\.html$')
+def demos_css(rel_path, content):
+    if '/css/interactive-demos.css' in content or '</head>' not in content:
+        return content, 0
+    # Place after the last stylesheet, else before </head>
+    last_css_match = None
+    if '<link rel="stylesheet"' in content:
+        for last_css_match in STYLESHEET_LINK.finditer(content):
+            pass
+    if last_css_match:
+        insert_pos = last_css_match.end()
+        return content[:insert_pos] + '\n    ' + CSS_LINK + content[insert_pos:], 1
+    return content.replace('</head>', f'    {CSS_LINK}\n</head>', 1), 1
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Analytics, email capture and tip CTAs
+# ─────────────────────────────────────────────────────────────────────────────
+MONETIZATION_SNIPPET = """
+<!-- Analytics, Email Capture & Tip CTAs -->
+<div class="container" style="margin: 2rem auto; max-width: 900px; padding: 0 1.5rem;">
+    <div id="email-capture-page" data-email-capture="page-footer" data-title="📬 Stay Updated" data-subtitle="Get Bitcoin insights and new content announcements. No spam, ever."></div>
+    <div id="tip-page" data-tip-cta="compact"></div>
+</div>
+<script src="/js/analytics.js"></script>
+<script src="/js/email-capture.js"></script>
+<script src="/js/tip-cta.js"></script>
+"""
+
+MONETIZATION_MARKER = "/js/analytics.js"
+
+
+@register('monetization', 'Content pages get analytics, email capture and tip CTA',
+          files=r'^(paths|interactive-demos|deep-dives)/.+\.html$')
+def monetization(rel_path, content):
+    if MONETIZATION_MARKER in content:
+        return content, 0
+    idx = content.lower().rfind("</body>")
+    if idx == -1:
+        return content, 0
+
+    # Components a page already loads are left out of the snippet
+    lines = MONETIZATION_SNIPPET.split("\n")
+    if "/js/tip-cta.js" in content:
+        lines = [line for line in lines if "tip-cta" not in line]
+    if "/js/email-capture.js" in content:
+        lines = [line for line in lines if "email-capture" not in line]
+    return content[:idx] + "\n".join(lines) + "\n" + content[idx:], 1
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Emoji to icon migration
+# ─────────────────────────────────────────────────────────────────────────────
+# Emoji to icon name mapping
+EMOJI_MAP = {
+    '🎮': 'game',
+    '⏰': 'clock',
+    '⏱️': 'timer',
+    '💰': 'money',
+    '🔐': 'lock',
+    '🔒': 'lock',
+    '🎯': 'target',
+    '📚': 'books',
+    '🌍': 'globe',
+    '🌐': 'network',
+    '🔧': 'tool',
+    '🏛️': 'institution',
+    '💡': 'lightbulb',
+    '🎓': 'graduation',
+    '📖': 'book',
+    '🧭': 'compass',
+    '🎪': 'tent',
+    '🤖': 'robot',
+    '✨': 'sparkles',
+    '🏆': 'trophy',
+    '🎁': 'gift',
+    '🔄': 'refresh',
+    '🎬': 'movie',
+    '🛡️': 'shield',
+    '⚡': 'lightning',
+    '📊': 'chart',
+    '💬': 'chat',
+    '🧠': 'brain',
+    '🎨': 'palette',
+    '🗺️': 'map',
+    '🪙': 'money',
+    '🆘': 'lightning',
+    '🥋': 'shield',
+}
+
+ICONS_CSS = '    <link rel="stylesheet" href="/css/icons.css">\n'
+ICON_LIBRARY_SCRIPT = '''
+    <!-- Animated Icon Library -->
+    <script src="/js/icon-library.js"></script>
+    <script>
+        // Inject icons after DOM loads
+        document.addEventListener('DOMContentLoaded', function() {
+            if (window.IconLibrary) {
+                document.querySelectorAll('[data-icon]').forEach(function(element) {
+                    var iconName = element.getAttribute('data-icon');
+                    if (iconName) {
+                        var iconHTML = IconLibrary.get(iconName, 20, true);
+                        var span = document.createElement('span');
+                        span.innerHTML = iconHTML;
+                        span.className = 'icon-inline';
+                        span.style.marginRight = '0.5rem';
+                        span.style.display = 'inline-block';
+                        span.style.verticalAlign = 'middle';
+                        element.insertBefore(span, element.firstChild);
+                    }
+                });
+            }
+        });
+    </script>
+'''
+
+
+def has_icon_library(content):
+    """Check if file already has icon library linked"""
+    return '/css/icons.css' in content and '/js/icon-library.js' in content
+
+
+def add_icon_library(content):
+    """Add icon library links to HTML file"""
+    # Add CSS link before </head>
+    if '/css/icons.css' not in content:
+        head_close = content.rfind('</head>')
+        if head_close != -1:
+            content = content[:head_close] + ICONS_CSS + content[head_close:]
+
+    # Add JS script before </body>
+    if '/js/icon-library.js' not in content:
+        body_close = content.rfind('</body>')
+        if body_close != -1:
+            content = content[:body_close] + ICON_LIBRARY_SCRIPT + content[body_close:]
+
+    return content
+
+
+# Every emoji occurrence is found in one scan of the page. Each emoji used to
+# get four regex passes of its own, run in EMOJI_MAP order:
+#   1. '<li>🎮 Text'  -> '<li><span data-icon="game"></span> Text'
+#   2. '>🎮 Text'     -> '><span data-icon="game"></span> Text'
+#   3. ' 🎮 '         -> ' <span data-icon="game"></span> '
+#   4. '🎮:'          -> '<span data-icon="game"></span>:'
+# replace_emojis() decides which rule each occurrence gets exactly as those
+# passes did, including how an earlier emoji's replacement changes the
+# context of a later one, then rebuilds the page in one pass.
+EMOJI_PATTERN = re.compile('|'.join(re.escape(emoji) for emoji in EMOJI_MAP))
+# A plain code point range scans far faster than the alternation; candidates
+# it finds are confirmed with EMOJI_PATTERN.match
+EMOJI_START = re.compile('[{}-{}]'.format(min(emoji[0] for emoji in EMOJI_MAP),
+                                          max(emoji[0] for emoji in EMOJI_MAP)))
+EMOJI_RANK = {emoji: rank for rank, emoji in enumerate(EMOJI_MAP)}
+ELEMENT_START = re.compile(r'<(?:span|li|p|h[1-6]|a|div)')
+
+
+def whitespace_end(content, i):
+    """Index just past the whitespace run starting at i"""
+    while i < len(content) and content[i].isspace():
+        i += 1
+    return i
+
+
+def replaced_between(found, starts, rules, rank, lo, hi):
+    """First occurrence in (lo, hi) already replaced by an earlier-ranked emoji, or None"""
+    for j in range(bisect_right(starts, lo), bisect_left(starts, hi)):
+        if rules[j] and EMOJI_RANK[found[j][2]] < rank:
+            return j
+    return None
+
+
+def element_close(content, s, found, starts, rules, rank):
+    """
+    Index of the '>' closing an element rule 1 accepts, when only
+    whitespace separates it from the emoji at s; None otherwise. An
+    earlier emoji replaced inside the tag ends it early.
+    """
+    t = s - 1
+    while t >= 0 and content[t].isspace():
+        t -= 1
+    if t < 0 or content[t] != '>':
+        return None
+    q = content.rfind('>', 0, t)
+    while True:
+        q = content.find('<', q + 1, t)
+        if q == -1:
+            return None
+        if ELEMENT_START.match(content, q) and replaced_between(found, starts, rules, rank, q, t) is None:
+            return t
+
+
+def replace_emojis(content):
+    """
+    Replace emojis in content with data-icon attributes. Returns the new
+    content and the number of emoji occurrences found.
+    """
+    found = []
+    for candidate in EMOJI_START.finditer(content):
+        m = EMOJI_PATTERN.match(content, candidate.start())
+        if m and (not found or m.start() >= found[-1][1]):
+            found.append((m.start(), m.end(), m.group()))
+    if not found:
+        return content, 0
+    starts = [s for s, _, _ in found]
+    by_emoji = {}
+    for i, (_, _, emoji) in enumerate(found):
+        by_emoji.setdefault(emoji, []).append(i)
+
+    # rules[i]: (rule, first index consumed, index copying resumes at)
+    rules = [None] * len(found)
+    n = len(content)
+    for emoji in sorted(by_emoji, key=EMOJI_RANK.get):
+        rank = EMOJI_RANK[emoji]
+        occurrences = by_emoji[emoji]
+
+        for i in occurrences:
+            s, e, _ = found[i]
+            if e < n and content[e].isspace():
+                t = element_close(content, s, found, starts, rules, rank)
+                if t is not None:
+                    rules[i] = (1, t + 1, whitespace_end(content, e))
+
+        match_end = 0
+        for i in occurrences:
+            s, e, _ = found[i]
+            if rules[i] or s < 1 or content[s - 1] != '>' or s - 1 < match_end:
+                continue
+            r = whitespace_end(content, e)
+            if r == e:
+                continue
+            j = bisect_left(starts, r)
+            at_tag = (r == n or content[r] == '<'
+                      or (j < len(found) and starts[j] == r and rules[j] and EMOJI_RANK[found[j][2]] < rank))
+            if not at_tag:
+                # The captured text runs to the next '<', original or inserted
+                tag = content.find('<', r)
+                tag = n if tag == -1 else tag
+                inserted = replaced_between(found, starts, rules, rank, r - 1, tag)
+                rules[i] = (2, s, r)
+                match_end = tag if inserted is None else min(tag, starts[inserted])
+            elif r - e >= 2:
+                # Backtracking leaves the last whitespace character as the capture
+                rules[i] = (2, s, r - 1)
+                match_end = r
+
+        last_consumed = -1
+        for i in occurrences:
+            s, e, _ = found[i]
+            if (not rules[i] and 0 < s and e < n and content[s - 1].isspace()
+                    and content[e].isspace() and s - 1 != last_consumed):
+                rules[i] = (3, s - 1, e + 1)
+                last_consumed = e
+
+        for i in occurrences:
+            s, e, _ = found[i]
+            if not rules[i] and content.startswith(':', e):
+                rules[i] = (4, s, e)
+
+    out = []
+    pos = 0
+    for (s, e, emoji), rule in zip(found, rules):
+        if not rule:
+            continue
+        kind, first, resume = rule
+        span = f'<span data-icon="{EMOJI_MAP[emoji]}"></span>'
+        if kind == 3:
+            # A neighbour may already have turned the leading whitespace into ' '
+            if first >= pos:
+                out.append(content[pos:first])
+                out.append(' ')
+            out.append(span + ' ')
+        else:
+            out.append(content[pos:first])
+            out.append(span if kind == 4 else span + ' ')
+        pos = resume
+    out.append(content[pos:])
+    return ''.join(out), len(found)
+
+
+@register('emojis', 'Static emojis become animated data-icon spans',
+          files=r'^(interactive-demos|paths|tools|ai-agents|ai-tutors|challenges|demos)/.+\.html$')
+def emojis(rel_path, content):
+    needs_library = not has_icon_library(content)
+    content, replaced = replace_emojis(content)
+    if replaced and needs_library:
+        content = add_icon_library(content)
+    return content, replaced
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Lab re-mapping
+# Each entry: (relative_path, new_lab_id, icon, card_title, card_desc, network, [tags])
+# Set new_lab_id = 'explore-mempool' to intentionally keep the existing card.
+REMAPS = [
+
+    # ── Builder ──────────────────────────────────────────────────────────────
+    # "Bitcoin Protocol Deep Dive" → decode-transaction shows the protocol in bytes
+    ('builder/stage-1/module-1.html', 'decode-transaction', '🧾',
+     'Decode a Bitcoin Transaction',
+     "Parse a raw transaction hex byte-by-byte — see the protocol in action, no abstraction.",
+     'mainnet', ['Mempool.space', '20 min']),
+
+    # "Proof of Work" → keep explore-mempool (blocks and hashrate are directly relevant)
+    ('builder/stage-1/module-3.html', 'explore-mempool', None, None, None, None, None),
+
+    # "Bitcoin Core Development" → verify-download (first step before contributing)
+    ('builder/stage-4/module-1.html', 'verify-download', '🔏',
+     'Verify a Bitcoin Core Download',
+     "Use GPG signatures and SHA256 to confirm software authenticity before running or contributing.",
+     'mainnet', ['GPG + Terminal', '15 min']),
+
+    # "Your First Contribution" → verify-download (verify every build you touch)
+    ('builder/stage-4/module-3.html', 'verify-download', '🔏',
+     'Verify a Bitcoin Software Download',
+     "Before contributing, always verify: SHA256 checksum + GPG signature from the developer.",
+     'mainnet', ['GPG + Terminal', '15 min']),
+
+    # ── Curious ───────────────────────────────────────────────────────────────
+    # "What is Money?" → keep explore-mempool (seeing live Bitcoin transactions illustrates money)
+    ('curious/stage-1/module-1.html', 'explore-mempool', None, None, None, None, None),
+
+    # "Problems with Traditional Money" → first-address (move from problem to alternative)
+    ('curious/stage-1/module-2.html', 'first-address', '🔑',
+     'Generate Your First Bitcoin Address',
+     "Move from theory to practice: create a real Bitcoin address on the signet test network.",
+     'signet', ['Sparrow Wallet', '10 min']),
+
+    # "Enter Bitcoin" → full setup walkthrough (enter Bitcoin by actually using it)
+    ('curious/stage-1/module-3.html', 'sparrow-sparrow-import', '🚀',
+     'Complete Bitcoin Setup Walkthrough',
+     "Install Sparrow, create your wallet, back up your seed, and send your first test transaction.",
+     'signet', ['Sparrow Wallet', '30 min']),
+
+    # "How Bitcoin Works" → keep explore-mempool (mempool visualizes how txs propagate)
+    ('curious/stage-2/module-1.html', 'explore-mempool', None, None, None, None, None),
+
+    # ── Observer ──────────────────────────────────────────────────────────────
+    # "Reading the Bitcoin Price" → keep explore-mempool (on-chain context complements price data)
+    ('observer/stage-1/module-1.html', 'explore-mempool', None, None, None, None, None),
+
+    # ── Pragmatist ────────────────────────────────────────────────────────────
+    # "What is Bitcoin?" → full setup (pragmatist wants to use it, not just understand it)
+    ('pragmatist/stage-1/module-1.html', 'sparrow-sparrow-import', '🚀',
+     'Complete Bitcoin Setup Walkthrough',
+     "Skip straight to doing: install Sparrow, create a wallet, back up your seed, send a test transaction.",
+     'signet', ['Sparrow Wallet', '30 min']),
+
+    # "Bitcoin Economics & Strategy" → fee-estimation (economic decisions = fee strategy)
+    ('pragmatist/stage-2/module-7-economics.html', 'fee-estimation', '📊',
+     'Estimate and Control Transaction Fees',
+     "Choose the right fee for your timeframe — and bump a stuck transaction using RBF.",
+     'signet', ['Sparrow Wallet', '15 min']),
+
+    # ── Principled ────────────────────────────────────────────────────────────
+    # Stage 1: Philosophy of rules and value
+    # "Law of Conservation of Value" → decode-transaction (rules enforced without authority)
+    ('principled/stage-1/module-1.html', 'decode-transaction', '🧾',
+     'Read a Raw Bitcoin Transaction',
+     "See how Bitcoin enforces its rules in code — value conserved by cryptography, not trust.",
+     'mainnet', ['Mempool.space', '20 min']),
+
+    # "Entropy and Corruption" → verify-download (entropy: corrupt downloads are real)
+    ('principled/stage-1/module-2.html', 'verify-download', '🔏',
+     'Verify Your Bitcoin Software',
+     "Entropy and corruption are real — verify every download with GPG before trusting it.",
+     'mainnet', ['GPG + Terminal', '15 min']),
+
+    # "The Role of Rules" → address-types (rules encoded in Bitcoin script)
+    ('principled/stage-1/module-3.html', 'address-types', '🔖',
+     'Explore Bitcoin Address Types',
+     "Rules encoded in script: see how each address type enforces different spending conditions.",
+     'mainnet', ['Sparrow Wallet', '15 min']),
+
+    # Stage 2: Coordination, corruption, trust
+    # "The Coordination Problem" → coin-control (coordinating UTXOs = coordination theory)
+    ('principled/stage-2/module-1.html', 'coin-control', '🎛️',
+     'Practice Coin Control for Privacy',
+     "Coordination at the UTXO level: choose which coins to combine and what history you reveal.",
+     'signet', ['Sparrow Wallet', '20 min']),
+
+    # "The Corruption Curve" → passphrase-wallet (isolation protects against corruption)
+    ('principled/stage-2/module-2.html', 'passphrase-wallet', '🔐',
+     'Create a Passphrase-Protected Wallet',
+     "Separation prevents corruption: add a 25th word and explore plausible deniability.",
+     'signet', ['Sparrow Wallet', '20 min']),
+
+    # "Trust, Power, and Accountability" → cold-storage-setup (trust through architecture)
+    ('principled/stage-2/module-3.html', 'cold-storage-setup', '🧊',
+     'Set Up Cold Storage',
+     "Trust through architecture: simulate an air-gapped signing wallet and watch-only companion.",
+     'signet', ['Sparrow Wallet', '30 min']),
+
+    # Stage 3: Ledger, truth, memory
+    # "The Ledger as Civilization's Memory" → keep explore-mempool (the ledger IS the mempool)
+    ('principled/stage-3/module-2.html', 'explore-mempool', None, None, None, None, None),
+
+    # "The Cost of Truth" → decode-transaction (truth costs: every byte has a fee)
+    ('principled/stage-3/module-3.html', 'decode-transaction', '🧾',
+     'Decode a Bitcoin Transaction',
+     "The cost of truth: parse every byte — inputs, outputs, fees, locking scripts.",
+     'mainnet', ['Mempool.space', '20 min']),
+
+    # Stage 4: Physics, incentives, organisms
+    # "The Physics of Proof" → fee-estimation (proof of work is fee market energy)
+    ('principled/stage-4/module-1.html', 'fee-estimation', '⚡',
+     'Estimate Transaction Fees',
+     "The physics of proof-of-work made tangible: fee markets express real energy and time costs.",
+     'signet', ['Sparrow Wallet', '15 min']),
+
+    # "Incentives and Game Theory" → lightning-routing (routing fees = game theory live)
+    ('principled/stage-4/module-2.html', 'lightning-routing', '🔀',
+     'Explore Lightning Network Routing',
+     "Game theory in action: nodes compete, cooperate, and earn fees routing payments.",
+     'mainnet', ['amboss.space', '15 min']),
+
+    # "Bitcoin as a Living Organism" → sparrow-watch-only (observe without interfering)
+    ('principled/stage-4/module-3.html', 'sparrow-watch-only', '👁️',
+     'Create a Watch-Only Wallet',
+     "Observe without touching: monitor an address\'s balance and history without holding keys.",
+     'signet', ['Sparrow Wallet', '20 min']),
+
+    # Stage 5: Energy, verification, coordination
+    # "Energy Civilization" → keep explore-mempool (hashrate/energy context is relevant)
+    ('principled/stage-5/module-1.html', 'explore-mempool', None, None, None, None, None),
+
+    # "Verification Culture" → verify-download (verification culture = this exact skill)
+    ('principled/stage-5/module-2.html', 'verify-download', '🔏',
+     'Verify Bitcoin Software Authenticity',
+     "Verification culture practiced: GPG-sign, hash-check, and trust nothing unconfirmed.",
+     'mainnet', ['GPG + Terminal', '15 min']),
+
+    # "The Future of Human Coordination" → inheritance-drill (multigenerational coordination)
+    ('principled/stage-5/module-3.html', 'inheritance-drill', '📜',
+     'Bitcoin Inheritance Drill',
+     "Long-term coordination tested: verify your documentation is complete enough for an heir.",
+     'signet', ['Sparrow Wallet', '25 min']),
+
+    # ── Sovereign ─────────────────────────────────────────────────────────────
+    # "Bitcoin Privacy Fundamentals" → coin-control (the primary privacy tool)
+    ('sovereign/stage-2/module-1.html', 'coin-control', '🎛️',
+     'Coin Control for Privacy',
+     "Privacy fundamentals in practice: select UTXOs deliberately and understand what the blockchain reveals.",
+     'signet', ['Sparrow Wallet', '20 min']),
+]
+
+
+def make_card(lab_id, icon, title, desc, network, tags):
+    """HTML for a lab card"""
+    net_cls = ' signet' if network == 'signet' else ' mainnet'
+    tags_html = f'<span class="lab-card-tag{net_cls}">{network}</span>'
+    for t in tags:
+        tags_html += f'<span class="lab-card-tag">{t}</span>'
+    # Use single quotes inside onclick to avoid escaping issues
+    return (
+        f'<div class="lab-card" data-lab="{lab_id}" '
+        f"onclick=\"openLab('{lab_id}')\" style=\"cursor:pointer;\">\n"
+        f'    <div class="lab-card-icon">{icon}</div>\n'
+        f'    <div class="lab-card-body">\n'
+        f'        <div class="lab-card-eyebrow">⚡ Try It Now</div>\n'
+        f'        <h3>{title}</h3>\n'
+        f'        <p>{desc}</p>\n'
+        f'        <div class="lab-card-meta">\n'
+        f'            {tags_html}\n'
+        f'        </div>\n'
+        f'    </div>\n'
+        f'    <div class="lab-card-arrow">→</div>\n'
+        f'</div>'
+    )
+
+
+def find_card_end(content, start_idx):
+    """Index just past the </div> closing the card that starts at start_idx, or -1"""
+    depth = 0
+    i = start_idx
+    while i < len(content):
+        if content[i:i+4] == '<div':
+            depth += 1
+        elif content[i:i+6] == '</div>':
+            depth -= 1
+            if depth == 0:
+                return i + 6
+        i += 1
+    return -1
+
+
+LAB_MARKER = '<div class="lab-card" data-lab="explore-mempool"'
+LAB_REMAPS = {entry[0]: entry for entry in REMAPS}
+
+
+@register('labs', 'Over-assigned explore-mempool lab cards get topical labs',
+          files='^paths/(?:' + '|'.join(re.escape(entry[0]) for entry in REMAPS
+                                        if entry[1] != 'explore-mempool') + ')$')
+def labs(rel_path, content):
+    _, new_lab, icon, title, desc, network, tags = LAB_REMAPS[rel_path[len('paths/'):]]
+    start_idx = content.find(LAB_MARKER)
+    if start_idx == -1:
+        return content, 0
+    end_idx = find_card_end(content, start_idx)
+    if end_idx == -1:
+        raise ValueError('explore-mempool card has no closing </div>')
+    new_card = make_card(new_lab, icon, title, desc, network, tags)
+    return content[:start_idx] + new_card + content[end_idx:], 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
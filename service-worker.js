@@ -49,6 +49,21 @@ self.addEventListener('fetch', event => {
   // Skip non-GET requests
   if (event.request.method !== 'GET') return;
 
+  // Search index manifest: network first, so a rebuilt index is picked up.
+  // The shards it names are content-hashed and fine to serve from cache.
+  if (new URL(event.request.url).pathname === '/search-index/manifest.json') {
+    event.respondWith(
+      fetch(event.request).then(response => {
+        if (response.status === 200) {
+          const responseToCache = response.clone();
+          caches.open(CACHE_NAME).then(cache => cache.put(event.request, responseToCache));
+        }
+        return response;
+      }).catch(() => caches.match(event.request))
+    );
+    return;
+  }
+
   event.respondWith(
     caches.match(event.request)
       .then(response => {
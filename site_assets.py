@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Page Transfer-Weight Budgets for Bitcoin Sovereign Academy
+Follows each page's <script src>, stylesheets (and their @import / url()
+references) and images into an asset dependency graph, then totals the
+bytes each page pulls in, raw and gzip-estimated.
+
+Usage:
+    python3 check-links.py --budget            # default critical budget
+    python3 check-links.py --budget 250        # critical gzip budget in KB
+"""
+
+import gzip
+import json
+import os
+from pathlib import Path
+
+from site_corpus import CACHE_DIR, CSS_URL_PATTERN
+from site_routes import normalize_link
+
+# Files worth gzip-estimating; everything else is already compressed
+COMPRESSIBLE = {'.html', '.htm', '.js', '.mjs', '.css', '.svg', '.json', '.txt', '.xml'}
+SIZES_FILE = 'asset-sizes.json'
+
+# Default gzip-estimated budget for a page's critical bytes (HTML, CSS, JS)
+DEFAULT_BUDGET_KB = 120
+
+
+class AssetSizer:
+    """
+    Raw and gzip-estimated size per served file. The gzip figure is
+    persisted under .cache/ keyed by size and mtime, so unchanged assets are
+    compressed once across runs.
+    """
+
+    def __init__(self, root_dir):
+        self.root = Path(root_dir)
+        self.cache_path = self.root / CACHE_DIR / SIZES_FILE
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                self.cache = json.load(f)
+        except (OSError, ValueError):
+            self.cache = {}
+        self.sizes = {}
+
+    def size(self, served):
+        """(raw bytes, gzip-estimated bytes) for a served site path"""
+        if served in self.sizes:
+            return self.sizes[served]
+        file_path = self.root / served.lstrip('/')
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return self.sizes.setdefault(served, (0, 0))
+        cached = self.cache.get(served)
+        if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+            gzipped = cached[2]
+        elif Path(served).suffix.lower() in COMPRESSIBLE:
+            with open(file_path, 'rb') as f:
+                gzipped = len(gzip.compress(f.read(), compresslevel=6))
+            self.cache[served] = [stat.st_size, stat.st_mtime_ns, gzipped]
+        else:
+            gzipped = stat.st_size
+        return self.sizes.setdefault(served, (stat.st_size, gzipped))
+
+    def save(self):
+        self.cache_path.parent.mkdir(exist_ok=True)
+        with open(self.cache_path, 'w', encoding='utf-8') as f:
+            json.dump(self.cache, f, separators=(',', ':'))
+
+
+class AssetGraph:
+    """
+    Page -> asset dependency graph resolved through the route table.
+    Stylesheets are expanded transitively through @import and url(); each
+    CSS file is read at most once per run.
+    """
+
+    def __init__(self, routes, sizer):
+        self.routes = routes
+        self.sizer = sizer
+        self._css_deps = {}
+
+    def resolve(self, base_path, ref):
+        """Served file for an asset reference, 'external', or None if missing/ignored"""
+        ref = ref.strip()
+        if not ref or ref.startswith(('data:', '#', 'about:', 'blob:', 'javascript:')):
+            return None
+        if ref.startswith(('http://', 'https://', '//')):
+            return 'external'
+        path = normalize_link(base_path, ref)
+        if path is None:
+            return None
+        exists, target, _ = self.routes.lookup(path)
+        return self.routes.site.served_file(target) if exists else None
+
+    def css_dependencies(self, css_file):
+        """(imported stylesheets, url() assets) referenced by a CSS file"""
+        if css_file in self._css_deps:
+            return self._css_deps[css_file]
+        self._css_deps[css_file] = ([], [])  # guards against @import cycles
+        imports, urls = [], []
+        try:
+            with open(self.sizer.root / css_file.lstrip('/'), 'r', encoding='utf-8', errors='replace') as f:
+                css = f.read()
+        except OSError:
+            css = ''
+        for match in CSS_URL_PATTERN.finditer(css):
+            url, imported = match.groups()
+            served = self.resolve(css_file, url or imported)
+            if served and served != 'external':
+                if imported or served.endswith('.css'):
+                    imports.append(served)
+                else:
+                    urls.append(served)
+        self._css_deps[css_file] = (imports, urls)
+        return imports, urls
+
+    def page_assets(self, page_path, record):
+        """
+        Resolve a page's sub-resources. Returns {'critical': set, 'deferred':
+        set, 'external': [refs]}: critical is scripts plus the stylesheet
+        closure; deferred is images, icons and CSS url() resources.
+        """
+        assets = record['assets']
+        critical, deferred, external = set(), set(), []
+
+        def add(ref, bucket):
+            served = self.resolve(page_path, ref)
+            if served == 'external':
+                external.append(ref)
+            elif served:
+                bucket.add(served)
+            return served
+
+        for ref in assets['script']:
+            add(ref, critical)
+
+        pending = []
+        for ref in assets['stylesheet']:
+            served = add(ref, critical)
+            if served and served != 'external':
+                pending.append(served)
+        while pending:
+            imports, urls = self.css_dependencies(pending.pop())
+            deferred.update(urls)
+            for css_file in imports:
+                if css_file not in critical:
+                    critical.add(css_file)
+                    pending.append(css_file)
+
+        for ref in assets['image'] + assets['css_url']:
+            add(ref, deferred)
+
+        return {'critical': critical, 'deferred': deferred - critical, 'external': external}
+
+    def page_weight(self, page_path, record):
+        """Byte totals for one page, including its own HTML"""
+        resolved = self.page_assets(page_path, record)
+        html_raw, html_gzip = self.sizer.size(page_path)
+        critical = [(f, *self.sizer.size(f)) for f in sorted(resolved['critical'])]
+        deferred = [(f, *self.sizer.size(f)) for f in sorted(resolved['deferred'])]
+        critical_raw = html_raw + sum(raw for _, raw, _ in critical)
+        critical_gzip = html_gzip + sum(gz for _, _, gz in critical)
+        return {
+            'page': page_path,
+            'critical_raw': critical_raw,
+            'critical_gzip': critical_gzip,
+            'total_raw': critical_raw + sum(raw for _, raw, _ in deferred),
+            'total_gzip': critical_gzip + sum(gz for _, _, gz in deferred),
+            'critical': critical,
+            'deferred': deferred,
+            'external': resolved['external'],
+        }
+
+
+def kb(size):
+    return f"{size / 1024:.1f} KB"
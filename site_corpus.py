@@ -0,0 +1,451 @@
+#!/usr/bin/env python3
+"""
+Site Corpus Index for Bitcoin Sovereign Academy
+Parses every HTML page exactly once into a compact record that the link
+checker, navigation reports and content audit scripts all share.
+
+Parsed records are cached on disk in .cache/site-corpus.sqlite3, keyed by
+file size, mtime and content hash, so re-runs only re-parse changed pages.
+
+Run directly to print a short summary of the index:
+    python3 site_corpus.py
+    python3 site_corpus.py --no-cache
+"""
+
+import codecs
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from html.parser import HTMLParser
+from pathlib import Path
+
+# Directories that never contain site pages
+SKIP_DIRS = {'node_modules', '.git', 'dist', 'build', '.cache'}
+
+# On-disk parse cache, relative to the site root
+CACHE_DIR = '.cache'
+CACHE_FILE = 'site-corpus.sqlite3'
+# Bump whenever the record schema changes so stale records are discarded
+CACHE_VERSION = 3
+
+# Elements whose text is collected into the record
+HEADING_TAGS = ('h1', 'h2', 'h3')
+TEXT_TAGS = HEADING_TAGS + ('title', 'p', 'li')
+
+# Bytes read per step when streaming a page or hashing it
+READ_CHUNK = 64 * 1024
+
+# url(...) and @import references inside CSS
+CSS_URL_PATTERN = re.compile(r"""url\(\s*['"]?([^'")]+?)['"]?\s*\)|@import\s+['"]([^'"]+)['"]""")
+
+
+def find_html_files(root_dir):
+    """Find all HTML files in the project, sorted by path"""
+    root_path = Path(root_dir)
+    html_files = []
+    for path in root_path.rglob('*.html'):
+        # Skip by directory name, not substring ('build' must not hide paths/builder)
+        if SKIP_DIRS.intersection(path.relative_to(root_path).parts[:-1]):
+            continue
+        html_files.append(path)
+    return sorted(html_files)
+
+
+def clean_text(parts):
+    """Join collected text fragments and collapse whitespace"""
+    return ' '.join(''.join(parts).split())
+
+
+def has_class(attrs, name):
+    """Check if a tag's class attribute contains the given class name"""
+    return name in (attrs.get('class') or '').split()
+
+
+class PageParser(HTMLParser):
+    """Single-pass parser that fills a page record while tokenizing"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.record = new_record()
+        # Text of every open title/heading/p/li/a/button lives in one shared
+        # buffer; each open element only remembers where its text starts, so
+        # nested elements never copy text and each data event is one append
+        self._text = []
+        self._text_frames = []   # open [tag, start] for title/headings/p/li
+        self._anchor = None      # [href, start] for the open <a>
+        self._button = None      # start of the open <button> inside nav
+        self._nav_depth = 0      # open <nav> count inside module-navigation
+        self._crumb = None       # [tag, depth] for the open breadcrumb element
+        self._raw_tag = None     # 'script', 'style' or 'jsonld' while inside one
+        self._raw = []           # text of the open JSON-LD script or <style>
+
+    # -- tokenizer callbacks ------------------------------------------------
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        record = self.record
+        href = attrs.get('href')
+        self._collect_attrs(tag, attrs)
+
+        if tag in ('script', 'style'):
+            is_jsonld = tag == 'script' and (attrs.get('type') or '').lower() == 'application/ld+json'
+            self._raw_tag = 'jsonld' if is_jsonld else tag
+            self._raw = []
+            return
+
+        if tag == 'nav':
+            if self._nav_depth:
+                self._nav_depth += 1
+            elif record['nav'] is None and has_class(attrs, 'module-navigation'):
+                record['nav'] = {'links': [], 'buttons': []}
+                self._nav_depth = 1
+
+        if self._crumb is not None:
+            if tag == self._crumb[0]:
+                self._crumb[1] += 1
+        elif not record['breadcrumb'] and has_class(attrs, 'breadcrumb'):
+            self._crumb = [tag, 1]
+
+        if tag == 'a' and href:
+            self._anchor = [href, len(self._text)]
+        elif tag == 'button' and self._nav_depth:
+            self._button = len(self._text)
+        elif tag in TEXT_TAGS:
+            self._text_frames.append([tag, len(self._text)])
+
+    def handle_startendtag(self, tag, attrs):
+        # Self-closing tags never open a text frame
+        self._collect_attrs(tag, dict(attrs))
+
+    def handle_endtag(self, tag):
+        record = self.record
+
+        if self._raw_tag:
+            if tag in ('script', 'style'):
+                if self._raw_tag == 'jsonld':
+                    self._finish_jsonld()
+                elif self._raw_tag == 'style':
+                    self._finish_style()
+                self._raw_tag = None
+            return
+
+        if tag == 'a' and self._anchor is not None:
+            href, start = self._anchor
+            pair = [href, clean_text(self._text[start:])]
+            record['anchors'].append(pair)
+            if self._nav_depth:
+                record['nav']['links'].append(pair)
+            if self._crumb is not None:
+                record['breadcrumb'].append(pair)
+            self._anchor = None
+        elif tag == 'button' and self._button is not None:
+            record['nav']['buttons'].append(clean_text(self._text[self._button:]))
+            self._button = None
+        elif tag in TEXT_TAGS:
+            self._close_text_frame(tag)
+        if not self._text_frames and self._anchor is None and self._button is None:
+            self._text.clear()
+
+        if tag == 'nav' and self._nav_depth:
+            self._nav_depth -= 1
+        if self._crumb is not None and tag == self._crumb[0]:
+            self._crumb[1] -= 1
+            if not self._crumb[1]:
+                self._crumb = None
+
+    def handle_data(self, data):
+        if self._raw_tag:
+            if self._raw_tag != 'script':
+                self._raw.append(data)
+            return
+        if self._text_frames or self._anchor is not None or self._button is not None:
+            self._text.append(data)
+
+    def close(self):
+        super().close()
+        while self._text_frames:
+            self._close_text_frame(self._text_frames[-1][0])
+        self.record['ids'] = list(dict.fromkeys(self.record['ids']))
+        return self.record
+
+    # -- helpers --------------------------------------------------------------
+
+    def _collect_attrs(self, tag, attrs):
+        """Links, fragment targets and asset references carried by any tag"""
+        record = self.record
+        href = attrs.get('href')
+        if href:
+            record['links'].append(href)
+        src = attrs.get('src')
+        if src:
+            record['srcs'].append(src)
+
+        # Fragment targets: any id, plus the legacy <a name>
+        if attrs.get('id'):
+            record['ids'].append(attrs['id'])
+        if tag == 'a' and attrs.get('name'):
+            record['ids'].append(attrs['name'])
+
+        assets = record['assets']
+        if tag == 'script' and src:
+            assets['script'].append(src)
+        elif tag == 'link' and href:
+            rel = (attrs.get('rel') or '').lower().split()
+            if 'stylesheet' in rel:
+                assets['stylesheet'].append(href)
+            elif 'icon' in rel:
+                assets['image'].append(href)
+        elif tag == 'img' and src:
+            assets['image'].append(src)
+
+    def _close_text_frame(self, tag):
+        """Close the innermost open frame for tag, plus any left unclosed inside it"""
+        for i in range(len(self._text_frames) - 1, -1, -1):
+            if self._text_frames[i][0] == tag:
+                break
+        else:
+            return
+        closing = self._text_frames[i:]
+        del self._text_frames[i:]
+        for frame_tag, start in reversed(closing):
+            text = clean_text(self._text[start:])
+            if frame_tag == 'title':
+                if not self.record['title']:
+                    self.record['title'] = text
+            elif text:
+                key = {'p': 'paragraphs', 'li': 'lists'}.get(frame_tag)
+                if key:
+                    self.record[key].append(text)
+                else:
+                    self.record['headings'][frame_tag].append(text)
+
+    def _finish_style(self):
+        css = ''.join(self._raw)
+        for url, imported in CSS_URL_PATTERN.findall(css):
+            self.record['assets']['css_url'].append(url or imported)
+
+    def _finish_jsonld(self):
+        raw = ''.join(self._raw).strip()
+        if not raw:
+            return
+        try:
+            self.record['jsonld'].append(json.loads(raw))
+        except ValueError:
+            self.record['jsonld'].append({'error': 'invalid JSON-LD', 'raw': raw[:200]})
+
+
+def new_record():
+    """Empty page record; every key is always present"""
+    return {
+        'title': '',
+        'links': [],        # every href attribute, in document order
+        'srcs': [],         # every src attribute, in document order
+        'anchors': [],      # [href, text] for each <a href>
+        'nav': None,        # {'links': [[href, text]], 'buttons': [text]} for nav.module-navigation
+        'breadcrumb': [],   # [href, text] links inside the first .breadcrumb element
+        'headings': {tag: [] for tag in HEADING_TAGS},
+        'paragraphs': [],
+        'lists': [],
+        'jsonld': [],
+        'ids': [],          # unique id / <a name> values, i.e. valid #fragments
+        # Sub-resources the page loads: <script src>, stylesheets, <img>/icons,
+        # and url()/@import references in inline <style> blocks
+        'assets': {'script': [], 'stylesheet': [], 'image': [], 'css_url': []},
+    }
+
+
+def parse_html(content):
+    """Parse an HTML string into a page record"""
+    parser = PageParser()
+    parser.feed(content)
+    return parser.close()
+
+
+def parse_bytes(data):
+    """Parse raw UTF-8 page bytes. Returns None if they do not decode."""
+    try:
+        content = data.decode('utf-8')
+    except UnicodeDecodeError:
+        return None
+    return parse_html(content)
+
+
+def parse_page(file_path):
+    """
+    Stream one HTML file through the parser in fixed-size chunks, so the
+    page is never held in memory as a whole. Returns None if it cannot be
+    read or is not valid UTF-8.
+    """
+    parser = PageParser()
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    try:
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(READ_CHUNK), b''):
+                parser.feed(decoder.decode(chunk))
+        parser.feed(decoder.decode(b'', final=True))
+    except (OSError, UnicodeDecodeError):
+        return None
+    return parser.close()
+
+
+class CorpusCache:
+    """
+    SQLite store of parsed page records.
+
+    A cached record is reused when the file's size and mtime are unchanged.
+    When they differ the file is hashed, and only re-parsed if its content
+    actually changed (a touch or checkout refreshes the stat without a parse).
+    """
+
+    def __init__(self, root_dir):
+        cache_dir = Path(root_dir) / CACHE_DIR
+        cache_dir.mkdir(exist_ok=True)
+        self.conn = sqlite3.connect(cache_dir / CACHE_FILE)
+        if self.conn.execute('PRAGMA user_version').fetchone()[0] != CACHE_VERSION:
+            self.conn.execute('DROP TABLE IF EXISTS pages')
+            self.conn.execute(f'PRAGMA user_version = {CACHE_VERSION}')
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS pages ('
+            ' path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER,'
+            ' sha256 TEXT, record TEXT)'
+        )
+        # Only the keys are held in memory; records are fetched on a hit
+        self.rows = {row[0]: row[1:] for row in self.conn.execute(
+            'SELECT path, size, mtime_ns, sha256 FROM pages')}
+        self.hits = 0
+        self.parsed = 0
+
+    def lookup(self, rel_path, file_path):
+        """
+        Return (record, key) for a page.
+
+        record is None when the page must be (re-)parsed; key is the
+        (size, mtime_ns, sha256) to store with the new record, or None if the
+        file cannot be read at all.
+        """
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None, None
+        cached = self.rows.get(rel_path)
+        if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+            self.hits += 1
+            return self._record(rel_path), None
+
+        try:
+            digest = hashlib.sha256()
+            with open(file_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(READ_CHUNK), b''):
+                    digest.update(chunk)
+            digest = digest.hexdigest()
+        except OSError:
+            return None, None
+        key = (stat.st_size, stat.st_mtime_ns, digest)
+
+        if cached and cached[2] == digest:
+            # Touched but not edited: refresh the stat, keep the record
+            self.hits += 1
+            self.conn.execute('UPDATE pages SET size = ?, mtime_ns = ? WHERE path = ?',
+                              (stat.st_size, stat.st_mtime_ns, rel_path))
+            return self._record(rel_path), None
+        return None, key
+
+    def _record(self, rel_path):
+        row = self.conn.execute('SELECT record FROM pages WHERE path = ?', (rel_path,)).fetchone()
+        return json.loads(row[0])
+
+    def store(self, rel_path, key, record):
+        """Save a freshly parsed record under its (size, mtime_ns, sha256) key"""
+        self.parsed += 1
+        record_json = json.dumps(record, ensure_ascii=False, separators=(',', ':'))
+        self.conn.execute('INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?)',
+                          (rel_path, *key, record_json))
+
+    def prune(self, keep):
+        """Drop cached pages that are no longer part of the site"""
+        stale = [(path,) for path in self.rows if path not in keep]
+        self.conn.executemany('DELETE FROM pages WHERE path = ?', stale)
+
+    def close(self):
+        self.conn.commit()
+        self.conn.close()
+
+
+def parse_pages(file_paths, jobs=1):
+    """Parse many pages, across a process pool when jobs > 1"""
+    if jobs > 1 and len(file_paths) > 1:
+        chunksize = max(1, len(file_paths) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            return list(pool.map(parse_page, file_paths, chunksize=chunksize))
+    return [parse_page(file_path) for file_path in file_paths]
+
+
+def load_corpus(root_dir, files=None, use_cache=True, jobs=1):
+    """
+    Parse the site into {relative posix path: record}.
+
+    files defaults to every HTML page under root_dir. Unreadable pages are
+    reported and left out of the index. With use_cache, unchanged pages are
+    served from the on-disk cache instead of being re-parsed; the pages that
+    do need parsing are spread over jobs worker processes.
+    """
+    root_path = Path(root_dir)
+    full_scan = files is None
+    if full_scan:
+        files = find_html_files(root_path)
+
+    cache = CorpusCache(root_path) if use_cache else None
+    records = {}
+    pending = []  # (rel_path, file_path, cache key) still to be parsed
+    try:
+        for file_path in sorted(files):
+            rel_path = Path(file_path).relative_to(root_path).as_posix()
+            if cache:
+                record, key = cache.lookup(rel_path, file_path)
+                if record is None and key is None:
+                    print(f"⚠ Could not read {file_path}")
+                    continue
+                records[rel_path] = record
+                if record is None:
+                    pending.append((rel_path, file_path, key))
+            else:
+                records[rel_path] = None
+                pending.append((rel_path, file_path, None))
+
+        parsed = parse_pages([file_path for _, file_path, _ in pending], jobs)
+        for (rel_path, file_path, key), record in zip(pending, parsed):
+            if record is None:
+                print(f"⚠ Could not read {file_path}")
+                del records[rel_path]
+                continue
+            records[rel_path] = record
+            if cache:
+                cache.store(rel_path, key, record)
+
+        if cache and full_scan:
+            cache.prune(records)
+    finally:
+        if cache:
+            cache.close()
+    return records
+
+
+def main():
+    root_dir = Path(__file__).parent
+    corpus = load_corpus(root_dir, use_cache='--no-cache' not in sys.argv)
+
+    print(f"Indexed {len(corpus)} HTML pages")
+    print(f"  links:       {sum(len(r['links']) for r in corpus.values())}")
+    print(f"  srcs:        {sum(len(r['srcs']) for r in corpus.values())}")
+    print(f"  module navs: {sum(1 for r in corpus.values() if r['nav'])}")
+    print(f"  breadcrumbs: {sum(1 for r in corpus.values() if r['breadcrumb'])}")
+    print(f"  paragraphs:  {sum(len(r['paragraphs']) for r in corpus.values())}")
+    print(f"  JSON-LD:     {sum(len(r['jsonld']) for r in corpus.values())}")
+
+
+if __name__ == '__main__':
+    main()
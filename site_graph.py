@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Site Link Graph for Bitcoin Sovereign Academy
+Compact page-to-page link graph built from the edges check-links.py
+resolves: integer node ids and array-backed (CSR) edge lists, with BFS
+reachability from the site entry points.
+
+Usage:
+    python3 check-links.py --graph
+    python3 check-links.py --graph-json graph.json --graphml graph.graphml
+"""
+
+from array import array
+from collections import deque
+import json
+from xml.etree import ElementTree as ET
+
+# Pages a visitor can land on without following a link
+ENTRY_POINTS = ('/index.html', '/paths/index.html')
+
+
+class LinkGraph:
+    """
+    Directed graph over site pages.
+
+    Node ids index the sorted page list. Out-edges of node n are
+    targets[offsets[n]:offsets[n + 1]], so the whole graph is two flat
+    unsigned int arrays.
+    """
+
+    def __init__(self, pages, edges):
+        self.nodes = sorted(pages)
+        self.node_id = {path: i for i, path in enumerate(self.nodes)}
+
+        adjacency = [set() for _ in self.nodes]
+        for source, target in edges:
+            s = self.node_id.get(source)
+            t = self.node_id.get(target)
+            if s is not None and t is not None and s != t:
+                adjacency[s].add(t)
+
+        self.offsets = array('I', [0])
+        self.targets = array('I')
+        for neighbours in adjacency:
+            self.targets.extend(sorted(neighbours))
+            self.offsets.append(len(self.targets))
+
+        self.in_degree = array('I', bytes(4 * len(self.nodes)))
+        for t in self.targets:
+            self.in_degree[t] += 1
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def edge_count(self):
+        return len(self.targets)
+
+    def out_degree(self, n):
+        return self.offsets[n + 1] - self.offsets[n]
+
+    def successors(self, n):
+        return self.targets[self.offsets[n]:self.offsets[n + 1]]
+
+    def click_depths(self, roots=ENTRY_POINTS):
+        """Shortest click depth from any root per node (-1 = unreachable), by BFS"""
+        depth = array('i', [-1]) * len(self.nodes)
+        queue = deque()
+        for root in roots:
+            n = self.node_id.get(root)
+            if n is not None and depth[n] < 0:
+                depth[n] = 0
+                queue.append(n)
+        offsets, targets = self.offsets, self.targets
+        while queue:
+            n = queue.popleft()
+            next_depth = depth[n] + 1
+            for i in range(offsets[n], offsets[n + 1]):
+                t = targets[i]
+                if depth[t] < 0:
+                    depth[t] = next_depth
+                    queue.append(t)
+        return depth
+
+    def analyze(self, roots=ENTRY_POINTS):
+        """
+        Reachability report: orphans (unreachable from every root), pages
+        with no inbound links, and dead-end modules (module pages that link
+        to no other page).
+        """
+        depth = self.click_depths(roots)
+        reachable = [n for n in range(len(self.nodes)) if depth[n] >= 0]
+        return {
+            'roots': [root for root in roots if root in self.node_id],
+            'depth': depth,
+            'reachable': len(reachable),
+            'orphans': [self.nodes[n] for n in range(len(self.nodes)) if depth[n] < 0],
+            'no_inbound': [self.nodes[n] for n in range(len(self.nodes))
+                           if not self.in_degree[n] and self.nodes[n] not in roots],
+            'dead_end_modules': [self.nodes[n] for n in range(len(self.nodes))
+                                 if is_module_page(self.nodes[n]) and not self.out_degree(n)],
+            'max_depth': max((depth[n] for n in reachable), default=0),
+        }
+
+    def to_json(self, report):
+        """Node table plus [source, target] id pairs"""
+        depth = report['depth']
+        return {
+            'roots': report['roots'],
+            'nodes': [{'id': n, 'path': path, 'depth': depth[n],
+                       'out': self.out_degree(n), 'in': self.in_degree[n]}
+                      for n, path in enumerate(self.nodes)],
+            'edges': [[n, t] for n in range(len(self.nodes)) for t in self.successors(n)],
+        }
+
+    def write_json(self, file_path, report):
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_json(report), f, separators=(',', ':'))
+
+    def write_graphml(self, file_path, report):
+        depth = report['depth']
+        root = ET.Element('graphml', xmlns='http://graphml.graphdrawing.org/xmlns')
+        for key, name, kind in (('d0', 'path', 'string'), ('d1', 'depth', 'int')):
+            ET.SubElement(root, 'key', {'id': key, 'for': 'node', 'attr.name': name, 'attr.type': kind})
+        graph = ET.SubElement(root, 'graph', id='site', edgedefault='directed')
+        for n, path in enumerate(self.nodes):
+            node = ET.SubElement(graph, 'node', id=f'n{n}')
+            ET.SubElement(node, 'data', key='d0').text = path
+            ET.SubElement(node, 'data', key='d1').text = str(depth[n])
+        for n in range(len(self.nodes)):
+            for t in self.successors(n):
+                ET.SubElement(graph, 'edge', source=f'n{n}', target=f'n{t}')
+        ET.indent(root)
+        ET.ElementTree(root).write(file_path, encoding='utf-8', xml_declaration=True)
+
+
+def is_module_page(path):
+    name = path.rsplit('/', 1)[-1]
+    return path.startswith('/paths/') and name.startswith('module-')
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Site Route Resolution for Bitcoin Sovereign Academy
+Walks the tree once into an in-memory set of servable site paths so link
+checks are hash lookups instead of filesystem stats, and resolves links
+through the same redirects, rewrites and cleanUrls rules as production
+(vercel.json).
+
+Run directly to resolve a link against a page:
+    python3 site_routes.py /paths/curious/stage-1/module-2.html module-1.html
+"""
+
+import json
+import os
+import posixpath
+import re
+import sys
+from pathlib import Path
+from urllib.parse import unquote
+
+from site_corpus import SKIP_DIRS
+
+
+def normalize_link(page_path, link):
+    """
+    Resolve a link found on page_path ('/dir/page.html') to a normalized
+    site path, dropping query string and fragment. Returns None for a
+    pure fragment or empty link.
+    """
+    link = link.split('#', 1)[0].split('?', 1)[0]
+    if not link:
+        return None
+    link = unquote(link)
+    if not link.startswith('/'):
+        link = posixpath.join(posixpath.dirname(page_path), link)
+    trailing_slash = link.endswith('/')
+    path = posixpath.normpath(link)
+    if path.startswith('//'):
+        path = '/' + path.lstrip('/')
+    if trailing_slash and path != '/':
+        path += '/'
+    return path
+
+
+def site_path(rel_path):
+    """Site path for a file given relative to the root ('a/b.html' -> '/a/b.html')"""
+    return '/' + Path(rel_path).as_posix().lstrip('/')
+
+
+def load_vercel_config(root_dir):
+    """vercel.json as a dict, or {} when the file is missing or invalid"""
+    try:
+        with open(Path(root_dir) / 'vercel.json', 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+class SitePaths:
+    """
+    Every path the static site can serve, built from one directory walk.
+
+    Alongside each file, the index holds the variants production answers for
+    it: '/dir/' and '/dir' for '/dir/index.html', and, when vercel.json
+    enables cleanUrls, '/page' for '/page.html'. Each variant maps to the file
+    actually served.
+    """
+
+    def __init__(self, root_dir, clean_urls=None):
+        self.root = Path(root_dir)
+        if clean_urls is None:
+            clean_urls = bool(load_vercel_config(self.root).get('cleanUrls'))
+        self.clean_urls = clean_urls
+        self.files = set()
+        self.paths = {}
+        self._walk()
+
+    def _walk(self):
+        root = str(self.root)
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+            rel_dir = os.path.relpath(dirpath, root)
+            base = '/' if rel_dir == '.' else '/' + rel_dir.replace(os.sep, '/') + '/'
+            for name in filenames:
+                self.add(base + name)
+
+    def add(self, path):
+        """Register a served file and its URL variants"""
+        self.files.add(path)
+        self.paths[path] = path
+        directory, name = path.rsplit('/', 1)
+        if name == 'index.html':
+            self.paths.setdefault(directory + '/', path)
+            if directory:
+                self.paths.setdefault(directory, path)
+        if self.clean_urls and name.endswith('.html'):
+            self.paths.setdefault(path[:-len('.html')], path)
+
+    def __contains__(self, path):
+        return path in self.paths
+
+    def __len__(self):
+        return len(self.files)
+
+    def served_file(self, path):
+        """The file served for a site path, or None"""
+        return self.paths.get(path)
+
+    def resolve(self, page_path, link):
+        """
+        Resolve a link found on page_path. Returns (site path, exists), or
+        (None, None) for links that do not point at a page.
+        """
+        path = normalize_link(page_path, link)
+        if path is None:
+            return None, None
+        return path, path in self.paths
+
+
+PARAM_PATTERN = re.compile(r':([A-Za-z_][A-Za-z0-9_]*)([*+?]?)')
+
+# Redirect chains longer than this are reported as broken
+MAX_REDIRECTS = 10
+
+
+def compile_source(source, prefix):
+    """
+    Translate a vercel.json source ('/semana-:week/:rest*', '/paths/(.*)')
+    into a regex fragment. Parameters become named groups prefixed with
+    prefix so many rules can share one compiled alternation. Returns
+    (fragment, [(param name, group name)]).
+    """
+    out = []
+    groups = []
+    i = 0
+    numbered = 0
+    while i < len(source):
+        char = source[i]
+        match = PARAM_PATTERN.match(source, i) if char == ':' else None
+        if match:
+            name, modifier = match.groups()
+            group = f'{prefix}_{name}'
+            groups.append((name, group))
+            segment = {'*': '.*', '+': '.+'}.get(modifier, '[^/]+')
+            # '/:path*' and '/:id?' also match without their leading slash
+            if modifier in ('*', '?') and out and out[-1] == '/':
+                out[-1] = f'(?:/(?P<{group}>{segment}))?'
+            else:
+                out.append(f'(?P<{group}>{segment})')
+            i = match.end()
+        elif char == '(':
+            depth, j = 0, i
+            while j < len(source):
+                depth += {'(': 1, ')': -1}.get(source[j], 0)
+                j += 1
+                if not depth:
+                    break
+            numbered += 1
+            group = f'{prefix}_{numbered}'
+            groups.append((str(numbered), group))
+            out.append(f'(?P<{group}>{source[i + 1:j - 1]})')
+            i = j
+        else:
+            out.append('/' if char == '/' else re.escape(char))
+            i += 1
+    return ''.join(out), groups
+
+
+def fill_destination(destination, params):
+    """Substitute ':name' and '$1' references in a rule destination"""
+    def param(match):
+        return params.get(match.group(1)) or ''
+    destination = PARAM_PATTERN.sub(param, destination)
+    return re.sub(r'\$(\d+)', lambda m: params.get(m.group(1)) or '', destination)
+
+
+class RuleSet:
+    """
+    An ordered list of vercel.json rules compiled into a single alternation.
+
+    The regex engine tries alternatives left to right, so the first matching
+    alternative is the first matching rule, exactly as Vercel evaluates them.
+    """
+
+    def __init__(self, rules):
+        self.rules = []
+        parts = []
+        for rule in rules:
+            # Host/header/cookie conditions never hold for links inside the site
+            if rule.get('has') or rule.get('missing'):
+                continue
+            index = len(self.rules)
+            fragment, groups = compile_source(rule['source'], f'r{index}')
+            parts.append(f'(?P<r{index}>{fragment})')
+            self.rules.append((rule['destination'], groups))
+        self.pattern = re.compile('^(?:' + '|'.join(parts) + ')$') if parts else None
+
+    def match(self, path):
+        """Return the filled-in destination of the first matching rule, or None"""
+        if self.pattern is None:
+            return None
+        match = self.pattern.match(path)
+        if match is None:
+            return None
+        destination, groups = self.rules[int(match.lastgroup[1:])]
+        params = {name: match.group(group) for name, group in groups}
+        return fill_destination(destination, params)
+
+
+class RouteTable:
+    """
+    Resolves site paths the way production does: redirects first, then the
+    filesystem (with directory index and cleanUrls variants), then rewrites.
+    Results are memoized per path, so repeated links cost one dict lookup.
+    """
+
+    def __init__(self, site, config=None):
+        self.site = site
+        if config is None:
+            config = load_vercel_config(site.root)
+        self.redirects = RuleSet(config.get('redirects', []))
+        self.rewrites = RuleSet(config.get('rewrites', []))
+        self._memo = {}
+
+    def lookup(self, path):
+        """
+        Resolve a normalized site path. Returns (exists, target, via) where
+        via is 'file', 'redirect', 'rewrite' or 'external' (a redirect off-site).
+        """
+        result = self._memo.get(path)
+        if result is None:
+            result = self._memo[path] = self._lookup(path, MAX_REDIRECTS)
+        return result
+
+    def _lookup(self, path, hops_left):
+        destination = self.redirects.match(path)
+        if destination is not None:
+            if is_external_url(destination):
+                return True, destination, 'external'
+            if not hops_left:
+                return False, destination, 'redirect'
+            exists, target, _ = self._lookup(normalize_link('/', destination), hops_left - 1)
+            return exists, target, 'redirect'
+
+        if path in self.site:
+            return True, path, 'file'
+
+        destination = self.rewrites.match(path)
+        if destination is not None:
+            if is_external_url(destination):
+                return True, destination, 'external'
+            target = normalize_link('/', destination)
+            return target in self.site, target, 'rewrite'
+
+        return False, path, 'file'
+
+    def resolve(self, page_path, link):
+        """
+        Resolve a link found on page_path. Returns (target, exists), or
+        (None, None) for links that do not point at a page.
+        """
+        path = normalize_link(page_path, link)
+        if path is None:
+            return None, None
+        exists, target, _ = self.lookup(path)
+        return target, exists
+
+
+def is_external_url(url):
+    return url.startswith(('http://', 'https://'))
+
+
+def main():
+    if len(sys.argv) != 3:
+        print(__doc__.strip())
+        return 2
+    routes = RouteTable(SitePaths(Path(__file__).parent))
+    path = normalize_link(sys.argv[1], sys.argv[2])
+    exists, target, via = routes.lookup(path)
+    print(f"{sys.argv[2]} -> {path} -> {target} [{via}] ({'found' if exists else 'missing'})")
+    return 0 if exists else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
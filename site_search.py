@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Static Search Index for Bitcoin Sovereign Academy
+Builds a prefix-sharded inverted index of the site's pages under
+/search-index/, for js/site-search.js to query in the browser.
+
+Every term lives in the shard named after its first two characters, so a
+query fetches one small shard per word. Shard and document-table files are
+named by content hash and never change once written, which lets the service
+worker cache them forever; only manifest.json is re-fetched to pick up a
+new build.
+
+The index is generated, not committed: vercel.json runs this script as
+the deployment's buildCommand, and /search-index/ is gitignored.
+
+Rebuilds are incremental: per-page term weights are kept in
+.cache/search-index.json, only changed pages are re-tokenized, document ids
+stay stable, and only shards whose postings changed are written. The
+deployment build passes --no-cache so nothing under .cache/ ends up in the
+published output directory.
+
+Usage:
+    python3 site_search.py
+    python3 site_search.py --rebuild     # ignore the saved state
+    python3 site_search.py --no-cache    # full build, read and write no .cache/ state
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import unicodedata
+from collections import Counter
+from pathlib import Path
+
+from site_corpus import CACHE_DIR, HEADING_TAGS, find_html_files, load_corpus
+from site_routes import load_vercel_config, site_path
+
+OUTPUT_DIR = 'search-index'
+STATE_FILE = 'search-index.json'
+# Bump whenever tokenizing, weighting or the file format changes
+INDEX_VERSION = 1
+
+# Terms are sharded by this many leading characters
+PREFIX_LENGTH = 2
+
+# Top-level directories and pages that are not public content
+EXCLUDE_DIRS = {'admin', 'archive', 'mockups', 'tests', 'drafts', 'templates', 'components', 'reports'}
+EXCLUDE_PAGES = {'404.html', 'search.html'}
+EXCLUDE_PATTERN = re.compile(r'^google[0-9a-f]+\.html$')
+
+# Per-occurrence weight of a term by where it appears
+FIELD_WEIGHTS = {'title': 5, 'h1': 4, 'h2': 2, 'h3': 2, 'p': 1, 'li': 1}
+
+STOP_WORDS = frozenset('''
+    a an and are as at be but by can do does for from has have how if in into is it
+    its not of on or so than that the their then there these this to was we what
+    when which who why will with you your
+    de del el en es la las lo los para por que se su un una y
+'''.split())
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+
+
+def tokenize(text):
+    """Lowercased, accent-stripped word tokens, stop words and single characters dropped"""
+    text = unicodedata.normalize('NFKD', text.lower())
+    text = ''.join(char for char in text if not unicodedata.combining(char))
+    return [token for token in TOKEN_PATTERN.findall(text)
+            if len(token) >= PREFIX_LENGTH and token not in STOP_WORDS]
+
+
+def page_terms(record):
+    """{term: weight} for a page record"""
+    weights = Counter()
+    fields = [('title', [record['title']])]
+    fields += [(tag, record['headings'][tag]) for tag in HEADING_TAGS]
+    fields += [('p', record['paragraphs']), ('li', record['lists'])]
+    for field, texts in fields:
+        weight = FIELD_WEIGHTS[field]
+        for text in texts:
+            for token in tokenize(text):
+                weights[token] += weight
+    return dict(weights)
+
+
+def is_indexed(rel_path):
+    parts = Path(rel_path).parts
+    if len(parts) > 1 and parts[0] in EXCLUDE_DIRS:
+        return False
+    name = parts[-1]
+    return name not in EXCLUDE_PAGES and not EXCLUDE_PATTERN.match(name)
+
+
+def page_url(rel_path, clean_urls):
+    """The URL production serves a page at ('/paths/curious/', '/about')"""
+    path = site_path(rel_path)
+    if path.endswith('/index.html'):
+        return path[:-len('index.html')]
+    if clean_urls and path.endswith('.html'):
+        return path[:-len('.html')]
+    return path
+
+
+def content_name(prefix, payload):
+    return f"{prefix}.{hashlib.sha256(payload).hexdigest()[:10]}.json"
+
+
+def encode(data):
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'), sort_keys=True).encode('utf-8')
+
+
+class SearchIndexBuilder:
+    """Incremental builder for the static search index"""
+
+    def __init__(self, root_dir, rebuild=False, use_cache=True):
+        self.root = Path(root_dir)
+        self.use_cache = use_cache
+        self.out_dir = self.root / OUTPUT_DIR
+        self.state_path = self.root / CACHE_DIR / STATE_FILE
+        self.clean_urls = bool(load_vercel_config(self.root).get('cleanUrls'))
+        self.pages = {}   # rel path -> {'id', 'size', 'mtime_ns', 'url', 'title', 'terms'}
+        if use_cache and not rebuild:
+            try:
+                with open(self.state_path, 'r', encoding='utf-8') as f:
+                    state = json.load(f)
+                if state.get('version') == INDEX_VERSION:
+                    self.pages = state['pages']
+            except (OSError, ValueError):
+                pass
+
+    def refresh(self):
+        """Re-tokenize new and changed pages, drop deleted ones. Returns (changed, removed)."""
+        current = {}
+        for file_path in find_html_files(self.root):
+            rel_path = file_path.relative_to(self.root).as_posix()
+            if is_indexed(rel_path):
+                try:
+                    current[rel_path] = os.stat(file_path)
+                except OSError:
+                    continue
+
+        removed = [rel_path for rel_path in self.pages if rel_path not in current]
+        for rel_path in removed:
+            del self.pages[rel_path]
+
+        changed = [rel_path for rel_path, stat in current.items()
+                   if rel_path not in self.pages
+                   or (self.pages[rel_path]['size'], self.pages[rel_path]['mtime_ns'])
+                   != (stat.st_size, stat.st_mtime_ns)]
+        corpus = (load_corpus(self.root, [self.root / rel_path for rel_path in changed], use_cache=self.use_cache)
+                  if changed else {})
+
+        # Existing pages keep their ids so unchanged shards stay byte-identical
+        used = {page['id'] for page in self.pages.values()}
+        free = (n for n in range(len(used) + len(corpus) + 1) if n not in used)
+        for rel_path in sorted(corpus):
+            record, stat = corpus[rel_path], current[rel_path]
+            page = self.pages.get(rel_path)
+            self.pages[rel_path] = {
+                'id': page['id'] if page else next(free),
+                'size': stat.st_size,
+                'mtime_ns': stat.st_mtime_ns,
+                'url': page_url(rel_path, self.clean_urls),
+                'title': record['title'] or rel_path,
+                'terms': page_terms(record),
+            }
+        return sorted(corpus), removed
+
+    def shards(self):
+        """
+        {prefix: {term: [doc id delta, weight, ...]}}: postings sorted by
+        doc id and delta-encoded, which keeps the numbers small for gzip.
+        """
+        postings = {}
+        for page in sorted(self.pages.values(), key=lambda page: page['id']):
+            doc = page['id']
+            for term, weight in page['terms'].items():
+                postings.setdefault(term[:PREFIX_LENGTH], {}).setdefault(term, []).append((doc, weight))
+
+        shards = {}
+        for prefix, terms in postings.items():
+            shard = shards[prefix] = {}
+            for term, entries in terms.items():
+                flat, last = [], 0
+                for doc, weight in entries:
+                    flat += (doc - last, weight)
+                    last = doc
+                shard[term] = flat
+        return shards
+
+    def write(self):
+        """Write changed shards, the document table and the manifest. Returns files written."""
+        self.out_dir.mkdir(exist_ok=True)
+        written = 0
+
+        def emit(name_prefix, data):
+            nonlocal written
+            payload = encode(data)
+            name = content_name(name_prefix, payload)
+            target = self.out_dir / name
+            if not target.exists():
+                tmp_path = target.with_name(name + '.tmp')
+                tmp_path.write_bytes(payload)
+                os.replace(tmp_path, target)
+                written += 1
+            return name
+
+        docs = [None] * (max((page['id'] for page in self.pages.values()), default=-1) + 1)
+        for page in self.pages.values():
+            docs[page['id']] = [page['url'], page['title']]
+        manifest = {
+            'version': INDEX_VERSION,
+            'prefix': PREFIX_LENGTH,
+            'stop': sorted(STOP_WORDS),
+            'docs': emit('docs', docs),
+            'shards': {prefix: emit(prefix, shard) for prefix, shard in sorted(self.shards().items())},
+        }
+        files = {manifest['docs'], *manifest['shards'].values()}
+
+        manifest_path = self.out_dir / 'manifest.json'
+        payload = json.dumps(manifest, indent=1, sort_keys=True).encode('utf-8')
+        try:
+            unchanged = manifest_path.read_bytes() == payload
+        except OSError:
+            unchanged = False
+        if not unchanged:
+            tmp_path = manifest_path.with_name('manifest.json.tmp')
+            tmp_path.write_bytes(payload)
+            os.replace(tmp_path, manifest_path)
+            written += 1
+
+        # Shards from earlier builds that nothing references any more
+        for path in self.out_dir.glob('*.json'):
+            if path.name != 'manifest.json' and path.name not in files:
+                path.unlink()
+        return written
+
+    def save_state(self):
+        if not self.use_cache:
+            return
+        self.state_path.parent.mkdir(exist_ok=True)
+        with open(self.state_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': INDEX_VERSION, 'pages': self.pages}, f,
+                      ensure_ascii=False, separators=(',', ':'))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the static site search index')
+    parser.add_argument('--rebuild', action='store_true', help='Ignore saved state and re-tokenize every page')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Rebuild without reading or writing .cache/ (for the deployment build)')
+    args = parser.parse_args()
+
+    builder = SearchIndexBuilder(Path(__file__).parent, rebuild=args.rebuild, use_cache=not args.no_cache)
+    changed, removed = builder.refresh()
+    written = builder.write()
+    builder.save_state()
+
+    sizes = [path.stat().st_size for path in builder.out_dir.glob('*.json') if path.name != 'manifest.json']
+    terms = len({term for page in builder.pages.values() for term in page['terms']})
+    print(f"🔎 Search index: {len(builder.pages)} pages, {terms} terms, {len(sizes) - 1} shards")
+    print(f"   {len(changed)} page(s) re-indexed, {len(removed)} removed, {written} file(s) written")
+    if sizes:
+        print(f"   largest file {max(sizes) / 1024:.1f} KB, total {sum(sizes) / 1024:.1f} KB (raw JSON)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Sitemap Reconciliation for Bitcoin Sovereign Academy
+Streams sitemap.xml with iterparse, checks every <loc> against the
+in-memory route table, lists reachable pages the sitemap leaves out, and
+refreshes <lastmod> only for entries whose file content changed.
+
+Usage:
+    python3 check-links.py --sitemap
+    python3 check-links.py --sitemap --update-lastmod
+"""
+
+import hashlib
+import json
+import os
+import re
+from datetime import datetime, timezone
+from pathlib import Path
+from urllib.parse import urlsplit
+from xml.etree.ElementTree import iterparse
+
+from site_corpus import CACHE_DIR
+
+SITE_HOSTS = {'bitcoinsovereign.academy', 'www.bitcoinsovereign.academy'}
+SITEMAP_NS = '{http://www.sitemaps.org/schemas/sitemap/0.9}'
+# Content hash per <loc> as of the last --update-lastmod run
+STATE_FILE = 'sitemap-hashes.json'
+
+URL_BLOCK = re.compile(r'<url>.*?</url>', re.DOTALL)
+LOC_TAG = re.compile(r'<loc>\s*(.*?)\s*</loc>', re.DOTALL)
+LASTMOD_TAG = re.compile(r'(<lastmod>)(.*?)(</lastmod>)', re.DOTALL)
+
+
+def iter_sitemap(sitemap_path):
+    """Yield (loc, lastmod) per <url> without building the whole tree"""
+    for _, elem in iterparse(sitemap_path, events=('end',)):
+        if elem.tag == SITEMAP_NS + 'url':
+            loc = elem.findtext(SITEMAP_NS + 'loc', '').strip()
+            lastmod = elem.findtext(SITEMAP_NS + 'lastmod')
+            yield loc, lastmod.strip() if lastmod else None
+            elem.clear()
+
+
+def loc_to_path(loc):
+    """Site path for a sitemap URL on this site, or None for another host"""
+    parts = urlsplit(loc)
+    if parts.hostname not in SITE_HOSTS:
+        return None
+    return parts.path or '/'
+
+
+def reconcile_sitemap(sitemap_path, routes, reachable_files):
+    """
+    Compare the sitemap with the site. Returns a dict with
+    'entries' (count), 'missing' [(loc, target)] for locs that do not
+    resolve, 'foreign' [loc] on other hosts, 'duplicates' [loc] that
+    serve an already listed file, and 'unlisted' reachable page files.
+    """
+    listed = set()
+    result = {'entries': 0, 'missing': [], 'foreign': [], 'duplicates': [], 'unlisted': []}
+
+    for loc, _ in iter_sitemap(sitemap_path):
+        result['entries'] += 1
+        path = loc_to_path(loc)
+        if path is None:
+            result['foreign'].append(loc)
+            continue
+        exists, target, _ = routes.lookup(path)
+        if not exists:
+            result['missing'].append((loc, target))
+            continue
+        served = routes.site.served_file(target)
+        if served in listed:
+            result['duplicates'].append(loc)
+        elif served:
+            listed.add(served)
+
+    result['unlisted'] = sorted(f for f in reachable_files if f not in listed)
+    return result
+
+
+def file_digest(file_path):
+    with open(file_path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def format_lastmod(timestamp):
+    """W3C datetime in the sitemap's existing style: 2026-02-03T23:00:00+00:00"""
+    return datetime.fromtimestamp(timestamp, timezone.utc).replace(microsecond=0).isoformat()
+
+
+def update_lastmod(sitemap_path, routes, state_path=None):
+    """
+    Rewrite <lastmod> for entries whose served file changed since the last
+    run, using the file's mtime. The first run only records hashes. Other
+    entries are left byte-for-byte alone, and the file is replaced
+    atomically only when something changed. Returns the updated locs.
+    """
+    sitemap_path = Path(sitemap_path)
+    if state_path is None:
+        state_path = routes.site.root / CACHE_DIR / STATE_FILE
+    state_path = Path(state_path)
+    try:
+        with open(state_path, 'r', encoding='utf-8') as f:
+            hashes = json.load(f)
+    except (OSError, ValueError):
+        hashes = {}
+
+    # First pass (streaming): which locs point at changed files
+    changed = {}
+    for loc, _ in iter_sitemap(sitemap_path):
+        path = loc_to_path(loc)
+        if path is None:
+            continue
+        exists, target, _ = routes.lookup(path)
+        served = routes.site.served_file(target) if exists else None
+        if not served:
+            continue
+        file_path = routes.site.root / served.lstrip('/')
+        digest = file_digest(file_path)
+        if loc in hashes and hashes[loc] != digest:
+            changed[loc] = format_lastmod(os.stat(file_path).st_mtime)
+        hashes[loc] = digest
+
+    if changed:
+        text = sitemap_path.read_text(encoding='utf-8')
+
+        def rewrite(match):
+            block = match.group(0)
+            loc = LOC_TAG.search(block)
+            if not loc or loc.group(1) not in changed:
+                return block
+            lastmod = changed[loc.group(1)]
+            if not LASTMOD_TAG.search(block):
+                return block[:loc.end()] + f'\n    <lastmod>{lastmod}</lastmod>' + block[loc.end():]
+            return LASTMOD_TAG.sub(lambda m: m.group(1) + lastmod + m.group(3), block, count=1)
+
+        tmp_path = sitemap_path.with_name(sitemap_path.name + '.tmp')
+        tmp_path.write_text(URL_BLOCK.sub(rewrite, text), encoding='utf-8')
+        os.replace(tmp_path, sitemap_path)
+
+    state_path.parent.mkdir(exist_ok=True)
+    with open(state_path, 'w', encoding='utf-8') as f:
+        json.dump(hashes, f, indent=0, sort_keys=True)
+    return sorted(changed)
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Multi-Pattern Term Matcher for Bitcoin Sovereign Academy
+Finds every occurrence of many named regex terms in one scan of a text,
+instead of one re.findall pass per term.
+
+The literal prefixes of all terms ('bitcoin', 'private', 'sha-256', ...)
+are compiled into one trie-shaped regex that locates candidate positions in
+a single sweep. At each candidate only the terms sharing that prefix are
+tried, so counts and positions are exactly what re.finditer reports for
+each term on its own, overlapping terms included, while the sweep itself
+grows with the size of the prefix trie rather than the number of terms.
+"""
+
+import re
+from collections import defaultdict
+
+# Characters that make the preceding character optional or repeated
+QUANTIFIERS = '?*{'
+
+
+def split_alternatives(pattern):
+    """Split a regex at its top-level '|' characters"""
+    parts, depth, start, i = [], 0, 0, 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == '\\':
+            i += 2
+            continue
+        if char in '([':
+            depth += 1
+        elif char in ')]':
+            depth -= 1
+        elif char == '|' and not depth:
+            parts.append(pattern[start:i])
+            start = i + 1
+        i += 1
+    parts.append(pattern[start:])
+    return parts
+
+
+def literal_prefix(alternative):
+    """
+    The literal text every match of a regex alternative starts with
+    (leading \\b assertions skipped); '' when it starts with anything else.
+    """
+    while alternative.startswith(r'\b'):
+        alternative = alternative[2:]
+    prefix, i = [], 0
+    while i < len(alternative):
+        char = alternative[i]
+        if char == '\\' and alternative[i + 1:i + 2] and not alternative[i + 1].isalnum():
+            char, step = alternative[i + 1], 2
+        elif char.isalnum() or char in ' -':
+            step = 1
+        else:
+            break
+        if alternative[i + step:i + step + 1] in tuple(QUANTIFIERS):
+            break
+        prefix.append(char)
+        i += step
+    return ''.join(prefix)
+
+
+def trie_pattern(words):
+    """Regex matching any of words, factored as a trie ('ha(?:lving|sh)')"""
+    root = {}
+    for word in words:
+        node = root
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def emit(node):
+        if '' in node:
+            return ''  # a shorter word already ends here
+        branches = [re.escape(char) + emit(child) for char, child in sorted(node.items())]
+        return branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+
+    return emit(root)
+
+
+class TermMatcher:
+    """
+    Compiled set of named term patterns.
+
+    Names may share a pattern; identical patterns are matched once and the
+    hits reported under every name.
+    """
+
+    def __init__(self, patterns, flags=re.IGNORECASE):
+        self.names = list(patterns)
+        self.fold = bool(flags & re.IGNORECASE)
+        distinct = {}
+        for name, pattern in patterns.items():
+            distinct.setdefault(pattern, []).append(name)
+        self.regexes = [re.compile(pattern, flags) for pattern in distinct]
+        self.owners = list(distinct.values())
+
+        # Candidate patterns per literal prefix, bucketed by first character
+        self.by_char = defaultdict(list)
+        prefixes = set()
+        for i, pattern in enumerate(distinct):
+            for alternative in split_alternatives(pattern):
+                prefix = literal_prefix(alternative)
+                if not prefix:
+                    prefixes = None
+                    break
+                prefix = prefix.lower() if self.fold else prefix
+                prefixes.add(prefix)
+                self.by_char[prefix[0]].append((prefix, i))
+            if prefixes is None:
+                break
+
+        if prefixes is None:
+            # A term without a literal start: every pattern is tried wherever
+            # any of them matches
+            self.scanner = re.compile('(?=' + '|'.join(f'(?:{p})' for p in distinct) + ')', flags)
+            self.by_char = None
+        else:
+            self.scanner = re.compile('(?=' + trie_pattern(prefixes) + ')', flags)
+            self.width = max(map(len, prefixes))
+
+    def candidates(self, text, start):
+        """Indexes of the patterns whose literal prefix occurs at start"""
+        if self.by_char is None:
+            return range(len(self.regexes))
+        head = text[start:start + self.width]
+        if self.fold:
+            head = head.lower()
+        return sorted({i for prefix, i in self.by_char.get(head[0], ()) if head.startswith(prefix)})
+
+    def scan(self, text):
+        """{name: [start offsets]} for every term, in text order"""
+        hits = {name: [] for name in self.names}
+        ends = [0] * len(self.regexes)
+        for candidate in self.scanner.finditer(text):
+            start = candidate.start()
+            for i in self.candidates(text, start):
+                if start < ends[i]:
+                    continue  # inside this term's previous match
+                found = self.regexes[i].match(text, start)
+                if found:
+                    ends[i] = max(found.end(), start + 1)
+                    for name in self.owners[i]:
+                        hits[name].append(start)
+        return hits
+
+    def counts(self, text):
+        """{name: number of occurrences}"""
+        return {name: len(starts) for name, starts in self.scan(text).items()}
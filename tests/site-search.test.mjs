@@ -0,0 +1,97 @@
+/* Unit tests for js/site-search.js — the client for the static index that
+   site_search.py builds (manifest, content-hashed shards, document table).
+   Run: node --test tests/site-search.test.mjs */
+import test from 'node:test';
+import assert from 'node:assert/strict';
+import fs from 'node:fs';
+import vm from 'node:vm';
+
+const SRC = fs.readFileSync(new URL('../js/site-search.js', import.meta.url), 'utf8');
+
+// A tiny index in site_search.py's format: postings are [doc id delta, weight, ...]
+const INDEX = {
+  '/search-index/manifest.json': {
+    version: 1,
+    prefix: 2,
+    stop: ['the', 'of'],
+    docs: 'docs.aaaa.json',
+    shards: { pr: 'pr.bbbb.json', ke: 'ke.cccc.json', ut: 'ut.dddd.json' }
+  },
+  '/search-index/docs.aaaa.json': [
+    ['/paths/curious/stage-2/module-1', 'Keys'],
+    ['/paths/builder/stage-1/module-2', 'UTXOs'],
+    ['/glossary', 'Glossary']
+  ],
+  '/search-index/pr.bbbb.json': { private: [0, 5, 2, 1], privacy: [1, 2] },
+  '/search-index/ke.cccc.json': { key: [0, 4, 2, 1], keys: [0, 1] },
+  '/search-index/ut.dddd.json': { utxo: [1, 3], utxos: [1, 1] }
+};
+
+// Values built inside the vm context have that realm's prototypes
+const plain = (value) => JSON.parse(JSON.stringify(value));
+
+function boot(files = INDEX) {
+  const fetched = [];
+  const window = {};
+  const context = vm.createContext({
+    window,
+    fetch: async (url) => {
+      fetched.push(url);
+      const body = files[url];
+      return { ok: body !== undefined, status: body === undefined ? 404 : 200, json: async () => body };
+    }
+  });
+  vm.runInContext(SRC, context);
+  return { search: window.BSASearch.search, fetched };
+}
+
+test('ranks documents matching every query word', async () => {
+  const { search } = boot();
+  const results = await search('private key');
+  assert.deepEqual(plain(results.map(r => r.url)), ['/paths/curious/stage-2/module-1', '/glossary']);
+  // doc 0: private 5*2 + key 4*2 + keys 1; doc 2: private 1*2 + key 1*2
+  assert.equal(results[0].score, 19);
+  assert.equal(results[1].score, 4);
+  assert.equal(results[0].title, 'Keys');
+});
+
+test('prefix matches score below exact ones', async () => {
+  const { search } = boot();
+  const results = await search('priv');
+  assert.deepEqual(plain(results.map(r => [r.url, r.score])), [
+    ['/paths/curious/stage-2/module-1', 5],
+    ['/paths/builder/stage-1/module-2', 2],
+    ['/glossary', 1]
+  ]);
+});
+
+test('fetches only the manifest and the shards the query needs', async () => {
+  const { search, fetched } = boot();
+  await search('UTXO');
+  assert.deepEqual(fetched, ['/search-index/manifest.json', '/search-index/ut.dddd.json',
+                             '/search-index/docs.aaaa.json']);
+  await search('utxos');
+  assert.equal(fetched.length, 3, 'manifest, shard and docs are reused');
+});
+
+test('stop words, short tokens and unknown prefixes return nothing', async () => {
+  const { search } = boot();
+  assert.deepEqual(plain(await search('the of a')), []);
+  assert.deepEqual(plain(await search('zzz')), []);
+});
+
+test('accents are folded like the Python tokenizer', async () => {
+  const { search } = boot();
+  const results = await search('Prívate');
+  assert.equal(results[0].url, '/paths/curious/stage-2/module-1');
+});
+
+test('a missing index rejects and is retried on the next search', async () => {
+  const files = {};
+  const { search, fetched } = boot(files);
+  await assert.rejects(search('key'), /Search index unavailable/);
+  Object.assign(files, INDEX);
+  const results = await search('key');
+  assert.equal(results.length, 2);
+  assert.equal(fetched.filter(url => url.endsWith('manifest.json')).length, 2);
+});
@@ -0,0 +1,23 @@
+"""Tests for concept_order.py module ordering on the real curriculum.
+Run: python3 -m pytest tests/test_concept_order.py"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from concept_order import path_introductions  # noqa: E402
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_curious_modules_follow_the_course_sequence():
+    names, texts = path_introductions(ROOT, 'curious')
+    assert names[:4] == ['stage-1/module-1.html', 'stage-1/module-2.html',
+                         'stage-1/module-2-5.html', 'stage-1/module-3.html']
+    assert len(names) == len(texts)
+
+
+def test_translations_are_not_counted_as_modules():
+    names, _ = path_introductions(ROOT, 'curious')
+    assert not [name for name in names if '/es/' in name]
+
@@ -0,0 +1,149 @@
+"""Tests for external_links.py against a local stand-in HTTP server.
+Run: python3 -m pytest tests/test_external_links.py"""
+import sys
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from external_links import ExternalLinkChecker  # noqa: E402
+
+
+class Handler(BaseHTTPRequestHandler):
+    """
+    Keep-alive test server. Routes by path prefix:
+        /ok, /caf%C3%A9   200
+        /no-head          405 on HEAD, 200 on GET
+        /no-head-501      501 on HEAD, 200 on GET
+        /flaky            503 on the first request, 200 afterwards
+        anything else     404
+    """
+    protocol_version = 'HTTP/1.1'
+    seen = []            # (method, path) per request
+    connections = 0      # one handler instance per TCP connection
+    hits = Counter()
+
+    def setup(self):
+        type(self).connections += 1
+        super().setup()
+
+    def status_for(self, method):
+        path = self.path
+        self.seen.append((method, path))
+        self.hits[path] += 1
+        if path.startswith(('/ok', '/caf%C3%A9')):
+            return 200
+        if path.startswith('/no-head-501'):
+            return 501 if method == 'HEAD' else 200
+        if path.startswith('/no-head'):
+            return 405 if method == 'HEAD' else 200
+        if path.startswith('/flaky'):
+            return 503 if self.hits[path] == 1 else 200
+        return 404
+
+    def respond(self, method):
+        self.send_response(self.status_for(method))
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def do_HEAD(self):
+        self.respond('HEAD')
+
+    def do_GET(self):
+        self.respond('GET')
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    Handler.seen = []
+    Handler.connections = 0
+    Handler.hits = Counter()
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{httpd.server_port}'
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_non_ascii_path_is_percent_encoded(server):
+    checker = ExternalLinkChecker(retries=0)
+    results = checker.check_urls([f'{server}/café?q=ü', f'{server}/ok'])
+    assert results[f'{server}/café?q=ü']['ok']
+    assert results[f'{server}/ok']['ok']
+    assert ('HEAD', '/caf%C3%A9?q=%C3%BC') in Handler.seen
+
+
+def test_unencodable_url_fails_alone(server):
+    checker = ExternalLinkChecker(retries=0)
+    bad = 'http://' + 'x' * 64 + '.example/'   # label too long for IDNA
+    results = checker.check_urls([bad, f'{server}/ok'])
+    assert not results[bad]['ok']
+    assert results[bad]['error'].startswith('UnicodeError')
+    assert results[f'{server}/ok']['ok']
+
+
+def test_cache_skips_fresh_results(server, tmp_path):
+    cache_path = tmp_path / 'links.sqlite3'
+    urls = [f'{server}/ok', f'{server}/missing']
+    first = ExternalLinkChecker(cache_path=cache_path, retries=0).check_urls(urls)
+    assert [r['cached'] for r in first.values()] == [False, False]
+    requests = len(Handler.seen)
+
+    checker = ExternalLinkChecker(cache_path=cache_path, retries=0)
+    second = checker.check_urls(urls)
+    assert len(Handler.seen) == requests, 'fresh entries make no requests'
+    assert checker.stats['cached'] == 2 and checker.stats['requests'] == 0
+    assert [r['cached'] for r in second.values()] == [True, True]
+    assert second[f'{server}/ok']['ok'] and second[f'{server}/missing']['status'] == 404
+
+
+def test_cache_reprobes_expired_results(server, tmp_path):
+    cache_path = tmp_path / 'links.sqlite3'
+    ExternalLinkChecker(cache_path=cache_path, retries=0).check_urls([f'{server}/ok'])
+    requests = len(Handler.seen)
+
+    checker = ExternalLinkChecker(cache_path=cache_path, ttl=0, retries=0)
+    results = checker.check_urls([f'{server}/ok'])
+    assert len(Handler.seen) == requests + 1
+    assert checker.stats['probed'] == 1 and not results[f'{server}/ok']['cached']
+
+
+@pytest.mark.parametrize('path', ['/no-head', '/no-head-501'])
+def test_get_fallback_when_head_is_rejected(server, path):
+    results = ExternalLinkChecker(retries=0).check_urls([server + path])
+    assert results[server + path]['ok']
+    assert results[server + path]['status'] == 200
+    assert Handler.seen == [('HEAD', path), ('GET', path)]
+
+
+def test_retries_with_backoff(server):
+    checker = ExternalLinkChecker(retries=2, backoff=0.01)
+    results = checker.check_urls([f'{server}/flaky'])
+    assert results[f'{server}/flaky']['ok']
+    assert checker.stats['retries'] == 1
+    assert checker.stats['requests'] == 2
+    assert Handler.seen == [('HEAD', '/flaky'), ('HEAD', '/flaky')]
+
+
+def test_retries_stop_after_the_limit(server):
+    checker = ExternalLinkChecker(retries=2, backoff=0.01)
+    results = checker.check_urls([f'{server}/missing'])
+    assert results[f'{server}/missing']['status'] == 404
+    assert checker.stats['retries'] == 0, '404 is a final answer'
+
+
+def test_connections_are_reused_within_a_host_pool(server):
+    urls = [f'{server}/ok/{n}' for n in range(8)]
+    checker = ExternalLinkChecker(per_host=2, retries=0)
+    results = checker.check_urls(urls)
+    assert all(r['ok'] for r in results.values())
+    assert checker.stats['requests'] == 8
+    assert Handler.connections <= 2
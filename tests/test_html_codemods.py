@@ -0,0 +1,100 @@
+"""Tests for scripts/html_codemods.py's single-scan emoji replacement, against
+the sequential per-emoji regex passes it replaced (kept here as the oracle).
+Run: python3 -m pytest tests/test_html_codemods.py"""
+import random
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from html_codemods import EMOJI_MAP, replace_emojis  # noqa: E402
+
+
+def sequential_replace_emojis(content):
+    """The original implementation: four regex passes per emoji, in EMOJI_MAP order"""
+    replaced = 0
+    for emoji, icon_name in EMOJI_MAP.items():
+        if emoji in content:
+            replaced += content.count(emoji)
+            pattern1 = re.compile(rf'(<(?:span|li|p|h[1-6]|a|div)[^>]*>)\s*{re.escape(emoji)}\s+',
+                                  re.MULTILINE)
+            content = pattern1.sub(rf'\1<span data-icon="{icon_name}"></span> ', content)
+            pattern2 = re.compile(rf'>{re.escape(emoji)}\s+([^<]+)', re.MULTILINE)
+            content = pattern2.sub(rf'><span data-icon="{icon_name}"></span> \1', content)
+            pattern3 = re.compile(rf'\s{re.escape(emoji)}\s', re.MULTILINE)
+            content = pattern3.sub(rf' <span data-icon="{icon_name}"></span> ', content)
+            pattern4 = re.compile(rf'{re.escape(emoji)}:', re.MULTILINE)
+            content = pattern4.sub(rf'<span data-icon="{icon_name}"></span>:', content)
+    return content, replaced
+
+
+EDGE_CASES = [
+    # Emoji at the start of an element, with and without leading whitespace
+    '<span>🎮 Play</span>',
+    '<h2 class="title">\n  📚 Reading list</h2>',
+    '<li>⏱️ Timer</li>',
+    # Emoji inside attributes
+    '<div title="🎮 game" data-x="🔐:">text</div>',
+    '<a href="#" aria-label=" 💡 ">tip</a>',
+    '<img alt="🏛️">',
+    # Adjacent emoji, and the same emoji twice
+    '<p>🎮🎯 Two</p>',
+    '<p>🎮 🎯 Spaced</p>',
+    '<p>🔐🔒 Locks</p>',
+    ' 🎮  🎮 ',
+    '<p>⚡⚡ Fast</p>',
+    # Emoji followed by text, colons and punctuation
+    '<p>Press 🎮 to start</p>',
+    '<b>🎯: Goal</b>',
+    '🎯:🎯:',
+    '<td>💰,</td> 💰.',
+    '>🧠\tThink<',
+    # Emoji that other emoji's replacements create context for
+    '<p>🎮 🎮 🎮</p>',
+    '<div> 🔄 <span>🎁 gift</span> 🔄:</div>',
+    # Already wrapped in a data-icon span
+    '<span data-icon="game"></span> Play 🎮',
+    '<p><span data-icon="lock"></span> 🔐 Secure</p>',
+    # Variation selectors and emoji outside the map
+    '<p>🛡 shield without selector</p>',
+    '<p>🛡️ Shield</p>',
+    '<p>🚀 Not mapped 🎮</p>',
+    # No emoji at all
+    '<p>plain text</p>',
+    '',
+]
+
+
+@pytest.mark.parametrize('content', EDGE_CASES)
+def test_matches_sequential_passes_on_edge_cases(content):
+    assert replace_emojis(content) == sequential_replace_emojis(content)
+
+
+def random_page(rng):
+    emojis = list(EMOJI_MAP) + ['🚀', '️', '🛡']
+    pieces = emojis * 3 + [
+        ' ', ' ', '  ', '\n', '\t', ':', ',', '.', 'text', 'Go', '<', '>',
+        '<p>', '</p>', '<span>', '</span>', '<div class="card">', '<h3 id="x">',
+        '<li>', '<a href="/x">', '<b>', '<td>', ' title="', '"',
+        '<span data-icon="game"></span>',
+    ]
+    return ''.join(rng.choice(pieces) for _ in range(rng.randint(0, 40)))
+
+
+def test_matches_sequential_passes_on_random_pages():
+    rng = random.Random(20240917)
+    for _ in range(20000):
+        content = random_page(rng)
+        assert replace_emojis(content) == sequential_replace_emojis(content), repr(content)
+
+
+def test_matches_sequential_passes_on_site_pages():
+    root = Path(__file__).resolve().parent.parent
+    pages = sorted(root.glob('paths/**/*.html')) + sorted(root.glob('interactive-demos/**/*.html'))
+    assert pages
+    for page in pages:
+        content = page.read_text(encoding='utf-8')
+        assert replace_emojis(content) == sequential_replace_emojis(content), page